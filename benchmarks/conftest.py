@@ -0,0 +1,66 @@
+import pytest
+
+from msfabric_devops import FabricClient
+
+from tests.fabric_simulator import FabricSimulator
+from tests.conftest import UNLIMITED
+from tests.samples import make_repository
+
+# Simulated service: seconds per request and per long-running operation
+LATENCY = 0.01
+LRO_SECONDS = 0.1
+# Requests per second accepted by the throttling simulator before 429s
+THROTTLED_RATE = 20.0
+
+
+def new_client(simulator: FabricSimulator, rate_limits: dict | None = None) -> FabricClient:
+    client = FabricClient(item_cache_ttl=0, workspace_cache_ttl=0, pool_maxsize=32, rate_limits=rate_limits)
+    return simulator.attach(client)
+
+
+@pytest.fixture
+def simulator():
+    """A simulator with service-like latency and operation durations."""
+    with FabricSimulator(latency=LATENCY, lro_seconds=LRO_SECONDS, poll_after=LRO_SECONDS / 2) as simulator:
+        yield simulator
+
+
+@pytest.fixture
+def bare_simulator():
+    """A simulator without added latency, so that client-side costs dominate."""
+    with FabricSimulator(poll_after=0) as simulator:
+        yield simulator
+
+
+@pytest.fixture
+def client(simulator):
+    """A client whose rate limiter never delays requests, so the benchmarks measure the client."""
+    client = new_client(simulator, UNLIMITED)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def throttled_simulator():
+    """A simulator answering 429 with ``Retry-After`` above ``THROTTLED_RATE`` requests per second."""
+    with FabricSimulator(
+        latency=LATENCY,
+        lro_seconds=LRO_SECONDS,
+        poll_after=LRO_SECONDS / 2,
+        rate_limit=(THROTTLED_RATE, THROTTLED_RATE),
+    ) as simulator:
+        yield simulator
+
+
+@pytest.fixture
+def throttled_client(throttled_simulator):
+    """A client with the default rate limits."""
+    client = new_client(throttled_simulator)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def repository(tmp_path_factory):
+    """8 semantic models of 20 tables of 30 columns, each with 3 reports bound to it."""
+    return make_repository(tmp_path_factory.mktemp("repository"), models=8, reports_per_model=3, tables=20, columns=30)
@@ -0,0 +1,94 @@
+"""Client throughput and latency against the local Fabric simulator.
+
+Runs FabricClient end to end (HTTP session, rate limiter, retries, LRO
+polling, caches) with no cloud access. Save a run, then compare later runs
+against it; ``--benchmark-compare-fail`` fails the run on a regression:
+
+    pytest benchmarks --benchmark-autosave
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:20%
+"""
+from msfabric_devops import FabricClient
+
+from tests.samples import make_model
+
+
+def _deploy_to_new_workspace(client: FabricClient, repository, prefix: str):
+    workspace_ids = iter(range(1_000_000))
+
+    def setup():
+        workspace_id = client.create_workspace(f"{prefix}-{next(workspace_ids)}")["id"]
+        return (workspace_id, str(repository)), {"max_workers": 8}
+
+    return setup
+
+
+def test_get_items(benchmark, client, simulator):
+    """Listing a 250-item workspace (3 pages), cache disabled."""
+    workspace_id = client.create_workspace("bench-items")["id"]
+    # Seeded directly, as a workspace populated earlier
+    for i in range(250):
+        simulator.state.items[f"seed-{i}"] = {
+            "id": f"seed-{i}", "type": "Report", "displayName": f"Seed {i}", "workspaceId": workspace_id,
+        }
+
+    items = benchmark(client.get_items, workspace_id)
+
+    assert len(items) == 250
+
+
+def test_import_item(benchmark, client, tmp_path):
+    """Creating, then updating, a 20-table semantic model."""
+    workspace_id = client.create_workspace("bench-import")["id"]
+    model = make_model(tmp_path, "Bench", tables=20, columns=30)
+
+    result = benchmark(client.import_item, workspace_id, str(model))
+
+    assert result["displayName"] == "Bench"
+
+
+def test_get_item_definition(benchmark, client, tmp_path):
+    workspace_id = client.create_workspace("bench-export")["id"]
+    model = make_model(tmp_path, "Bench", tables=20, columns=30)
+    model_id = client.import_item(workspace_id, str(model))["id"]
+
+    definition = benchmark(client.get_item_definition, workspace_id, model_id)
+
+    assert len(definition) == 23
+
+
+def test_deploy_folder(benchmark, client, repository):
+    """Deploying 8 models and their 24 reports to an empty workspace."""
+    results = benchmark.pedantic(
+        client.deploy_folder,
+        setup=_deploy_to_new_workspace(client, repository, "bench-deploy"),
+        rounds=3,
+    )
+
+    assert all(result["status"] == "deployed" for result in results.values())
+    benchmark.extra_info["items"] = len(results)
+
+
+def test_deploy_folder_throttled(benchmark, throttled_client, throttled_simulator, repository):
+    """The same deployment against a simulator answering 429s, with the default rate limits."""
+    results = benchmark.pedantic(
+        throttled_client.deploy_folder,
+        setup=_deploy_to_new_workspace(throttled_client, repository, "bench-throttled"),
+        rounds=1,
+    )
+
+    assert all(result["status"] == "deployed" for result in results.values())
+    benchmark.extra_info["items"] = len(results)
+    benchmark.extra_info["throttled"] = throttled_simulator.state.throttled
+
+
+def test_scan_drift(benchmark, client, repository):
+    """Comparing the repository with 5 workspaces it was deployed to (one operation per item)."""
+    workspace_ids = []
+    for i in range(5):
+        workspace_ids.append(client.create_workspace(f"bench-drift-{i}")["id"])
+        client.deploy_folder(workspace_ids[-1], str(repository), max_workers=8)
+
+    report = benchmark.pedantic(client.scan_drift, args=(workspace_ids, str(repository)), rounds=3)
+
+    assert report["summary"]["drifted"] == 0
+    benchmark.extra_info["items"] = sum(report["summary"]["items"].values())
@@ -0,0 +1,92 @@
+"""Client work that needs no service: building import parts and importing the package.
+
+Import times are measured in a fresh interpreter per round; the recorded
+``import_seconds`` excludes the interpreter startup that dominates the
+round time.
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from msfabric_devops import items
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+FILES = 1000
+
+
+def make_pbip_folder(root: Path, files: int) -> Path:
+    """A model of *files* parts: table files, and a larger binary resource every 10th file."""
+    model = root / "Synthetic.SemanticModel"
+    tables = model / "definition" / "tables"
+    resources = model / "StaticResources"
+    tables.mkdir(parents=True)
+    resources.mkdir(parents=True)
+    (model / "definition.pbism").write_text('{"version": "4.0"}', encoding="utf-8")
+    column = "\n".join(f"\tcolumn Col{c}\n\t\tdataType: string\n" for c in range(40))
+    for i in range(files):
+        if i % 10 == 0:
+            (resources / f"image_{i}.png").write_bytes(os.urandom(64 * 1024))
+        else:
+            (tables / f"Table{i}.tmdl").write_text(f"table Table{i}\n{column}", encoding="utf-8")
+    return model
+
+
+@pytest.fixture(scope="module")
+def pbip_folder(tmp_path_factory):
+    return make_pbip_folder(tmp_path_factory.mktemp("pbip"), FILES)
+
+
+@pytest.mark.parametrize("max_workers", [1, None], ids=["sequential", "thread-pool"])
+def test_build_item_parts(benchmark, pbip_folder, max_workers):
+    """Reading and base64-encoding the parts of a 1,000-file folder."""
+    files = items.list_item_files(pbip_folder)
+
+    parts = benchmark(items.build_item_parts, pbip_folder, files, max_workers=max_workers)
+
+    assert parts == items.build_item_parts(pbip_folder, files, max_workers=1)
+    benchmark.extra_info["megabytes"] = sum(len(part["Payload"]) for part in parts) / 1024 / 1024
+
+
+def _time_import(statement: str) -> tuple[float, list[str]]:
+    probe = (
+        "import json, sys, time\n"
+        "started = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - started\n"
+        "print(json.dumps([elapsed, [m for m in ('requests', 'azure.identity') if m in sys.modules]]))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", probe],
+        env={**os.environ, "PYTHONPATH": str(SRC)},
+        check=True, capture_output=True, text=True,
+    ).stdout
+    elapsed, loaded = json.loads(output.strip().splitlines()[-1])
+    return elapsed, loaded
+
+
+@pytest.mark.parametrize("statement, offline", [
+    ("import msfabric_devops", True),
+    ("from msfabric_devops import set_semantic_model_parameters", True),
+    ("from msfabric_devops.tmdl import parse_tmdl", True),
+    ("from msfabric_devops import FabricClient", False),
+    ("from msfabric_devops import FabricClient; FabricClient()", False),
+])
+def test_import_time(benchmark, statement, offline):
+    """Startup cost of the package entry points."""
+    timings = []
+
+    def run():
+        elapsed, loaded = _time_import(statement)
+        timings.append(elapsed)
+        return loaded
+
+    loaded = benchmark.pedantic(run, rounds=5)
+
+    if offline:
+        assert not loaded
+    benchmark.extra_info["import_seconds"] = sorted(timings)[len(timings) // 2]
+    benchmark.extra_info["loaded"] = loaded
@@ -0,0 +1,91 @@
+"""Connection reuse, shared throttling and instrumentation overhead of ``FabricSession``.
+
+Each case sends plain workspace listings through ``invoke_fabric_api_request``
+to the simulator, so that the session, not the service, is measured.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from msfabric_devops import api
+from msfabric_devops.instrumentation import Instrumentation, MemorySink
+from msfabric_devops.throttling import RateLimiter
+
+from tests.fabric_simulator import FabricSimulator
+
+CALLS = 200
+# Requests per second the throttling simulator accepts; the limiter aims below it
+CAPACITY = 100.0
+
+
+def _list_workspaces(simulator: FabricSimulator, session, calls: int, threads: int) -> int:
+    """Send *calls* listings from *threads* threads and return the number that failed."""
+    failures = 0
+
+    def call(_):
+        nonlocal failures
+        try:
+            api.invoke_fabric_api_request("workspaces", token="bench", api_url=simulator.api_url, session=session)
+        except Exception:
+            failures += 1
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(call, range(calls)))
+    return failures
+
+
+@pytest.mark.parametrize("threads", [1, 8])
+@pytest.mark.parametrize("pooled", [False, True], ids=["no-session", "fabric-session"])
+def test_connections(benchmark, bare_simulator, pooled, threads):
+    """TCP connections opened per listing without a session and with a pooled ``FabricSession``."""
+    session = api.FabricSession(pool_maxsize=threads) if pooled else None
+    rounds = 3
+    try:
+        failures = benchmark.pedantic(_list_workspaces, args=(bare_simulator, session, CALLS, threads), rounds=rounds)
+    finally:
+        if session is not None:
+            session.close()
+
+    connections = len(bare_simulator.state.connections)
+    assert failures == 0
+    if pooled:
+        assert connections <= threads
+    benchmark.extra_info["connections_per_call"] = connections / (CALLS * rounds)
+
+
+@pytest.mark.parametrize("limited", [False, True], ids=["per-thread-sleep", "rate-limiter"])
+def test_throttled_listings(benchmark, limited):
+    """16 threads over a service accepting ``CAPACITY`` requests per second, with and without a shared budget."""
+    limiter = RateLimiter({"workspaces": (CAPACITY * 0.9, CAPACITY * 0.09)}) if limited else None
+    with FabricSimulator(rate_limit=(CAPACITY, CAPACITY / 10)) as simulator:
+        session = api.FabricSession(pool_maxsize=16, rate_limiter=limiter)
+        try:
+            failures = benchmark.pedantic(_list_workspaces, args=(simulator, session, CALLS * 3, 16), rounds=1)
+        finally:
+            session.close()
+
+    if limited:
+        assert failures == 0
+        benchmark.extra_info["wait_seconds"] = limiter.metrics()["wait_seconds"]
+    benchmark.extra_info["throttled"] = simulator.state.throttled
+    benchmark.extra_info["failures"] = failures
+
+
+@pytest.mark.parametrize("mode", ["none", "disabled", "enabled"])
+def test_instrumentation_overhead(benchmark, bare_simulator, mode):
+    """Per-request cost of no ``Instrumentation``, the disabled default and an enabled one with a sink."""
+    instrumentation = {
+        "none": None,
+        "disabled": Instrumentation(),
+        "enabled": Instrumentation(sinks=[MemorySink(maxlen=1000)]),
+    }[mode]
+    session = api.FabricSession(instrumentation=instrumentation)
+    try:
+        failures = benchmark.pedantic(_list_workspaces, args=(bare_simulator, session, CALLS, 1), rounds=3)
+    finally:
+        session.close()
+
+    assert failures == 0
+    if mode == "enabled":
+        # Every request that reached the simulator was recorded once
+        assert instrumentation.report()[0]["count"] == len(bare_simulator.state.log)
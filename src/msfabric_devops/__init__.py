@@ -1,39 +1,141 @@
-from importlib.metadata import version, PackageNotFoundError
+"""
+Python package to interact with Microsoft Fabric items.
 
-try:
-    __version__ = version("msfabric-devops")
-except PackageNotFoundError:
-    __version__ = "unknown"
+The public API is imported on first use (see ``__getattr__``), so
+``import msfabric_devops`` stays cheap and offline helpers such as
+``set_semantic_model_parameters`` never load ``requests`` or
+``azure-identity``.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-from .client import FabricClient
 from .exceptions import (
     FabricError,
     FabricAuthError,
     FabricNotFoundError,
     FabricThrottlingError,
 )
-from .authenticate import get_access_token
-from .items import (
-    get_items,
-    get_item_by_id,
-    get_items_by_name,
-    get_item_definition_by_id,
-    import_item,
-    delete_item_by_id,
-)
-from .semantic_models import set_semantic_model_parameters
-from .workspaces import (
-    get_workspaces,
-    get_workspace_by_id,
-    get_workspaces_by_name,
-    create_workspace,
-    delete_workspace,
-)
+
+if TYPE_CHECKING:
+    from .client import AsyncFabricClient, FabricClient
+    from .authenticate import TokenManager, get_access_token, get_token_manager
+    from .instrumentation import (
+        Instrumentation,
+        JsonLinesSink,
+        MemorySink,
+        OpenTelemetrySink,
+        RequestRecord,
+    )
+    from .retry import RetryPolicy
+    from .throttling import RateLimiter
+    from .deploy import DeploymentPlan, plan_deployment, execute_deployment
+    from .clone import clone_item, clone_items
+    from .drift import format_drift_report, scan_drift
+    from .definitions import DefinitionPart, ItemDefinition
+    from .items import (
+        iter_items,
+        get_items,
+        get_item_by_id,
+        get_items_by_name,
+        get_item_definition,
+        get_item_definition_by_id,
+        export_item_definition,
+        import_item,
+        import_definition,
+        delete_item_by_id,
+    )
+    from .semantic_models import set_semantic_model_parameters, set_semantic_model_parameters_many
+    from .snapshots import SnapshotStore, import_snapshot, snapshot_item, snapshot_workspace
+    from .templates import ModelTemplate, deploy_template
+    from .workspaces import (
+        iter_workspaces,
+        get_workspaces,
+        get_workspace_by_id,
+        get_workspaces_by_name,
+        create_workspace,
+        create_workspaces,
+        delete_workspace,
+        delete_workspaces,
+    )
+
+# Public name -> submodule defining it, imported on first access
+_LAZY_ATTRIBUTES = {
+    "FabricClient": "client",
+    "AsyncFabricClient": "client",
+    "get_access_token": "authenticate",
+    "get_token_manager": "authenticate",
+    "TokenManager": "authenticate",
+    "Instrumentation": "instrumentation",
+    "JsonLinesSink": "instrumentation",
+    "MemorySink": "instrumentation",
+    "OpenTelemetrySink": "instrumentation",
+    "RequestRecord": "instrumentation",
+    "RateLimiter": "throttling",
+    "RetryPolicy": "retry",
+    "DeploymentPlan": "deploy",
+    "plan_deployment": "deploy",
+    "execute_deployment": "deploy",
+    "clone_item": "clone",
+    "clone_items": "clone",
+    "scan_drift": "drift",
+    "format_drift_report": "drift",
+    "DefinitionPart": "definitions",
+    "ItemDefinition": "definitions",
+    "iter_items": "items",
+    "get_items": "items",
+    "get_item_by_id": "items",
+    "get_items_by_name": "items",
+    "get_item_definition": "items",
+    "get_item_definition_by_id": "items",
+    "export_item_definition": "items",
+    "import_item": "items",
+    "import_definition": "items",
+    "delete_item_by_id": "items",
+    "set_semantic_model_parameters": "semantic_models",
+    "set_semantic_model_parameters_many": "semantic_models",
+    "SnapshotStore": "snapshots",
+    "snapshot_item": "snapshots",
+    "snapshot_workspace": "snapshots",
+    "import_snapshot": "snapshots",
+    "ModelTemplate": "templates",
+    "deploy_template": "templates",
+    "iter_workspaces": "workspaces",
+    "get_workspaces": "workspaces",
+    "get_workspace_by_id": "workspaces",
+    "get_workspaces_by_name": "workspaces",
+    "create_workspace": "workspaces",
+    "delete_workspace": "workspaces",
+    "create_workspaces": "workspaces",
+    "delete_workspaces": "workspaces",
+}
+
+
+def __getattr__(name: str):
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            value = version("msfabric-devops")
+        except PackageNotFoundError:
+            value = "unknown"
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache it so that __getattr__ is not called again for this name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "__version__",
     # client
     "FabricClient",
+    "AsyncFabricClient",
     # exceptions
     "FabricError",
     "FabricAuthError",
@@ -41,19 +143,57 @@ __all__ = [
     "FabricThrottlingError",
     # authenticate
     "get_access_token",
+    "get_token_manager",
+    "TokenManager",
+    # transport
+    "Instrumentation",
+    "JsonLinesSink",
+    "MemorySink",
+    "OpenTelemetrySink",
+    "RequestRecord",
+    "RateLimiter",
+    "RetryPolicy",
+    # deploy
+    "DeploymentPlan",
+    "plan_deployment",
+    "execute_deployment",
+    # clone
+    "clone_item",
+    "clone_items",
+    # drift
+    "scan_drift",
+    "format_drift_report",
     # items
+    "DefinitionPart",
+    "ItemDefinition",
+    "iter_items",
     "get_items",
     "get_item_by_id",
     "get_items_by_name",
+    "get_item_definition",
     "get_item_definition_by_id",
+    "export_item_definition",
     "import_item",
+    "import_definition",
     "delete_item_by_id",
     # semantic models
     "set_semantic_model_parameters",
+    "set_semantic_model_parameters_many",
+    # snapshots
+    "SnapshotStore",
+    "snapshot_item",
+    "snapshot_workspace",
+    "import_snapshot",
+    # templates
+    "ModelTemplate",
+    "deploy_template",
     # workspaces
+    "iter_workspaces",
     "get_workspaces",
     "get_workspace_by_id",
     "get_workspaces_by_name",
     "create_workspace",
+    "create_workspaces",
     "delete_workspace",
+    "delete_workspaces",
 ]
@@ -1,23 +1,540 @@
+import base64
+import codecs
 import json
+import os
+import re
 import time
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+from urllib.parse import quote
 
 import requests
 
 from . import config
-from .exceptions import FabricError, FabricThrottlingError
+from .exceptions import FabricError, FabricNotFoundError, FabricThrottlingError
+from .instrumentation import Instrumentation, RequestRecord, TimedHTTPAdapter, connect_time, reset_connect_time
+from .retry import RetryPolicy, send_with_retry
+from .throttling import RateLimiter, endpoint_family, parse_retry_after
+
+if TYPE_CHECKING:
+    from .lro import LongRunningOperation, OperationPoller
+
+
+class FabricSession(requests.Session):
+    """
+    ``requests.Session`` with a keep-alive connection pool for the Fabric API.
+
+    Reusing one session across calls (including LRO polls) avoids opening a
+    new TCP + TLS connection for every request.
+
+    Parameters
+    ----------
+    pool_connections : int
+        Number of per-host connection pools to cache.
+    pool_maxsize : int
+        Maximum number of connections kept alive per host. Should be at least
+        the number of threads issuing requests concurrently.
+    pool_block : bool
+        When ``True``, wait for a free connection instead of opening a
+        throw-away one once *pool_maxsize* is reached.
+    rate_limiter : RateLimiter, optional
+        Budget shared by every request sent through the session, including
+        LRO polls. Throttled (429) requests are paused and sent again by
+        the limiter before the response reaches the caller.
+    retry_policy : RetryPolicy, optional
+        Policy for transient failures (connection errors, timeouts, 5xx)
+        of every request sent through the session, including LRO polls.
+    instrumentation : Instrumentation, optional
+        Receives a ``RequestRecord`` for every HTTP exchange, retry, 429
+        pause and operation wait while it is enabled.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = config.POOL_CONNECTIONS,
+        pool_maxsize: int = config.POOL_MAXSIZE,
+        pool_block: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        super().__init__()
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.instrumentation = instrumentation
+        adapter = TimedHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+        self.headers.update({
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        })
+
+    def request(self, method, url, *args, **kwargs):
+        instrumentation = self.instrumentation
+        on_retry = None
+        if instrumentation is not None and instrumentation.enabled:
+            def on_retry(attempt, delay, response, error):
+                instrumentation.event(
+                    "retry", method, url, delay,
+                    status=response.status_code if response is not None else None,
+                    attempt=attempt,
+                    reason=type(error).__name__ if error is not None else f"HTTP {response.status_code}",
+                )
+        return send_with_retry(
+            lambda: self._send_throttled(method, url, *args, **kwargs),
+            self.retry_policy,
+            method,
+            url,
+            on_retry=on_retry,
+        )
+
+    def _send_throttled(self, method, url, *args, **kwargs):
+        if self.rate_limiter is None:
+            return self._send(method, url, *args, **kwargs)
+
+        family = endpoint_family(method, url)
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire(family)
+            response = self._send(method, url, *args, **kwargs)
+            if response.status_code != 429:
+                self.rate_limiter.succeeded(family)
+                return response
+            delay = self.rate_limiter.throttled(family, response.headers.get("Retry-After"), attempt)
+            if self.instrumentation is not None and self.instrumentation.enabled:
+                self.instrumentation.event("throttle", method, url, delay, status=429, attempt=attempt + 1)
+            if attempt >= self.rate_limiter.max_retries:
+                return response
+            response.close()
+            attempt += 1
+
+    def _send(self, method, url, *args, **kwargs):
+        instrumentation = self.instrumentation
+        if instrumentation is None or not instrumentation.enabled:
+            return super().request(method, url, *args, **kwargs)
+
+        headers = kwargs["headers"] = dict(kwargs.get("headers") or {})
+        instrumentation.before_request(method, url, headers)
+        reset_connect_time()
+        start_time = time.time()
+        started = time.perf_counter()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except Exception as ex:
+            instrumentation.emit(RequestRecord(
+                "request", method, url, start_time, time.perf_counter() - started,
+                error=type(ex).__name__, connect=connect_time(),
+            ))
+            raise
+
+        duration = time.perf_counter() - started
+        connect = connect_time()
+        # elapsed stops once the headers are parsed; the body is read after
+        elapsed = response.elapsed.total_seconds()
+        streamed = kwargs.get("stream", False)
+        instrumentation.emit(RequestRecord(
+            "request", method, url, start_time, duration,
+            status=response.status_code,
+            connect=connect,
+            ttfb=max(elapsed - connect, 0.0),
+            body=None if streamed else max(duration - elapsed, 0.0),
+            bytes_sent=int(response.request.headers.get("Content-Length") or 0),
+            bytes_received=_received_bytes(response, streamed),
+        ))
+        return response
+
+
+def _received_bytes(response: requests.Response, streamed: bool) -> int:
+    if not streamed:
+        try:
+            return response.raw.tell()
+        except (AttributeError, OSError):
+            return len(response.content)
+    return int(response.headers.get("Content-Length") or 0)
+
+
+class StreamingDefinitionBody:
+    """
+    JSON request body for item definitions, produced incrementally.
+
+    Renders ``{...fields, "definition": {"Parts": [...]}}`` chunk by chunk.
+    Each part is a dict with ``Path``, ``PayloadType`` and a ``Payload``
+    that is either an already encoded base64 ``str``, raw ``bytes``, or a
+    ``pathlib.Path`` read from disk. Raw payloads are base64-encoded
+    *chunk_size* bytes at a time, so peak memory is bounded by the chunk
+    size rather than by the size of the model.
+
+    The body can be iterated several times (e.g. when a throttled request
+    is retried) and reports its exact length so that ``requests`` sends a
+    ``Content-Length`` header instead of chunked transfer encoding.
+
+    Parameters
+    ----------
+    parts : list[dict]
+        Definition parts.
+    fields : dict, optional
+        Extra top-level fields, e.g. ``displayName`` and ``type`` on create.
+    chunk_size : int
+        Number of raw bytes encoded per chunk (rounded down to a multiple
+        of 3 so that chunks concatenate into valid base64).
+    """
+
+    def __init__(
+        self,
+        parts: list[dict],
+        fields: dict | None = None,
+        chunk_size: int = config.STREAM_CHUNK_SIZE,
+    ) -> None:
+        self.parts = parts
+        self.fields = fields or {}
+        self.chunk_size = max(3, chunk_size - chunk_size % 3)
+
+    def _prefix(self) -> bytes:
+        head = "".join(f"{json.dumps(k)}: {json.dumps(v)}, " for k, v in self.fields.items())
+        return ("{" + head + '"definition": {"Parts": [').encode("utf-8")
+
+    def _part_head(self, index: int, part: dict) -> bytes:
+        separator = ", " if index else ""
+        return (
+            f'{separator}{{"Path": {json.dumps(part["Path"])}, '
+            f'"PayloadType": {json.dumps(part.get("PayloadType", "InlineBase64"))}, '
+            '"Payload": "'
+        ).encode("utf-8")
+
+    @staticmethod
+    def _payload_length(payload: Any) -> int:
+        if isinstance(payload, str):
+            return len(payload)
+        size = os.path.getsize(payload) if isinstance(payload, Path) else len(payload)
+        return 4 * ((size + 2) // 3)
+
+    def __len__(self) -> int:
+        length = len(self._prefix()) + len(b"]}}")
+        for index, part in enumerate(self.parts):
+            length += len(self._part_head(index, part)) + len(b'"}')
+            length += self._payload_length(part["Payload"])
+        return length
+
+    def _iter_payload(self, payload: Any) -> Iterator[bytes]:
+        if isinstance(payload, str):
+            for i in range(0, len(payload), self.chunk_size):
+                yield payload[i:i + self.chunk_size].encode("ascii")
+        elif isinstance(payload, Path):
+            with open(payload, "rb") as f:
+                while chunk := f.read(self.chunk_size):
+                    yield base64.b64encode(chunk)
+        else:
+            view = memoryview(payload)
+            for i in range(0, len(view), self.chunk_size):
+                yield base64.b64encode(view[i:i + self.chunk_size])
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._prefix()
+        for index, part in enumerate(self.parts):
+            yield self._part_head(index, part)
+            yield from self._iter_payload(part["Payload"])
+            yield b'"}'
+        yield b"]}}"
+
+
+def parse_fabric_api_response(response: requests.Response, unwrap_value: bool = True) -> Any:
+    """
+    Decode a Fabric API response body.
+
+    Strips a UTF-8 BOM if present, raises ``FabricError`` for error payloads
+    (``FabricNotFoundError`` when the status is 404) and, unless *unwrap_value* is ``False``, unwraps ``{"value": [...]}``
+    collections (dropping any continuation token).
+
+    Returns
+    -------
+    Any
+        The decoded JSON, or ``None`` when the response has no body.
+    """
+    if not response.content:
+        return None
+
+    content_bytes = response.content
+    content_text = (
+        content_bytes[3:].decode("utf-8")
+        if content_bytes.startswith(b"\xef\xbb\xbf")
+        else response.text
+    )
+    json_result = json.loads(content_text)
+    _raise_for_error_payload(json_result, response.status_code)
+
+    if unwrap_value and isinstance(json_result, dict) and "value" in json_result:
+        return json_result["value"]
+
+    return json_result
+
+
+def _raise_for_error_payload(json_result: Any, status_code: int | None = None) -> None:
+    if isinstance(json_result, dict) and "errorCode" in json_result:
+        error_class = FabricNotFoundError if status_code == 404 else FabricError
+        raise error_class(
+            f"API Error: {json_result['errorCode']} - {json_result.get('message')}"
+        )
+
+
+_PARTS_ARRAY = re.compile(r'"parts"\s*:\s*\[', re.IGNORECASE)
+
+
+def iter_definition_parts(response: requests.Response, chunk_size: int = config.STREAM_CHUNK_SIZE) -> Iterator[dict]:
+    """
+    Incrementally yield the ``parts`` of a streamed ``getDefinition`` response.
+
+    Only the part being decoded (plus one network chunk) is held in memory,
+    instead of the whole definition. A part object is parsed only once its
+    closing brace has arrived; base64 payloads contain no braces, so each
+    part is normally decoded exactly once.
+
+    Parameters
+    ----------
+    response : requests.Response
+        Response opened with ``stream=True`` (see ``invoke_fabric_api_request``).
+    chunk_size : int
+        Number of bytes read from the network at a time.
+
+    Raises
+    ------
+    FabricError
+        If the response is an error payload instead of a definition.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    chunks = response.iter_content(chunk_size=chunk_size)
+    buffer = ""
+
+    def read_text() -> str | None:
+        for chunk in chunks:
+            text = text_decoder.decode(chunk)
+            if text:
+                return text
+        return None
+
+    # Locate the parts array
+    while (match := _PARTS_ARRAY.search(buffer)) is None:
+        text = read_text()
+        if text is None:
+            # No parts array: surface API errors, otherwise there is nothing to yield
+            if buffer.strip():
+                _raise_for_error_payload(json.loads(buffer), response.status_code)
+            return
+        buffer += text
+    buffer = buffer[match.end():]
+
+    pending: list[str] = []
+    while True:
+        buffer = buffer.lstrip(" \t\r\n,")
+        if buffer.startswith("]"):
+            return
+        if "}" in buffer:
+            try:
+                part, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                pass
+            else:
+                yield part
+                buffer = buffer[end:]
+                continue
+
+        # Accumulate chunks until one may close the current part object
+        while True:
+            text = read_text()
+            if text is None:
+                raise FabricError("Definition response ended before the parts array was complete")
+            pending.append(text)
+            if "}" in text or "]" in text:
+                break
+        buffer += "".join(pending)
+        pending.clear()
+
+
+def next_poll_delay(
+    attempt: int,
+    retry_after: str | None = None,
+    initial_delay: float = config.LRO_INITIAL_DELAY,
+    max_delay: float = config.LRO_MAX_DELAY,
+) -> float:
+    """
+    Return the number of seconds to wait before polling an operation again.
+
+    A numeric ``Retry-After`` header from the service always wins. Otherwise
+    the delay grows exponentially from *initial_delay*, capped at *max_delay*.
+
+    Parameters
+    ----------
+    attempt : int
+        Number of polls already made for this operation (0 for the first).
+    retry_after : str, optional
+        Value of the ``Retry-After`` header of the last response.
+    initial_delay : float
+        Delay before the first poll when the service gives no hint.
+    max_delay : float
+        Upper bound of the exponential backoff.
+    """
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+    return min(initial_delay * (2 ** attempt), max_delay)
+
+
+def get_operation_state(
+    operation_url: str,
+    headers: dict,
+    session: requests.Session | None = None,
+    timeout_sec: int = 60,
+) -> tuple[str, requests.Response]:
+    """
+    Poll a long-running operation once.
+
+    Returns
+    -------
+    tuple[str, requests.Response]
+        The lower-cased operation status (``notstarted``, ``running``,
+        ``succeeded``, ``failed``, ...) and the raw status response.
+    """
+    http = session if session is not None else requests
+    lro_response = http.get(operation_url, headers=headers, timeout=timeout_sec)
+    lro_content = lro_response.json()
+    return lro_content.get("status", "").lower(), lro_response
+
+
+def complete_operation(
+    status: str,
+    lro_response: requests.Response,
+    headers: dict,
+    session: requests.Session | None = None,
+    timeout_sec: int = 240,
+    stream: bool = False,
+) -> requests.Response | None:
+    """
+    Resolve a finished long-running operation.
+
+    Fetches the operation result when the status response points to one
+    (without reading its body when *stream* is ``True``), returns ``None``
+    when the operation has no result body, and raises ``FabricError`` when
+    the operation failed.
+    """
+    http = session if session is not None else requests
+
+    if status == "failed":
+        error = lro_response.json().get("error", {})
+        raise FabricError(
+            f"LRO failed: {error.get('errorCode')} - {error.get('message')}"
+        )
+
+    result_url = lro_response.headers.get("Location")
+    if not result_url:
+        return None  # LRO has no result body
+    return http.get(result_url, headers=headers, timeout=timeout_sec, stream=stream)
+
+
+def wait_for_operation(
+    response: requests.Response,
+    headers: dict,
+    session: requests.Session | None = None,
+    stream: bool = False,
+    token_provider: Callable[[], str] | None = None,
+) -> requests.Response | None:
+    """
+    Block until the long-running operation started by *response* finishes.
+
+    Polls with ``next_poll_delay``, honouring ``Retry-After`` on the initial
+    202 and on every status response. When *token_provider* is given, the
+    ``Authorization`` header of every poll carries the token it returns.
+
+    Returns
+    -------
+    requests.Response or None
+        The operation result response, or ``None`` if it has no body.
+    """
+    operation_url = response.headers.get("Location")
+    if not operation_url:
+        raise FabricError("LRO response has no Location header")
+
+    retry_after = response.headers.get("Retry-After")
+    started = time.perf_counter()
+    attempt = 0
+    while True:
+        time.sleep(next_poll_delay(attempt, retry_after))
+        if token_provider is not None:
+            headers = {**headers, "Authorization": f"Bearer {token_provider()}"}
+        status, lro_response = get_operation_state(operation_url, headers, session)
+        if status in ["succeeded", "failed"]:
+            record_operation_wait(session, response, time.perf_counter() - started, attempt + 1, status)
+            return complete_operation(status, lro_response, headers, session, stream=stream)
+        retry_after = lro_response.headers.get("Retry-After")
+        attempt += 1
+
+
+def record_operation_wait(
+    session: requests.Session | None,
+    response: requests.Response,
+    seconds: float,
+    polls: int,
+    status: str,
+) -> None:
+    """Report the time an operation took after its 202 *response* to the session instrumentation."""
+    instrumentation = getattr(session, "instrumentation", None)
+    if instrumentation is None or not instrumentation.enabled or response.request is None:
+        return
+    instrumentation.event(
+        "lro_wait", response.request.method, response.request.url, seconds,
+        polls=polls, operationStatus=status,
+    )
 
 
 def invoke_fabric_api_request(
     uri: str,
-    token: str | None = None,
+    token: str | Callable[[], str] | None = None,
     method: str = "GET",
     body: Any = None,
     content_type: str = "application/json; charset=utf-8",
     timeout_sec: int = 240,
     retry_count: int = 0,
     api_url: str = config.API_URL,
-) -> Any:
+    session: requests.Session | None = None,
+    poller: "OperationPoller | None" = None,
+    unwrap_value: bool = True,
+    stream: bool = False,
+) -> "Any | LongRunningOperation | requests.Response":
+    """
+    Send a request to the Fabric REST API and return the decoded result.
+
+    Collection responses are unwrapped to their ``value`` list; pass
+    ``unwrap_value=False`` to get the full page including the continuation
+    token (or use ``iter_fabric_api_pages``).
+
+    Long-running operations (202) are awaited in the calling thread unless
+    a *poller* is given, in which case a ``LongRunningOperation`` future is
+    returned immediately and resolved by the poller's background thread.
+    With a poller every call returns a future, already completed when the
+    service answered synchronously.
+
+    With ``stream=True`` the final (post-LRO) ``requests.Response`` is
+    returned unread so that large bodies can be consumed incrementally,
+    e.g. with ``iter_definition_parts``. The caller must close it.
+
+    Throttled (429) requests are sent again after ``Retry-After``. When the
+    *session* carries a ``RateLimiter`` the pause applies to every thread
+    sharing it; ``FabricThrottlingError`` is raised once retries run out.
+
+    *token* is either a bearer token or a callable returning the current
+    one (e.g. ``TokenManager.get_token``). A callable is called again for
+    every request sent, including throttled resends and operation polls,
+    so a long series of calls never outlives its token.
+    """
+    http = session if session is not None else requests
+    token_provider = token if callable(token) else None
     headers = {
         "Content-Type": content_type,
         "Authorization": f"Bearer {token}",
@@ -26,83 +543,131 @@ def invoke_fabric_api_request(
     if not api_url:
         raise ValueError("api_url must be specified")
 
+    if stream and poller is not None:
+        raise ValueError("stream and poller cannot be combined")
+
     request_url = f"{api_url.rstrip('/')}/{uri.lstrip('/')}"
+    # A rate-limited session already paused and retried throttled requests
+    throttle_retries = 0 if getattr(session, "rate_limiter", None) is not None else config.THROTTLE_MAX_RETRIES
 
     try:
-        response = requests.request(
-            method=method.upper(),
-            url=request_url,
-            headers=headers,
-            json=body if isinstance(body, (dict, list)) else None,
-            data=None if isinstance(body, (dict, list)) else body,
-            timeout=timeout_sec,
-        )
+        while True:
+            if token_provider is not None:
+                headers["Authorization"] = f"Bearer {token_provider()}"
+            response = http.request(
+                method=method.upper(),
+                url=request_url,
+                headers=headers,
+                json=body if isinstance(body, (dict, list)) else None,
+                data=None if isinstance(body, (dict, list)) else body,
+                timeout=timeout_sec,
+                stream=stream,
+            )
+            if response.status_code != 429:
+                break
+
+            response.close()
+            if retry_count >= throttle_retries:
+                raise FabricThrottlingError("Exceeded max retries after 429 Too Many Requests")
+            wait = parse_retry_after(response.headers.get("Retry-After"))
+            if wait is None:
+                wait = config.THROTTLE_FALLBACK_DELAY * (2 ** retry_count)
+            config.print_color(f"Too many requests (429). Sleeping {wait:g}s.", "yellow")
+            instrumentation = getattr(session, "instrumentation", None)
+            if instrumentation is not None and instrumentation.enabled:
+                instrumentation.event("throttle", method, request_url, wait, status=429, attempt=retry_count + 1)
+            time.sleep(wait)
+            retry_count += 1
 
         # Handle Long-Running Operation (202)
         if response.status_code == 202:
-            while True:
-                async_url = response.headers.get("Location")
-                if not async_url:
-                    raise FabricError("LRO response has no Location header")
-                print("LRO - Waiting for request to complete in service.")
-                time.sleep(5)
-                lro_response = requests.get(async_url, headers=headers)
-                lro_content = lro_response.json()
-                status = lro_content.get("status", "").lower()
-
-                if status in ["succeeded", "failed"]:
-                    if status == "succeeded":
-                        result_url = lro_response.headers.get("Location")
-                        if result_url:
-                            response = requests.get(result_url, headers=headers)
-                        else:
-                            return None  # LRO has no result body
-                    else:
-                        error = lro_content.get("error", {})
-                        raise FabricError(
-                            f"LRO failed: {error.get('errorCode')} - {error.get('message')}"
-                        )
-                    break
-
-        # Parse JSON response
-        if response.content:
-            content_bytes = response.content
-            content_text = (
-                content_bytes[3:].decode("utf-8")
-                if content_bytes.startswith(b"\xef\xbb\xbf")
-                else response.text
-            )
-            json_result = json.loads(content_text)
+            if poller is not None:
+                return poller.submit(response, headers)
+            response.close()
+            response = wait_for_operation(response, headers, session, stream=stream, token_provider=token_provider)
+            if response is None:
+                return None
 
-            if isinstance(json_result, dict) and "errorCode" in json_result:
-                raise FabricError(
-                    f"API Error: {json_result['errorCode']} - {json_result.get('message')}"
-                )
+        if stream:
+            return response
 
-            if isinstance(json_result, dict) and "value" in json_result:
-                return json_result["value"]
-
-            return json_result
+        result = parse_fabric_api_response(response, unwrap_value)
+        if poller is not None:
+            return poller.completed(result)
+        return result
 
     except requests.exceptions.RequestException as ex:
-        raw_response = getattr(ex, "response", None)
+        raise FabricError(str(ex))
 
-        if raw_response is not None and raw_response.status_code == 429:
-            retry_after = raw_response.headers.get("Retry-After")
-            wait = int(retry_after) + 5 if retry_after and retry_after.isdigit() else 60
-            print(f"Too many requests (429). Sleeping {wait}s.")
-            time.sleep(wait)
-            if retry_count < 3:
-                return invoke_fabric_api_request(
-                    uri=uri,
-                    token=token,
-                    method=method,
-                    body=body,
-                    content_type=content_type,
-                    timeout_sec=timeout_sec,
-                    retry_count=retry_count + 1,
-                    api_url=api_url,
-                )
-            raise FabricThrottlingError("Exceeded max retries after 429 Too Many Requests")
 
-        raise FabricError(str(ex))
+def iter_fabric_api_pages(
+    uri: str,
+    token: str | Callable[[], str] | None = None,
+    api_url: str = config.API_URL,
+    session: requests.Session | None = None,
+    prefetch: bool = False,
+) -> Iterator[list]:
+    """
+    Lazily iterate over the pages of a Fabric collection endpoint.
+
+    Follows ``continuationToken`` until the service stops returning one. A
+    page is only requested when the previous one has been consumed, so
+    callers can stop early without listing the whole collection.
+
+    Parameters
+    ----------
+    uri : str
+        Collection URI relative to *api_url*, e.g. ``"workspaces"``.
+    token : str or callable
+        A valid bearer access token, or a callable returning one for each
+        page request.
+    api_url : str
+        Base URL of the Fabric REST API.
+    session : requests.Session, optional
+        Pooled HTTP session to reuse connections.
+    prefetch : bool
+        When ``True``, request the next page in a background thread while
+        the current one is being consumed.
+
+    Yields
+    ------
+    list
+        The ``value`` list of each page.
+    """
+
+    def fetch(continuation_token: str | None) -> Any:
+        page_uri = uri
+        if continuation_token:
+            separator = "&" if "?" in uri else "?"
+            page_uri = f"{uri}{separator}continuationToken={quote(continuation_token, safe='')}"
+        return invoke_fabric_api_request(
+            page_uri,
+            token,
+            api_url=api_url,
+            session=session,
+            unwrap_value=False,
+        )
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        page = fetch(None)
+        while True:
+            if not isinstance(page, dict):
+                yield page or []
+                return
+
+            continuation_token = page.get("continuationToken")
+            next_page = (
+                executor.submit(fetch, continuation_token)
+                if executor is not None and continuation_token
+                else None
+            )
+
+            yield page.get("value", [])
+
+            if not continuation_token:
+                return
+            page = next_page.result() if next_page is not None else fetch(continuation_token)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -1,13 +1,29 @@
-from azure.identity import ClientSecretCredential, DefaultAzureCredential  # type: ignore
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from . import config
+from .exceptions import FabricAuthError
+
+# azure-identity is imported when a credential is first created, so that
+# importing the package (e.g. for the offline semantic model helpers) stays fast
+if TYPE_CHECKING:
+    from azure.core.credentials import AccessToken  # type: ignore
+    from azure.identity import ClientSecretCredential, DefaultAzureCredential  # type: ignore
+
+# Length of a urlsafe base64 Fernet key (32 bytes)
+_FERNET_KEY_LENGTH = 44
 
 
 def get_credential(
     tenant_id: str | None = None,
     client_id: str | None = None,
     client_secret: str | None = None,
-) -> ClientSecretCredential | DefaultAzureCredential:
+) -> "ClientSecretCredential | DefaultAzureCredential":
     """
     Return an Azure credential for the given authentication method.
 
@@ -29,6 +45,8 @@ def get_credential(
     ClientSecretCredential | DefaultAzureCredential
         An azure-identity credential ready to call ``get_token()``.
     """
+    from azure.identity import ClientSecretCredential, DefaultAzureCredential  # type: ignore
+
     if tenant_id is None and client_id is None and client_secret is None:
         return DefaultAzureCredential()
     return ClientSecretCredential(
@@ -38,14 +56,336 @@ def get_credential(
     )
 
 
+class EncryptedTokenCache:
+    """
+    On-disk token cache shared by processes, encrypted with Fernet.
+
+    Entries are keyed by a hash of the tenant, client and scopes, so one
+    file can hold the tokens of several identities. The Fernet key comes
+    from *key*, ``config.TOKEN_CACHE_KEY`` (``MSFABRIC_TOKEN_CACHE_KEY``) or
+    a key file (*key_path*, or ``config.TOKEN_CACHE_KEY_FILE`` from
+    ``MSFABRIC_TOKEN_CACHE_KEY_FILE``). The key file must live outside the
+    directory of the cache, so that reading the cache is not enough to
+    decrypt it; it is created with owner-only permissions when missing.
+    Writes replace the files atomically, so concurrent processes never read
+    a partial cache or key.
+
+    Requires the optional ``cryptography`` package
+    (``pip install msfabric-devops[cache]``).
+
+    Parameters
+    ----------
+    path : str
+        Cache file.
+    key : str | bytes, optional
+        Fernet key (urlsafe base64, 32 bytes).
+    key_path : str, optional
+        File holding the Fernet key, used when no key is given.
+
+    Raises
+    ------
+    FabricAuthError
+        If no key is configured, the key file sits next to the cache, or
+        the key file stays empty or truncated.
+    """
+
+    def __init__(self, path: str, key: str | bytes | None = None, key_path: str | None = None) -> None:
+        try:
+            from cryptography.fernet import Fernet  # type: ignore
+        except ImportError as ex:
+            raise ImportError(
+                "The encrypted token cache requires the 'cryptography' package: "
+                "pip install msfabric-devops[cache]"
+            ) from ex
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        key = key or config.TOKEN_CACHE_KEY
+        key_path = key_path or config.TOKEN_CACHE_KEY_FILE
+        if not key and not key_path:
+            raise FabricAuthError(
+                "The encrypted token cache needs a key: pass key or key_path, or set "
+                "MSFABRIC_TOKEN_CACHE_KEY or MSFABRIC_TOKEN_CACHE_KEY_FILE"
+            )
+        self._fernet = Fernet(key or self._read_or_create_key(Path(key_path), Fernet))
+
+    def load(self, cache_id: str) -> "AccessToken | None":
+        """Return the cached token of *cache_id*, or ``None`` if absent or unreadable."""
+        encrypted = self._read_entries().get(self._entry_id(cache_id))
+        if encrypted is None:
+            return None
+        try:
+            entry = json.loads(self._fernet.decrypt(encrypted.encode("ascii")))
+            from azure.core.credentials import AccessToken  # type: ignore
+
+            return AccessToken(entry["token"], int(entry["expires_on"]))
+        except Exception:
+            # Wrong key, tampered or truncated entry: behave as a cache miss
+            return None
+
+    def store(self, cache_id: str, token: "AccessToken") -> None:
+        """Save *token* for *cache_id* and drop the expired entries."""
+        payload = json.dumps({"token": token.token, "expires_on": token.expires_on}).encode("utf-8")
+        with self._lock:
+            entries = {
+                entry_id: encrypted
+                for entry_id, encrypted in self._read_entries().items()
+                if self._is_live(encrypted)
+            }
+            entries[self._entry_id(cache_id)] = self._fernet.encrypt(payload).decode("ascii")
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+
+    def _is_live(self, encrypted: str) -> bool:
+        try:
+            entry = json.loads(self._fernet.decrypt(encrypted.encode("ascii")))
+            return entry["expires_on"] > time.time()
+        except Exception:
+            return False
+
+    def _read_entries(self) -> dict[str, str]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    @staticmethod
+    def _entry_id(cache_id: str) -> str:
+        return hashlib.sha256(cache_id.encode("utf-8")).hexdigest()
+
+    def _read_or_create_key(self, key_path: Path, fernet_cls) -> bytes:
+        if key_path.resolve().parent == self.path.resolve().parent:
+            raise FabricAuthError(f"The token cache key file must not be stored next to the cache: {key_path}")
+        if not key_path.exists():
+            key_path.parent.mkdir(parents=True, exist_ok=True)
+            # Written in full under a private name, then linked into place:
+            # the link fails if another process created the key first
+            tmp_path = key_path.with_name(f"{key_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(fernet_cls.generate_key())
+            try:
+                os.link(tmp_path, key_path)
+            except FileExistsError:
+                pass
+            finally:
+                os.unlink(tmp_path)
+        for attempt in range(5):
+            key = key_path.read_bytes().strip()
+            if len(key) == _FERNET_KEY_LENGTH:
+                return key
+            # A key file written by hand may still be in progress
+            time.sleep(0.05 * (attempt + 1))
+        raise FabricAuthError(f"The token cache key file is empty or truncated: {key_path}")
+
+
+class TokenManager:
+    """
+    Thread-safe bearer token provider with proactive refresh.
+
+    ``get_token`` returns the cached token without locking while it is
+    valid for more than *refresh_margin* seconds (or half its lifetime,
+    for tokens issued for a shorter time). Inside that margin the
+    current token is still returned and a single background thread fetches
+    the next one, so no request waits for Azure AD. Only when the token is
+    missing or has less than *min_validity* seconds left do callers block,
+    and then only one of them calls the credential while the others wait
+    for its result.
+
+    With a *cache*, a token fetched by one process is reused by the others
+    (CLI invocations, parallel workers) until it nears expiry.
+
+    Parameters
+    ----------
+    credential : TokenCredential
+        Any azure-identity credential.
+    scopes : list[str], optional
+        Scopes requested (default ``config.SCOPE``).
+    cache : EncryptedTokenCache, optional
+        Cache shared with other processes.
+    cache_id : str, optional
+        Identity of the credential in *cache*.
+    refresh_margin : float
+        Seconds before expiry at which a background refresh starts.
+    min_validity : float
+        Seconds before expiry below which callers refresh inline.
+    refresh_backoff : float
+        Seconds before a background refresh that failed or returned no
+        newer token is tried again; doubles up to *refresh_margin*.
+    """
+
+    def __init__(
+        self,
+        credential,
+        scopes: list[str] | None = None,
+        cache: EncryptedTokenCache | None = None,
+        cache_id: str = "default",
+        refresh_margin: float = config.TOKEN_REFRESH_MARGIN,
+        min_validity: float = config.TOKEN_MIN_VALIDITY,
+        refresh_backoff: float = config.TOKEN_REFRESH_BACKOFF,
+    ) -> None:
+        self.credential = credential
+        self.scopes = list(scopes or config.SCOPE)
+        self.cache = cache
+        self.cache_id = f"{cache_id}|{' '.join(self.scopes)}"
+        self.refresh_margin = refresh_margin
+        self.min_validity = min_validity
+        self.refresh_backoff = refresh_backoff
+        self.refreshes = 0
+        self._token: "AccessToken | None" = None
+        self._refresh_at = 0.0
+        self._backoff = refresh_backoff
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def get_token(self) -> str:
+        """
+        Return a bearer token valid for at least *min_validity* seconds.
+
+        Raises
+        ------
+        FabricAuthError
+            If the credential fails to issue a token.
+        """
+        token = self._token
+        if token is not None:
+            now = time.time()
+            if now < self._refresh_at:
+                return token.token
+            if token.expires_on - now > self.min_validity:
+                self._start_background_refresh()
+                return token.token
+
+        with self._lock:
+            token = self._token
+            if token is None or token.expires_on - time.time() <= self.min_validity:
+                token = self._load_cached(self.min_validity) or self._fetch()
+                self._set_token(token)
+            return token.token
+
+    def _set_token(self, token: "AccessToken") -> None:
+        # Called with the lock held
+        lifetime = token.expires_on - time.time()
+        self._refresh_at = token.expires_on - min(self.refresh_margin, lifetime / 2)
+        self._backoff = self.refresh_backoff
+        self._token = token
+
+    def _defer_refresh(self) -> None:
+        # Called with the lock held when a background refresh brought nothing
+        # newer, so that callers keep the current token instead of starting a
+        # new refresh on every call
+        self._refresh_at = min(time.time() + self._backoff, self._token.expires_on - self.min_validity)
+        self._backoff = min(self._backoff * 2, self.refresh_margin)
+
+    def _start_background_refresh(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_refresh, name="msfabric-token", daemon=True).start()
+
+    def _background_refresh(self) -> None:
+        try:
+            try:
+                token = self._load_cached(self._token.expires_on - time.time()) or self._fetch()
+            except Exception:
+                # Callers keep the current token; once it nears expiry they
+                # refresh inline and the error surfaces there
+                token = None
+            with self._lock:
+                if token is not None and token.expires_on > self._token.expires_on:
+                    self._set_token(token)
+                else:
+                    self._defer_refresh()
+        finally:
+            self._refreshing = False
+
+    def _load_cached(self, min_validity: float) -> "AccessToken | None":
+        if self.cache is None:
+            return None
+        token = self.cache.load(self.cache_id)
+        if token is None or token.expires_on - time.time() <= min_validity:
+            return None
+        return token
+
+    def _fetch(self) -> "AccessToken":
+        try:
+            token = self.credential.get_token(*self.scopes)
+        except Exception as ex:
+            raise FabricAuthError(f"Failed to acquire an access token: {ex}") from ex
+        self.refreshes += 1
+        if self.cache is not None:
+            try:
+                self.cache.store(self.cache_id, token)
+            except OSError as ex:
+                config.print_color(f"Token cache not written: {ex}", "yellow")
+        return token
+
+
+_MANAGERS: dict[tuple, TokenManager] = {}
+_MANAGERS_LOCK = threading.Lock()
+
+
+def get_token_manager(
+    tenant_id: str | None = None,
+    client_id: str | None = None,
+    client_secret: str | None = None,
+    cache_path: str | None = None,
+) -> TokenManager:
+    """
+    Return the process-wide ``TokenManager`` of a credential.
+
+    Clients and ``get_access_token`` calls with the same credentials share
+    one credential object and one cached token.
+
+    Parameters
+    ----------
+    tenant_id : str, optional
+        Azure AD Tenant ID.
+    client_id : str, optional
+        Azure AD Application (client) ID.
+    client_secret : str, optional
+        Azure AD Client Secret.
+    cache_path : str, optional
+        Encrypted on-disk cache shared with other processes (default
+        ``config.TOKEN_CACHE_PATH``, from ``MSFABRIC_TOKEN_CACHE``).
+
+    Returns
+    -------
+    TokenManager
+    """
+    cache_path = cache_path or config.TOKEN_CACHE_PATH
+    secret_hash = hashlib.sha256(client_secret.encode("utf-8")).hexdigest() if client_secret else None
+    key = (tenant_id, client_id, secret_hash, cache_path)
+    with _MANAGERS_LOCK:
+        manager = _MANAGERS.get(key)
+        if manager is None:
+            manager = _MANAGERS[key] = TokenManager(
+                get_credential(tenant_id, client_id, client_secret),
+                cache=EncryptedTokenCache(cache_path) if cache_path else None,
+                cache_id=f"{tenant_id}|{client_id}",
+            )
+        return manager
+
+
 def get_access_token(
     tenant_id: str | None = None,
     client_id: str | None = None,
     client_secret: str | None = None,
+    cache_path: str | None = None,
 ) -> str:
     """
     Authenticate and return a bearer access token for the Fabric REST API.
 
+    The credential and its token are kept for the process (see
+    ``get_token_manager``), so repeated calls return the cached token
+    until it nears expiry.
+
     Parameters
     ----------
     tenant_id : str, optional
@@ -54,6 +394,8 @@ def get_access_token(
         Azure AD Application (client) ID.
     client_secret : str, optional
         Azure AD Client Secret.
+    cache_path : str, optional
+        Encrypted on-disk token cache shared with other processes.
 
     Returns
     -------
@@ -61,12 +403,7 @@ def get_access_token(
         A valid access token string. Tokens are short-lived (~1 hour); use
         ``FabricClient`` for long-running scripts as it refreshes automatically.
     """
-    credential = get_credential(
-        tenant_id=tenant_id,
-        client_id=client_id,
-        client_secret=client_secret,
-    )
-    return credential.get_token(*config.SCOPE).token
+    return get_token_manager(tenant_id, client_id, client_secret, cache_path).get_token()
 
 
 def main():
@@ -0,0 +1,295 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from . import config
+
+
+class ItemInventoryCache:
+    """
+    In-memory inventory of workspace items with TTL eviction.
+
+    Each workspace entry indexes its items by id, by
+    ``(type.lower(), displayName.lower())`` and by lower-cased display name,
+    so existence checks and name lookups are O(1) without listing the
+    workspace again. Entries expire *ttl* seconds after they were loaded;
+    ``FabricClient`` patches them on its own create and delete calls so
+    they stay accurate in between.
+
+    Items are copied on the way in and out, so callers may modify the dicts
+    they store or receive without corrupting the indexes.
+
+    Parameters
+    ----------
+    ttl : float
+        Lifetime of a workspace listing in seconds. ``0`` disables caching.
+    path : str, optional
+        JSON file used to persist the inventory across processes. It is
+        loaded on construction and rewritten after every change.
+    """
+
+    def __init__(self, ttl: float = config.ITEM_CACHE_TTL, path: str | None = None) -> None:
+        self.ttl = ttl
+        self.path = Path(path) if path else None
+        self._lock = threading.RLock()
+        self._workspaces: dict[str, dict] = {}
+        if self.path is not None and self.path.is_file():
+            self._load()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get_items(self, workspace_id: str) -> list[dict] | None:
+        """Return the cached items of a workspace, or ``None`` if absent or expired."""
+        with self._lock:
+            entry = self._entry(workspace_id)
+            return [dict(item) for item in entry["by_id"].values()] if entry else None
+
+    def get_item(self, workspace_id: str, item_id: str) -> dict | None:
+        """Return a cached item by id, or ``None``."""
+        with self._lock:
+            entry = self._entry(workspace_id)
+            return _copy(entry["by_id"].get(item_id)) if entry else None
+
+    def find_item(self, workspace_id: str, item_type: str, display_name: str) -> dict | None:
+        """Return the cached item with this type and name (case-insensitive), or ``None``."""
+        with self._lock:
+            entry = self._entry(workspace_id)
+            if not entry:
+                return None
+            item_id = entry["by_key"].get((item_type.lower(), display_name.lower()))
+            return _copy(entry["by_id"].get(item_id)) if item_id else None
+
+    def find_items_by_name(self, workspace_id: str, display_name: str) -> list[dict] | None:
+        """Return the cached items whose ``displayName`` equals *display_name* (case-sensitive)."""
+        with self._lock:
+            entry = self._entry(workspace_id)
+            if not entry:
+                return None
+            return [
+                dict(entry["by_id"][item_id])
+                for item_id in entry["by_name"].get(display_name.lower(), ())
+                if entry["by_id"][item_id]["displayName"] == display_name
+            ]
+
+    def is_loaded(self, workspace_id: str) -> bool:
+        """Return ``True`` if a fresh listing of the workspace is cached."""
+        with self._lock:
+            return self._entry(workspace_id) is not None
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def set_items(self, workspace_id: str, items: list[dict]) -> None:
+        """Store a full listing of a workspace."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            entry = _new_entry(time.time())
+            for item in items:
+                self._index(entry, item)
+            self._workspaces[workspace_id] = entry
+            self._save()
+
+    def put_item(self, workspace_id: str, item: dict) -> None:
+        """Add or replace one item of an already cached workspace."""
+        with self._lock:
+            entry = self._entry(workspace_id)
+            if entry is None:
+                return
+            previous = entry["by_id"].get(item["id"])
+            if previous is not None:
+                self._unindex(entry, previous)
+            self._index(entry, item)
+            self._save()
+
+    def remove_item(self, workspace_id: str, item_id: str) -> None:
+        """Drop one item from a cached workspace."""
+        with self._lock:
+            entry = self._workspaces.get(workspace_id)
+            if entry is None:
+                return
+            item = entry["by_id"].get(item_id)
+            if item is not None:
+                self._unindex(entry, item)
+                self._save()
+
+    def invalidate(self, workspace_id: str | None = None) -> None:
+        """Forget one workspace, or every workspace when *workspace_id* is ``None``."""
+        with self._lock:
+            if workspace_id is None:
+                self._workspaces.clear()
+            else:
+                self._workspaces.pop(workspace_id, None)
+            self._save()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _entry(self, workspace_id: str) -> dict | None:
+        entry = self._workspaces.get(workspace_id)
+        if entry is None:
+            return None
+        if time.time() - entry["loaded_at"] >= self.ttl:
+            del self._workspaces[workspace_id]
+            return None
+        return entry
+
+    @staticmethod
+    def _index(entry: dict, item: dict) -> None:
+        entry["by_id"][item["id"]] = dict(item)
+        if item.get("type") and item.get("displayName"):
+            entry["by_key"][_key(item)] = item["id"]
+        if item.get("displayName"):
+            entry["by_name"].setdefault(item["displayName"].lower(), set()).add(item["id"])
+
+    @staticmethod
+    def _unindex(entry: dict, item: dict) -> None:
+        entry["by_id"].pop(item["id"], None)
+        if entry["by_key"].get(_key(item)) == item["id"]:
+            del entry["by_key"][_key(item)]
+        if item.get("displayName"):
+            entry["by_name"].get(item["displayName"].lower(), set()).discard(item["id"])
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        for workspace_id, stored in data.items():
+            entry = _new_entry(stored["loaded_at"])
+            for item in stored["items"]:
+                self._index(entry, item)
+            self._workspaces[workspace_id] = entry
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        data = {
+            workspace_id: {
+                "loaded_at": entry["loaded_at"],
+                "items": list(entry["by_id"].values()),
+            }
+            for workspace_id, entry in self._workspaces.items()
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+
+def _new_entry(loaded_at: float) -> dict:
+    return {"loaded_at": loaded_at, "by_id": {}, "by_key": {}, "by_name": {}}
+
+
+def _copy(entry: dict | None) -> dict | None:
+    return dict(entry) if entry is not None else None
+
+
+def _key(item: dict) -> tuple[str, str]:
+    return (item.get("type", "").lower(), item.get("displayName", "").lower())
+
+
+class WorkspaceDirectory:
+    """
+    Index of the workspaces visible to the client, by id and by name.
+
+    The full listing is loaded once and kept for *ttl* seconds; in between,
+    ``FabricClient`` patches it with the workspaces it creates, deletes or
+    fetches by id, so name lookups never re-list the tenant. Like the item
+    cache, it stores and returns copies of the workspace dicts.
+
+    Parameters
+    ----------
+    ttl : float
+        Lifetime of the listing in seconds. ``0`` disables caching.
+    """
+
+    def __init__(self, ttl: float = config.WORKSPACE_CACHE_TTL) -> None:
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._loaded_at: float | None = None
+        self._by_id: dict[str, dict] = {}
+        self._by_name: dict[str, set[str]] = {}
+
+    def is_loaded(self) -> bool:
+        """Return ``True`` if a fresh listing is cached."""
+        with self._lock:
+            return self._fresh()
+
+    def get_workspaces(self) -> list[dict] | None:
+        """Return the cached workspaces, or ``None`` if absent or expired."""
+        with self._lock:
+            return [dict(workspace) for workspace in self._by_id.values()] if self._fresh() else None
+
+    def get_workspace(self, workspace_id: str) -> dict | None:
+        """Return a cached workspace by id, or ``None``."""
+        with self._lock:
+            return _copy(self._by_id.get(workspace_id)) if self._fresh() else None
+
+    def find_workspaces_by_name(self, display_name: str) -> list[dict] | None:
+        """Return the cached workspaces named *display_name* (case-sensitive), or ``None``."""
+        with self._lock:
+            if not self._fresh():
+                return None
+            return [
+                dict(self._by_id[workspace_id])
+                for workspace_id in self._by_name.get(display_name.lower(), ())
+                if self._by_id[workspace_id]["displayName"] == display_name
+            ]
+
+    def set_workspaces(self, workspaces: list[dict]) -> None:
+        """Replace the index with a full listing."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._by_id.clear()
+            self._by_name.clear()
+            for workspace in workspaces:
+                self._index(workspace)
+            self._loaded_at = time.time()
+
+    def put_workspace(self, workspace: dict) -> None:
+        """Add or replace one workspace of a loaded index."""
+        with self._lock:
+            if not self._fresh():
+                return
+            self._unindex(workspace["id"])
+            self._index(workspace)
+
+    def remove_workspace(self, workspace_id: str) -> None:
+        """Drop one workspace from the index."""
+        with self._lock:
+            self._unindex(workspace_id)
+
+    def invalidate(self) -> None:
+        """Forget the listing; the next lookup loads it again."""
+        with self._lock:
+            self._loaded_at = None
+            self._by_id.clear()
+            self._by_name.clear()
+
+    def _fresh(self) -> bool:
+        if self._loaded_at is None:
+            return False
+        if time.time() - self._loaded_at >= self.ttl:
+            self.invalidate()
+            return False
+        return True
+
+    def _index(self, workspace: dict) -> None:
+        self._by_id[workspace["id"]] = dict(workspace)
+        if workspace.get("displayName"):
+            self._by_name.setdefault(workspace["displayName"].lower(), set()).add(workspace["id"])
+
+    def _unindex(self, workspace_id: str) -> None:
+        workspace = self._by_id.pop(workspace_id, None)
+        if workspace is not None and workspace.get("displayName"):
+            self._by_name.get(workspace["displayName"].lower(), set()).discard(workspace_id)
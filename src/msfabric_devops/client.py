@@ -1,18 +1,71 @@
-import time
+import asyncio
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
 
+from . import api
 from . import config
-from .authenticate import get_credential
-from .items import ItemsMixin
-from .semantic_models import SemanticModelsMixin
-from .workspaces import WorkspacesMixin
+from .authenticate import get_token_manager
+from .cache import ItemInventoryCache, WorkspaceDirectory
+from .clone import CloneMixin
+from .deploy import DeployMixin
+from .drift import DriftMixin
+from .instrumentation import Instrumentation
+from .items import AsyncItemsMixin, ItemsMixin
+from .lro import OperationPoller
+from .retry import RetryPolicy
+from .throttling import RateLimiter
+from .semantic_models import AsyncSemanticModelsMixin, SemanticModelsMixin
+from .snapshots import SnapshotsMixin
+from .templates import TemplatesMixin
+from .workspaces import AsyncWorkspacesMixin, WorkspacesMixin
 
 
-class FabricClient(WorkspacesMixin, ItemsMixin, SemanticModelsMixin):
+class _BaseClient:
+    """Token manager, rate-limited HTTP session, instrumentation, operation poller and caches shared by the clients."""
+
+    def __init__(
+        self,
+        tenant_id: str | None = None,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        pool_connections: int = config.POOL_CONNECTIONS,
+        pool_maxsize: int = config.POOL_MAXSIZE,
+        item_cache_ttl: float = config.ITEM_CACHE_TTL,
+        item_cache_path: str | None = None,
+        workspace_cache_ttl: float = config.WORKSPACE_CACHE_TTL,
+        rate_limits: dict[str, tuple[float, float]] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        token_cache_path: str | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        self.token_manager = get_token_manager(tenant_id, client_id, client_secret, cache_path=token_cache_path)
+        self.rate_limiter = RateLimiter(rate_limits)
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+        self.session = api.FabricSession(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            rate_limiter=self.rate_limiter,
+            retry_policy=self.retry_policy,
+            instrumentation=self.instrumentation,
+        )
+        self.poller = OperationPoller(session=self.session, token_provider=lambda: self.token_manager.get_token())
+        self.item_cache = ItemInventoryCache(ttl=item_cache_ttl, path=item_cache_path)
+        self.workspace_directory = WorkspaceDirectory(ttl=workspace_cache_ttl)
+
+    @property
+    def token(self) -> str:
+        """Return a valid bearer token, refreshed in the background before it expires."""
+        return self.token_manager.get_token()
+
+
+class FabricClient(_BaseClient, WorkspacesMixin, ItemsMixin, SemanticModelsMixin, DeployMixin, SnapshotsMixin, CloneMixin, DriftMixin, TemplatesMixin):
     """Client for the Microsoft Fabric REST API.
 
-    Inherits all workspace, item, and semantic model operations from their
-    respective mixins. Handles credential management and automatic token
-    refresh so callers never need to pass or manage a token manually.
+    Inherits all workspace, item, semantic model, deployment, snapshot,
+    clone, drift and template operations from their respective mixins. Handles credential
+    management and automatic token refresh so callers never need to pass or
+    manage a token manually.
 
     Parameters
     ----------
@@ -24,6 +77,60 @@ class FabricClient(WorkspacesMixin, ItemsMixin, SemanticModelsMixin):
         Azure AD Application (client) ID.
     client_secret : str, optional
         Azure AD Client Secret.
+    pool_connections : int, optional
+        Number of per-host connection pools kept by the HTTP session.
+    pool_maxsize : int, optional
+        Maximum number of keep-alive connections per host. Raise it to match
+        the number of threads sharing the client.
+    item_cache_ttl : float, optional
+        Seconds a workspace item listing stays in the client's inventory
+        cache (``0``, the default, disables it). The cache answers
+        ``get_items``, ``get_items_by_name`` and the existence check of
+        ``import_item``, and is patched by the client's own create and
+        delete calls. Call ``client.item_cache.invalidate()`` after
+        out-of-band changes.
+    item_cache_path : str, optional
+        JSON file used to persist the inventory cache across processes.
+    workspace_cache_ttl : float, optional
+        Seconds the workspace listing behind ``get_workspaces_by_name`` and
+        the ``create_workspace`` existence check is reused (``0`` disables
+        it). ``get_workspace_by_id`` uses the direct endpoint, and creates,
+        deletes and id lookups patch the index in place. Call
+        ``client.workspace_directory.invalidate()`` after out-of-band changes.
+    rate_limits : dict, optional
+        ``(requests per second, burst)`` budgets per endpoint family
+        (``workspaces``, ``items``, ``definitions``, ``operations``,
+        ``default``), merged over ``config.RATE_LIMITS``. The budgets are
+        shared by every thread using the client, and a 429 from any request
+        pauses all of them until its ``Retry-After`` deadline. Counters are
+        available from ``client.rate_limiter.metrics()``.
+    retry_policy : RetryPolicy, optional
+        How transient failures (connection errors, timeouts, 5xx) of any
+        request, LRO polls included, are retried. Defaults to
+        ``RetryPolicy()``: jittered backoff within a 5 minute deadline,
+        never repeating a non-idempotent POST the service may have received.
+    token_cache_path : str, optional
+        Encrypted file in which the bearer token is shared with other
+        processes, so short-lived scripts and parallel workers reuse one
+        token instead of each calling Azure AD (default
+        ``MSFABRIC_TOKEN_CACHE``). Requires the ``cryptography`` package
+        and a key (``MSFABRIC_TOKEN_CACHE_KEY`` or
+        ``MSFABRIC_TOKEN_CACHE_KEY_FILE``, see ``EncryptedTokenCache``).
+    instrumentation : Instrumentation, optional
+        Request hooks, per-endpoint latency histograms (connect, TTFB, body,
+        operation wait) and byte/retry counters. The default instance is
+        disabled and costs nothing until ``client.instrumentation.enable()``
+        is called or a hook or sink is added.
+
+    Clients created with the same credentials share one ``TokenManager``:
+    the token is refreshed by a single background thread shortly before it
+    expires, so requests never wait for Azure AD.
+
+    The client owns a pooled, keep-alive HTTP session reused by every
+    workspace and item call (including long-running operation polls), and
+    one background ``OperationPoller`` that resolves the futures returned
+    by ``import_item(..., wait=False)`` and similar calls. Call ``close()``
+    or use the client as a context manager to release them.
 
     Examples
     --------
@@ -51,18 +158,130 @@ class FabricClient(WorkspacesMixin, ItemsMixin, SemanticModelsMixin):
         print(result["id"])
     """
 
+    def close(self) -> None:
+        """Stop the operation poller and close the pooled HTTP session."""
+        self.poller.close()
+        self.session.close()
+
+    def __enter__(self) -> "FabricClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class AsyncFabricClient(_BaseClient, AsyncWorkspacesMixin, AsyncItemsMixin, AsyncSemanticModelsMixin):
+    """Asyncio wrapper around the Microsoft Fabric client operations.
+
+    Exposes the workspace, item and semantic model operations of
+    ``FabricClient`` as coroutines so that they can be awaited from an
+    event loop. This is not a non-blocking HTTP client: each coroutine runs
+    the same blocking call as ``FabricClient`` on a worker thread, over one
+    pooled ``requests`` session. At most *max_concurrency* calls run at any
+    time; the remaining coroutines wait on the event loop without holding a
+    thread. Long-running operations are handed to the shared
+    ``OperationPoller`` and awaited without holding a worker or a
+    concurrency slot, so hundreds of operations can be outstanding at once.
+
+    Parameters
+    ----------
+    tenant_id : str, optional
+        Azure AD Tenant ID (see ``FabricClient``).
+    client_id : str, optional
+        Azure AD Application (client) ID.
+    client_secret : str, optional
+        Azure AD Client Secret.
+    max_concurrency : int, optional
+        Maximum number of in-flight operations. Also sizes the connection
+        pool so that every in-flight request gets a keep-alive connection.
+    item_cache_ttl : float, optional
+        Lifetime of the item inventory cache (see ``FabricClient``).
+    item_cache_path : str, optional
+        JSON file used to persist the inventory cache across processes.
+    workspace_cache_ttl : float, optional
+        Lifetime of the workspace name index (see ``FabricClient``).
+    rate_limits : dict, optional
+        Request budgets per endpoint family (see ``FabricClient``).
+    retry_policy : RetryPolicy, optional
+        Policy for transient failures (see ``FabricClient``).
+    token_cache_path : str, optional
+        Encrypted token cache shared across processes (see ``FabricClient``).
+    instrumentation : Instrumentation, optional
+        Request hooks and latency histograms (see ``FabricClient``).
+
+    Examples
+    --------
+    Deploy one model to many workspaces concurrently::
+
+        async with AsyncFabricClient() as client:
+            results = await asyncio.gather(*(
+                client.import_item(ws_id, r"C:\\exports\\MyModel.SemanticModel")
+                for ws_id in workspace_ids
+            ))
+    """
+
     def __init__(
         self,
         tenant_id: str | None = None,
         client_id: str | None = None,
         client_secret: str | None = None,
+        max_concurrency: int = config.MAX_CONCURRENCY,
+        item_cache_ttl: float = config.ITEM_CACHE_TTL,
+        item_cache_path: str | None = None,
+        workspace_cache_ttl: float = config.WORKSPACE_CACHE_TTL,
+        rate_limits: dict[str, tuple[float, float]] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        token_cache_path: str | None = None,
+        instrumentation: Instrumentation | None = None,
     ) -> None:
-        self._credential = get_credential(tenant_id, client_id, client_secret)
-        self._token_obj = None
+        super().__init__(
+            tenant_id,
+            client_id,
+            client_secret,
+            pool_maxsize=max(max_concurrency, config.POOL_MAXSIZE),
+            item_cache_ttl=item_cache_ttl,
+            item_cache_path=item_cache_path,
+            workspace_cache_ttl=workspace_cache_ttl,
+            rate_limits=rate_limits,
+            retry_policy=retry_policy,
+            token_cache_path=token_cache_path,
+            instrumentation=instrumentation,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix="msfabric",
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
 
-    @property
-    def token(self) -> str:
-        """Return a valid bearer token, refreshing automatically when near expiry."""
-        if self._token_obj is None or self._token_obj.expires_on - time.time() < 60:
-            self._token_obj = self._credential.get_token(*config.SCOPE)
-        return self._token_obj.token
+    async def _run(self, func, *args, **kwargs):
+        """Await ``func(token, *args, session=..., **kwargs)`` on the worker pool."""
+        result = await self._offload(self._call_with_token, func, *args, **kwargs)
+        if isinstance(result, Future):
+            result = await asyncio.wrap_future(result)
+        return result
+
+    async def _offload(self, func, *args, **kwargs):
+        """Await the blocking call ``func(*args, **kwargs)`` on the worker pool."""
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                functools.partial(func, *args, **kwargs),
+            )
+
+    def _call_with_token(self, func, *args, **kwargs):
+        # Resolved per request in the worker, so a token refresh never blocks
+        # the event loop and long bulk calls keep a valid token
+        return func(self.token_manager.get_token, *args, session=self.session, **kwargs)
+
+    async def close(self) -> None:
+        """Release the worker pool, the operation poller and the HTTP session."""
+        self._executor.shutdown(wait=False)
+        self.poller.close()
+        self.session.close()
+
+    async def __aenter__(self) -> "AsyncFabricClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
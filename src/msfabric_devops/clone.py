@@ -0,0 +1,249 @@
+import json
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from . import config
+from .definitions import ItemDefinition, pbir_semantic_model_id
+from .items import import_definition, rebind_pbir
+from .lro import LongRunningOperation
+
+if TYPE_CHECKING:
+    from .client import FabricClient
+
+
+def report_semantic_model_id(definition: ItemDefinition) -> str | None:
+    """Return the id of the semantic model a report definition is bound to ``byConnection``, if any."""
+    for part in definition.under("", ".pbir"):
+        semantic_model_id = pbir_semantic_model_id(json.loads(part.text))
+        if semantic_model_id:
+            return semantic_model_id
+    return None
+
+
+def _import_clone(
+    target: "FabricClient",
+    target_workspace_id: str,
+    item: dict,
+    definition: ItemDefinition,
+    display_name: str | None,
+    semantic_model_id: str | None,
+    wait: bool,
+    import_options: dict,
+) -> dict | LongRunningOperation:
+    if semantic_model_id:
+        for part in definition.under("", ".pbir"):
+            part.data = rebind_pbir(part.text, semantic_model_id)
+    return import_definition(
+        target.token_manager.get_token,
+        target_workspace_id,
+        definition,
+        display_name or item["displayName"],
+        item["type"],
+        session=target.session,
+        poller=None if wait else target.poller,
+        item_cache=target.item_cache,
+        stream=True,
+        **import_options,
+    )
+
+
+def clone_item(
+    source: "FabricClient",
+    source_workspace_id: str,
+    item_id: str,
+    target: "FabricClient",
+    target_workspace_id: str,
+    display_name: str | None = None,
+    semantic_model_id: str | None = None,
+    format: str | None = None,
+    wait: bool = True,
+    **import_options,
+) -> dict | LongRunningOperation:
+    """
+    Copy an item from one workspace to another, possibly in another tenant.
+
+    The definition exported by *source* is handed to *target* in memory:
+    nothing is written to disk, and parts are sent with the payload they
+    were received with, so only the parts that are rebound or merged are
+    decoded and re-encoded.
+
+    Parameters
+    ----------
+    source : FabricClient
+        Client authenticated against the source tenant.
+    source_workspace_id : str
+        Workspace holding the item.
+    item_id : str
+        The item to clone.
+    target : FabricClient
+        Client authenticated against the target tenant (may be *source*).
+    target_workspace_id : str
+        Destination workspace. An item with the same type and name is
+        updated, otherwise one is created.
+    display_name : str, optional
+        Name in the target workspace; defaults to the source name.
+    semantic_model_id : str, optional
+        For reports: id of the target semantic model to rebind
+        ``definition.pbir`` to (see ``rebind_pbir``).
+    format : str, optional
+        Optional definition format (e.g. ``"TMDL"``).
+    wait : bool
+        When ``False``, return a ``LongRunningOperation`` future as soon as
+        the target accepted the create/update.
+    **import_options
+        Passed to ``import_definition``, e.g. ``retain_roles=True``,
+        ``retain_partitions_tables=[...]`` or ``incremental=True``; the
+        published partitions and roles are those of the target item.
+
+    Returns
+    -------
+    dict | LongRunningOperation
+        ``{"id", "displayName", "type"}`` of the target item, as ``import_item``.
+        A report bound to a model that is not rebound keeps its source binding.
+    """
+    item = source.get_item_by_id(source_workspace_id, item_id)
+    definition = source.get_item_definition(source_workspace_id, item_id, format=format)
+    return _import_clone(target, target_workspace_id, item, definition, display_name, semantic_model_id, wait, import_options)
+
+
+def clone_items(
+    source: "FabricClient",
+    source_workspace_id: str,
+    item_ids: list[str],
+    target: "FabricClient",
+    target_workspace_id: str,
+    semantic_model_ids: dict[str, str] | None = None,
+    max_workers: int = config.CLONE_MAX_WORKERS,
+    format: str | None = None,
+    **import_options,
+) -> dict[str, dict]:
+    """
+    Clone many items concurrently.
+
+    Reports bound to a semantic model that is cloned in the same batch are
+    rebound to the model's new id: each report is exported while the models
+    are being cloned and imported as soon as its model is done. Reports bound
+    to a model outside the batch are rebound through *semantic_model_ids*
+    (source model id -> target model id) when it has an entry. When a model
+    fails, the reports bound to it are skipped; other failures are reported
+    for their item and do not stop the batch.
+
+    Parameters
+    ----------
+    source, source_workspace_id, target, target_workspace_id
+        See ``clone_item``.
+    item_ids : list[str]
+        Items of the source workspace to clone.
+    semantic_model_ids : dict[str, str], optional
+        Target ids of semantic models that are not part of the batch.
+    max_workers : int
+        Maximum number of items cloned at the same time.
+    format : str, optional
+        Optional definition format.
+    **import_options
+        Passed to every ``import_definition`` call.
+
+    Returns
+    -------
+    dict[str, dict]
+        For every source item id: ``displayName``, ``type``, ``status``
+        (``cloned``, ``failed`` or ``skipped``), ``seconds`` and either
+        ``result`` (the target item) or ``error``.
+    """
+    ids = list(dict.fromkeys(item_ids))
+    if not ids:
+        return {}
+    # One listing instead of a lookup per item
+    listed = {item["id"]: item for item in source.get_items(source_workspace_id)}
+    items = {item_id: listed[item_id] for item_id in ids if item_id in listed}
+    missing = {
+        item_id: {"displayName": None, "type": None, "status": "failed", "error": f"Item not found: {item_id}"}
+        for item_id in ids if item_id not in listed
+    }
+    model_ids = dict(semantic_model_ids or {})
+    # Models are queued before reports: when a report starts waiting for its
+    # model, every model has already been picked up by a worker
+    ordered = sorted(items, key=lambda item_id: items[item_id]["type"] == "Report")
+    futures: dict[str, Future] = {}
+
+    def clone(item_id: str) -> dict:
+        item = items[item_id]
+        summary = {"displayName": item["displayName"], "type": item["type"]}
+        started = time.perf_counter()
+        try:
+            definition = source.get_item_definition(source_workspace_id, item_id, format=format)
+            semantic_model_id = None
+            if item["type"] == "Report":
+                bound_id = report_semantic_model_id(definition)
+                if bound_id in futures:
+                    model = futures[bound_id].result()
+                    if model["status"] != "cloned":
+                        return {**summary, "status": "skipped", "error": f"Semantic model '{model['displayName']}' was not cloned"}
+                    semantic_model_id = model["result"]["id"]
+                else:
+                    semantic_model_id = model_ids.get(bound_id)
+            result = _import_clone(target, target_workspace_id, item, definition, None, semantic_model_id, True, import_options)
+        except Exception as ex:
+            config.print_color(f"Failed to clone {item['displayName']} ({item['type']}): {ex}", "red")
+            return {**summary, "status": "failed", "error": str(ex)}
+        config.print_color(f"Cloned: {item['displayName']} ({item['type']})", "green")
+        return {**summary, "status": "cloned", "result": result, "seconds": time.perf_counter() - started}
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="msfabric-clone") as executor:
+        for item_id in ordered:
+            futures[item_id] = executor.submit(clone, item_id)
+        return {item_id: missing.get(item_id) or futures[item_id].result() for item_id in ids}
+
+
+class CloneMixin:
+    """Mixin that exposes item cloning as instance methods, with the host client as source.
+
+    Requires the host class to be a ``FabricClient`` (see ``clone_item``).
+    """
+
+    def clone_item(
+        self,
+        workspace_id: str,
+        item_id: str,
+        target: "FabricClient",
+        target_workspace_id: str,
+        display_name: str | None = None,
+        semantic_model_id: str | None = None,
+        wait: bool = True,
+        **import_options,
+    ) -> dict | LongRunningOperation:
+        """Copy an item to a workspace of *target* (another client or ``self``) without touching disk."""
+        return clone_item(
+            self,
+            workspace_id,
+            item_id,
+            target,
+            target_workspace_id,
+            display_name=display_name,
+            semantic_model_id=semantic_model_id,
+            wait=wait,
+            **import_options,
+        )
+
+    def clone_items(
+        self,
+        workspace_id: str,
+        item_ids: list[str],
+        target: "FabricClient",
+        target_workspace_id: str,
+        semantic_model_ids: dict[str, str] | None = None,
+        max_workers: int = config.CLONE_MAX_WORKERS,
+        **import_options,
+    ) -> dict[str, dict]:
+        """Clone many items concurrently, rebinding reports to the models cloned with them."""
+        return clone_items(
+            self,
+            workspace_id,
+            item_ids,
+            target,
+            target_workspace_id,
+            semantic_model_ids=semantic_model_ids,
+            max_workers=max_workers,
+            **import_options,
+        )
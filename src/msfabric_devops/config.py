@@ -10,6 +10,99 @@ CLIENT_SECRET = os.getenv("CLIENT_SECRET")
 WORKSPACE_ID = os.getenv("WORKSPACE_ID")
 SEMANTIC_MODEL_ID = os.getenv("SEMANTIC_MODEL_ID")
 
+# HTTP connection pool defaults (per host, see ``api.FabricSession``)
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 10
+
+# Default number of in-flight operations for AsyncFabricClient
+MAX_CONCURRENCY = 32
+
+# Long-running operation polling (seconds), used when no Retry-After is sent
+LRO_INITIAL_DELAY = 1.0
+LRO_MAX_DELAY = 30.0
+# Threads fetching operation results and running done callbacks (``then``),
+# so that slow callbacks never delay the OperationPoller thread
+LRO_CALLBACK_WORKERS = 4
+
+# Number of files read and encoded per worker task when building item parts
+PART_BATCH_SIZE = 64
+
+# Raw bytes base64-encoded per chunk by api.StreamingDefinitionBody
+STREAM_CHUNK_SIZE = 3 * 64 * 1024
+
+# Lifetime (seconds) of a cached workspace item listing, see cache.ItemInventoryCache;
+# 0 (the default) disables the cache, so item lookups always list the workspace
+ITEM_CACHE_TTL = 0.0
+
+# Lifetime (seconds) of the cached workspace name index, see cache.WorkspaceDirectory
+WORKSPACE_CACHE_TTL = 300.0
+
+# Definition parts (fnmatch patterns) left out when incremental imports diff
+# against the published definition: the service rewrites .platform
+# (logicalId, metadata) on every import
+INCREMENTAL_IGNORED_PARTS = (".platform",)
+
+# Items imported at the same time by deploy.execute_deployment and
+# templates.deploy_template
+DEPLOY_MAX_WORKERS = 8
+
+# Workspaces created or deleted at the same time by workspaces.create_workspaces
+# and workspaces.delete_workspaces
+WORKSPACE_MAX_WORKERS = 8
+
+# Item definitions exported at the same time by snapshots.snapshot_workspace
+SNAPSHOT_MAX_WORKERS = 4
+# Age in seconds below which SnapshotStore.gc keeps unreferenced blobs, so that
+# a snapshot being saved by another process does not lose its new blobs
+SNAPSHOT_GC_GRACE = 3600.0
+
+# Items cloned at the same time by clone.clone_items
+CLONE_MAX_WORKERS = 8
+
+# Item definitions fetched at the same time by drift.scan_drift
+DRIFT_MAX_WORKERS = 16
+
+# Definition parts (fnmatch patterns) left out of drift comparisons: the
+# service rewrites .platform (logicalId, metadata) on every import
+DRIFT_IGNORED_PARTS = (".platform",)
+
+# Client-wide request budgets, (requests per second, burst) per endpoint
+# family, see throttling.RateLimiter
+RATE_LIMITS = {
+    "default": (20.0, 40),
+    "workspaces": (10.0, 20),
+    "items": (20.0, 40),
+    "definitions": (2.0, 10),
+    "operations": (10.0, 20),
+}
+
+# 429 handling: retries per request and pause (seconds, doubled per retry)
+# used when the response carries no Retry-After
+THROTTLE_MAX_RETRIES = 3
+THROTTLE_FALLBACK_DELAY = 10.0
+
+# Transient failures (connection errors, timeouts, 5xx), see retry.RetryPolicy
+RETRY_MAX_ATTEMPTS = 6
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+RETRY_DEADLINE = 300.0
+RETRY_STATUSES = frozenset({408, 500, 502, 503, 504})
+
+# Bearer tokens, see authenticate.TokenManager: a background refresh starts
+# TOKEN_REFRESH_MARGIN seconds before expiry, and callers block on a refresh
+# only once the token has less than TOKEN_MIN_VALIDITY seconds left
+TOKEN_REFRESH_MARGIN = 300.0
+TOKEN_MIN_VALIDITY = 60.0
+# Delay before a background refresh that failed or brought no newer token
+# is tried again; it doubles on every such attempt up to TOKEN_REFRESH_MARGIN
+TOKEN_REFRESH_BACKOFF = 5.0
+# Optional encrypted on-disk token cache shared by processes, and the Fernet
+# key protecting it: given directly, or read from (and created in) a key file
+# kept outside the cache directory
+TOKEN_CACHE_PATH = os.getenv("MSFABRIC_TOKEN_CACHE")
+TOKEN_CACHE_KEY = os.getenv("MSFABRIC_TOKEN_CACHE_KEY")
+TOKEN_CACHE_KEY_FILE = os.getenv("MSFABRIC_TOKEN_CACHE_KEY_FILE")
+
 
 def print_color(text, color="white", bold=False, bg=None):
     colors = {
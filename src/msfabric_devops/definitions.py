@@ -0,0 +1,296 @@
+import base64
+import hashlib
+import json
+from fnmatch import fnmatch
+from pathlib import Path, PurePosixPath
+from typing import Iterable, Iterator
+
+# Parts compared as JSON documents rather than as text
+_JSON_SUFFIXES = {".json", ".pbir", ".pbism", ".platform", ".bim"}
+# Parts compared as text, ignoring line endings and trailing whitespace
+_TEXT_SUFFIXES = {".tmdl", ".m", ".dax", ".pq", ".xml", ".txt", ".md", ".csv"}
+
+
+def pbir_semantic_model_id(document: dict) -> str | None:
+    """Return the id of the semantic model a ``definition.pbir`` document is bound to ``byConnection``, if any."""
+    reference = (document.get("datasetReference") or {}).get("byConnection") or {}
+    for field in (reference.get("connectionString") or "").split(";"):
+        key, _, value = field.partition("=")
+        if key.strip().lower() == "semanticmodelid" and value.strip():
+            return value.strip()
+    return reference.get("pbiModelDatabaseName") or None
+
+
+def normalize_part(path: str, data: bytes, keep_binding: bool = False) -> bytes:
+    """
+    Return the content of a definition part with service-injected noise removed.
+
+    The UTF-8 BOM is dropped; JSON parts are re-serialized with sorted keys
+    and no whitespace (``definition.pbir`` without its ``datasetReference``
+    and ``$schema``, which ``rebind_pbir`` rewrites per workspace); text
+    parts get ``\\n`` line endings and no trailing whitespace. Other parts
+    are returned unchanged.
+
+    With ``keep_binding=True`` the ``datasetReference`` of a
+    ``definition.pbir`` is reduced to the id of the semantic model it is
+    bound to instead of being dropped, so that rebinding a report to
+    another model still counts as a change.
+    """
+    # Dot files such as .platform have no suffix and are matched by name
+    suffix = PurePosixPath(path).suffix.lower() or PurePosixPath(path).name.lower()
+    if suffix not in _JSON_SUFFIXES and suffix not in _TEXT_SUFFIXES:
+        return data
+    if data.startswith(b"\xef\xbb\xbf"):
+        data = data[3:]
+    if suffix in _JSON_SUFFIXES:
+        try:
+            document = json.loads(data)
+        except ValueError:
+            return data
+        if suffix == ".pbir" and isinstance(document, dict):
+            semantic_model_id = pbir_semantic_model_id(document) if keep_binding else None
+            document.pop("datasetReference", None)
+            document.pop("$schema", None)
+            if semantic_model_id:
+                document["datasetReference"] = semantic_model_id.lower()
+        return json.dumps(document, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return data
+    lines = [line.rstrip() for line in text.replace("\r\n", "\n").split("\n")]
+    return "\n".join(lines).rstrip("\n").encode("utf-8")
+
+
+def is_ignored_part(path: str, ignore_parts: tuple[str, ...]) -> bool:
+    """Return ``True`` if *path* matches one of the fnmatch patterns in *ignore_parts*."""
+    return any(fnmatch(path, pattern) for pattern in ignore_parts)
+
+
+class DefinitionPart:
+    """
+    One file of an item definition.
+
+    The content is kept in whichever form it arrived in (a base64 payload
+    from the API, raw bytes, or a ``Path`` still on disk) and converted on
+    first use only: a payload is decoded at most once, and the base64
+    payload is re-encoded only after the content has been modified.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file inside the definition, e.g. ``definition/model.tmdl``.
+    payload : str, optional
+        Base64-encoded content.
+    payload_type : str
+        Fabric payload type, ``InlineBase64`` for every file-based item.
+    data : bytes or pathlib.Path, optional
+        Raw content, or a file read on demand (never cached, so that large
+        definitions streamed from disk are not held in memory).
+    """
+
+    __slots__ = ("path", "payload_type", "_payload", "_data", "_sha256")
+
+    def __init__(
+        self,
+        path: str,
+        payload: str | None = None,
+        payload_type: str = "InlineBase64",
+        data: bytes | Path | None = None,
+    ) -> None:
+        if payload is None and data is None:
+            raise ValueError(f"Definition part {path!r} has neither payload nor data")
+        self.path = path
+        self.payload_type = payload_type
+        self._payload = payload
+        # Stored immutable so that ``data`` can hand it out without a copy
+        self._data = data if data is None or isinstance(data, (bytes, Path)) else bytes(data)
+        self._sha256 = None
+
+    @classmethod
+    def from_dict(cls, part: dict) -> "DefinitionPart":
+        """Build a part from an API part (``path``/``payload``) or a request part (``Path``/``Payload``)."""
+        if "Path" in part:
+            path, payload, payload_type = part["Path"], part["Payload"], part.get("PayloadType")
+        else:
+            path, payload, payload_type = part["path"], part.get("payload"), part.get("payloadType")
+        payload_type = payload_type or "InlineBase64"
+        if isinstance(payload, str):
+            return cls(path, payload=payload, payload_type=payload_type)
+        return cls(path, payload_type=payload_type, data=payload)
+
+    @property
+    def data(self) -> bytes:
+        """Raw content, decoded from the payload on first access."""
+        if isinstance(self._data, Path):
+            return self._data.read_bytes()
+        if self._data is None:
+            self._data = base64.b64decode(self._payload)
+        return self._data
+
+    @data.setter
+    def data(self, value: bytes) -> None:
+        self._data = value if isinstance(value, bytes) else bytes(value)
+        self._payload = None
+        self._sha256 = None
+
+    @property
+    def text(self) -> str:
+        """Content decoded as UTF-8."""
+        return self.data.decode("utf-8")
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self.data = value.encode("utf-8")
+
+    @property
+    def payload(self) -> str:
+        """Base64 payload, encoded on first access after a modification."""
+        if self._payload is None:
+            self._payload = base64.b64encode(self.data).decode("ascii")
+        return self._payload
+
+    @property
+    def sha256(self) -> str:
+        """SHA-256 of the content, computed once."""
+        if self._sha256 is None:
+            self._sha256 = hashlib.sha256(self.data).hexdigest()
+        return self._sha256
+
+    def copy(self) -> "DefinitionPart":
+        part = DefinitionPart(self.path, self._payload, self.payload_type, self._data)
+        part._sha256 = self._sha256
+        return part
+
+    def to_request(self, encode: bool = True) -> dict:
+        """
+        Return the part as sent to ``createItem``/``updateDefinition``.
+
+        With ``encode=False`` content that was never encoded is left as raw
+        bytes or a ``Path`` for ``api.StreamingDefinitionBody`` to encode
+        while streaming.
+        """
+        payload = self._payload
+        if payload is None:
+            payload = self.payload if encode else self._data
+        return {"Path": self.path, "Payload": payload, "PayloadType": self.payload_type}
+
+    def to_dict(self) -> dict:
+        """Return the part in the shape of a ``getDefinition`` response."""
+        return {"path": self.path, "payload": self.payload, "payloadType": self.payload_type}
+
+    def __repr__(self) -> str:
+        return f"DefinitionPart({self.path!r}, payload_type={self.payload_type!r})"
+
+
+class ItemDefinition:
+    """
+    The parts of an item definition, indexed by path.
+
+    Parts keep their insertion order; lookups, replacements and removals
+    by path are O(1). Iterating yields ``DefinitionPart`` objects.
+
+    Parameters
+    ----------
+    parts : iterable of DefinitionPart, optional
+        Initial parts; a later part replaces an earlier one with the same path.
+    format : str, optional
+        Definition format reported by the service (e.g. ``TMDL``).
+    """
+
+    __slots__ = ("_parts", "format")
+
+    def __init__(self, parts: Iterable[DefinitionPart] = (), format: str | None = None) -> None:
+        self._parts = {part.path: part for part in parts}
+        self.format = format
+
+    @classmethod
+    def from_response(cls, response: dict | None) -> "ItemDefinition":
+        """Build a definition from a ``getDefinition`` response; nothing is decoded yet."""
+        definition = (response or {}).get("definition") or {}
+        return cls(
+            (DefinitionPart.from_dict(part) for part in definition.get("parts", [])),
+            format=definition.get("format"),
+        )
+
+    @classmethod
+    def from_parts(cls, parts: Iterable[dict]) -> "ItemDefinition":
+        """Build a definition from request parts (``Path``/``Payload``/``PayloadType``)."""
+        return cls(DefinitionPart.from_dict(part) for part in parts)
+
+    def __iter__(self) -> Iterator[DefinitionPart]:
+        return iter(list(self._parts.values()))
+
+    def __len__(self) -> int:
+        return len(self._parts)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._parts
+
+    def __getitem__(self, path: str) -> DefinitionPart:
+        return self._parts[path]
+
+    def get(self, path: str, default=None) -> DefinitionPart | None:
+        return self._parts.get(path, default)
+
+    def paths(self) -> list[str]:
+        return list(self._parts)
+
+    def under(self, prefix: str, suffix: str = "") -> list[DefinitionPart]:
+        """Return the parts whose path starts with *prefix* and ends with *suffix*."""
+        return [
+            part for path, part in self._parts.items()
+            if path.startswith(prefix) and path.endswith(suffix)
+        ]
+
+    def add(self, part: DefinitionPart) -> DefinitionPart:
+        """Add *part*, replacing (in place) any part with the same path."""
+        self._parts[part.path] = part
+        return part
+
+    def set(self, path: str, content: bytes | str) -> DefinitionPart:
+        """Set the content of the part at *path*, creating it if needed."""
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        part = self._parts.get(path)
+        if part is None:
+            return self.add(DefinitionPart(path, data=data))
+        part.data = data
+        return part
+
+    def remove(self, path: str) -> DefinitionPart | None:
+        return self._parts.pop(path, None)
+
+    def hashes(self) -> dict[str, str]:
+        """Return the SHA-256 of each inline part's content, keyed by path."""
+        return {
+            path: part.sha256
+            for path, part in self._parts.items()
+            if part.payload_type == "InlineBase64"
+        }
+
+    def normalized_hashes(self, ignore_parts: tuple[str, ...] = (), keep_binding: bool = False) -> dict[str, str]:
+        """
+        Return the SHA-256 of each inline part's normalized content, keyed by path.
+
+        Parts matching *ignore_parts* are left out; see ``normalize_part``
+        for what is normalized and for *keep_binding*.
+        """
+        return {
+            path: hashlib.sha256(normalize_part(path, part.data, keep_binding)).hexdigest()
+            for path, part in self._parts.items()
+            if part.payload_type == "InlineBase64" and not is_ignored_part(path, ignore_parts)
+        }
+
+    def to_parts(self, encode: bool = True) -> list[dict]:
+        """Return the request parts (see ``DefinitionPart.to_request``)."""
+        return [part.to_request(encode) for part in self._parts.values()]
+
+    def to_dict(self) -> dict:
+        """Return the definition in the shape of a ``getDefinition`` response."""
+        definition = {"parts": [part.to_dict() for part in self._parts.values()]}
+        if self.format:
+            definition["format"] = self.format
+        return {"definition": definition}
+
+    def __repr__(self) -> str:
+        return f"ItemDefinition({len(self._parts)} parts, format={self.format!r})"
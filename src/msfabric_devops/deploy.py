@@ -0,0 +1,319 @@
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable
+
+import requests
+
+from . import config
+from .cache import ItemInventoryCache
+from .exceptions import FabricError
+from .items import get_items, import_item
+
+# Folder suffixes of the PBIP items the planner knows how to deploy
+ITEM_FOLDER_TYPES = {
+    ".semanticmodel": "SemanticModel",
+    ".report": "Report",
+}
+
+
+class DeploymentPlan:
+    """
+    Items of a PBIP repository and the dependencies between them.
+
+    A report whose ``definition.pbir`` references a semantic model folder
+    ``byPath`` depends on that model: it is deployed after it and rebound
+    to the id the model received in the workspace.
+
+    Attributes
+    ----------
+    root : Path
+        Repository folder that was scanned.
+    items : dict[str, dict]
+        Items keyed by folder path. Each item holds ``path``, ``type``,
+        ``displayName`` and ``dependsOn`` (folder paths).
+    """
+
+    def __init__(self, root: Path, items: dict[str, dict]) -> None:
+        self.root = root
+        self.items = items
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def dependents(self) -> dict[str, list[str]]:
+        """Return, for every item, the items that depend on it."""
+        result: dict[str, list[str]] = {path: [] for path in self.items}
+        for path, item in self.items.items():
+            for dependency in item["dependsOn"]:
+                result[dependency].append(path)
+        return result
+
+    def waves(self) -> list[list[str]]:
+        """
+        Group the items into waves that only depend on earlier waves.
+
+        The number of waves is the length of the critical path.
+
+        Raises
+        ------
+        FabricError
+            If the dependencies contain a cycle.
+        """
+        dependents = self.dependents()
+        remaining = {path: len(item["dependsOn"]) for path, item in self.items.items()}
+        wave = sorted(path for path, count in remaining.items() if count == 0)
+        waves = []
+        while wave:
+            waves.append(wave)
+            next_wave = []
+            for path in wave:
+                for dependent in dependents[path]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        next_wave.append(dependent)
+            wave = sorted(next_wave)
+        if sum(len(wave) for wave in waves) != len(self.items):
+            raise FabricError("Deployment plan has a dependency cycle")
+        return waves
+
+
+def _item_type(folder: Path) -> str | None:
+    item_type = ITEM_FOLDER_TYPES.get(folder.suffix.lower())
+    platform_file = folder / ".platform"
+    if platform_file.is_file():
+        with open(platform_file, "r", encoding="utf-8") as f:
+            item_type = json.load(f).get("metadata", {}).get("type", item_type)
+    return item_type
+
+
+def _display_name(folder: Path) -> str:
+    platform_file = folder / ".platform"
+    if platform_file.is_file():
+        with open(platform_file, "r", encoding="utf-8") as f:
+            display_name = json.load(f).get("metadata", {}).get("displayName")
+        if display_name:
+            return display_name
+    return folder.stem
+
+
+def _report_dependency(folder: Path) -> Path | None:
+    """Return the semantic model folder a report references ``byPath``, if any."""
+    pbir_file = folder / "definition.pbir"
+    if not pbir_file.is_file():
+        return None
+    with open(pbir_file, "r", encoding="utf-8") as f:
+        pbir_json = json.load(f)
+    by_path = (pbir_json.get("datasetReference") or {}).get("byPath") or {}
+    if not by_path.get("path"):
+        return None
+    return (folder / by_path["path"]).resolve()
+
+
+def find_item_folders(root: str) -> list[dict]:
+    """
+    Return the ``*.SemanticModel`` and ``*.Report`` folders under *root*
+    (searched recursively), sorted by path, as ``{"path", "type",
+    "displayName"}`` read from their ``.platform`` file when present.
+    """
+    root_path = Path(root).resolve()
+    return [
+        {"path": str(folder), "type": _item_type(folder), "displayName": _display_name(folder)}
+        for folder in sorted(
+            folder for folder in root_path.rglob("*")
+            if folder.is_dir() and folder.suffix.lower() in ITEM_FOLDER_TYPES
+        )
+    ]
+
+
+def plan_deployment(root: str) -> DeploymentPlan:
+    """
+    Scan *root* for ``*.SemanticModel`` and ``*.Report`` folders and build
+    their dependency graph from the ``datasetReference`` of each ``.pbir``.
+
+    Parameters
+    ----------
+    root : str
+        Folder containing the PBIP item folders (searched recursively).
+
+    Returns
+    -------
+    DeploymentPlan
+
+    Raises
+    ------
+    FabricError
+        If a report references a semantic model folder that is not part of
+        the repository, or the dependencies contain a cycle.
+    """
+    root_path = Path(root).resolve()
+    items: dict[str, dict] = {
+        folder["path"]: {**folder, "dependsOn": []}
+        for folder in find_item_folders(root)
+    }
+
+    for path, item in items.items():
+        if item["type"] != "Report":
+            continue
+        dependency = _report_dependency(Path(path))
+        if dependency is None:
+            continue
+        if str(dependency) not in items:
+            raise FabricError(
+                f"Report '{item['displayName']}' references '{dependency}', "
+                "which is not a semantic model folder of the repository"
+            )
+        item["dependsOn"].append(str(dependency))
+
+    plan = DeploymentPlan(root_path, items)
+    plan.waves()
+    return plan
+
+
+def execute_deployment(
+    token: str | Callable[[], str],
+    workspace_id: str,
+    plan: DeploymentPlan,
+    max_workers: int = config.DEPLOY_MAX_WORKERS,
+    import_options: dict | None = None,
+    session: requests.Session | None = None,
+    item_cache: ItemInventoryCache | None = None,
+) -> dict[str, dict]:
+    """
+    Deploy every item of *plan* to a workspace, running independent items
+    concurrently.
+
+    An item starts as soon as all of its dependencies have been deployed,
+    so the total time follows the critical path of the graph rather than
+    the sum of all imports. Reports are rebound to the id their semantic
+    model received. When an item fails, the items depending on it are
+    skipped and the others continue.
+
+    Parameters
+    ----------
+    token : str or callable
+        A valid bearer access token, or a callable returning one for each
+        request so long runs pick up refreshed tokens.
+    workspace_id : str
+        Destination workspace ID.
+    plan : DeploymentPlan
+        Plan returned by ``plan_deployment``.
+    max_workers : int
+        Maximum number of items imported at the same time.
+    import_options : dict, optional
+        Extra keyword arguments passed to every ``import_item`` call, e.g.
+        ``{"incremental": True, "retain_roles": True}``. An
+        ``item_properties`` entry is merged into the properties computed
+        per item; ``displayName`` and ``semanticModelId`` come from the plan.
+    session : requests.Session, optional
+        Pooled HTTP session to reuse connections.
+    item_cache : ItemInventoryCache, optional
+        Inventory shared by the imports; the workspace is listed once up front.
+
+    Returns
+    -------
+    dict[str, dict]
+        For every item folder: ``path``, ``type``, ``displayName``,
+        ``status`` (``deployed``, ``failed`` or ``skipped``), ``seconds`` and
+        either ``result`` (the ``import_item`` result) or ``error``.
+    """
+    import_options = dict(import_options or {})
+    shared_properties = import_options.pop("item_properties", None) or {}
+    dependents = plan.dependents()
+    remaining = {path: len(item["dependsOn"]) for path, item in plan.items.items()}
+    deployed_ids: dict[str, str] = {}
+    results: dict[str, dict] = {}
+
+    if item_cache is not None and plan.items:
+        get_items(token, workspace_id, session=session, item_cache=item_cache)
+
+    def deploy(path: str) -> dict:
+        item = plan.items[path]
+        item_properties = {**shared_properties, "displayName": item["displayName"]}
+        if item["dependsOn"]:
+            item_properties["semanticModelId"] = deployed_ids[item["dependsOn"][0]]
+        started = time.perf_counter()
+        result = import_item(
+            token,
+            workspace_id,
+            path,
+            item_properties=item_properties,
+            session=session,
+            item_cache=item_cache,
+            **import_options,
+        )
+        return {"result": result, "seconds": time.perf_counter() - started}
+
+    def skip(path: str, reason: str) -> None:
+        for dependent in dependents[path]:
+            if dependent not in results:
+                results[dependent] = {**_summary(plan.items[dependent]), "status": "skipped", "error": reason}
+                skip(dependent, reason)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="msfabric-deploy") as executor:
+        running: dict[Future, str] = {}
+
+        def submit(path: str) -> None:
+            running[executor.submit(deploy, path)] = path
+
+        for path in sorted(path for path, count in remaining.items() if count == 0):
+            submit(path)
+
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = running.pop(future)
+                item = plan.items[path]
+                try:
+                    outcome = future.result()
+                except Exception as ex:
+                    results[path] = {**_summary(item), "status": "failed", "error": str(ex)}
+                    config.print_color(f"Failed: {item['displayName']} ({item['type']}): {ex}", "red")
+                    skip(path, f"Dependency '{item['displayName']}' failed")
+                    continue
+
+                results[path] = {**_summary(item), "status": "deployed", **outcome}
+                deployed_ids[path] = outcome["result"]["id"]
+                config.print_color(f"Deployed: {item['displayName']} ({item['type']})", "green")
+                for dependent in dependents[path]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0 and dependent not in results:
+                        submit(dependent)
+
+    return {path: results[path] for path in plan.items}
+
+
+def _summary(item: dict) -> dict:
+    return {"path": item["path"], "type": item["type"], "displayName": item["displayName"]}
+
+
+class DeployMixin:
+    """Mixin that exposes repository deployment as instance methods.
+
+    Requires the host class to provide a ``token_manager`` attribute (whose
+    ``get_token`` is called per request), a ``session`` attribute and an
+    ``item_cache`` attribute (see ``ItemsMixin``).
+    """
+
+    def deploy_plan(self, root: str) -> DeploymentPlan:
+        """Scan a PBIP repository and return its dependency-ordered deployment plan."""
+        return plan_deployment(root)
+
+    def deploy_folder(
+        self,
+        workspace_id: str,
+        root: str,
+        max_workers: int = config.DEPLOY_MAX_WORKERS,
+        import_options: dict | None = None,
+    ) -> dict[str, dict]:
+        """Deploy every semantic model and report under *root*, dependencies first."""
+        return execute_deployment(
+            self.token_manager.get_token,
+            workspace_id,
+            plan_deployment(root),
+            max_workers=max_workers,
+            import_options=import_options,
+            session=self.session,
+            item_cache=self.item_cache,
+        )
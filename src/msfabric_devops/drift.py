@@ -0,0 +1,243 @@
+import hashlib
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable
+
+import requests
+
+from . import config
+from .cache import ItemInventoryCache
+from .definitions import ItemDefinition, is_ignored_part, normalize_part
+from .deploy import find_item_folders
+from .items import get_item_definition, get_items, list_item_files
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_local_items(root: str, ignore_parts: tuple[str, ...] = config.DRIFT_IGNORED_PARTS) -> dict[str, dict]:
+    """
+    Hash the parts of every PBIP item folder under *root*.
+
+    Returns
+    -------
+    dict[str, dict]
+        Keyed by item folder relative to *root*: ``type``, ``displayName``
+        and ``parts``, mapping each part path to the SHA-256 of its raw and
+        of its normalized content (see ``normalize_part``).
+    """
+    root_path = Path(root).resolve()
+    items = {}
+    for folder in find_item_folders(root):
+        path = Path(folder["path"])
+        parts = {}
+        for file in list_item_files(path):
+            part_path = file.relative_to(path).as_posix()
+            if is_ignored_part(part_path, ignore_parts):
+                continue
+            data = file.read_bytes()
+            parts[part_path] = (_digest(data), _digest(normalize_part(part_path, data)))
+        items[path.relative_to(root_path).as_posix()] = {
+            "type": folder["type"],
+            "displayName": folder["displayName"],
+            "parts": parts,
+        }
+    return items
+
+
+def compare_definition(
+    local_parts: dict[str, tuple[str, str]],
+    definition: ItemDefinition,
+    ignore_parts: tuple[str, ...] = config.DRIFT_IGNORED_PARTS,
+) -> dict[str, str]:
+    """
+    Compare a published definition with the part hashes of ``hash_local_items``.
+
+    A part whose raw content matches is not normalized. Returns the parts
+    that differ, by path, as ``modified``, ``missing`` (only in the
+    repository) or ``extra`` (only in the workspace).
+    """
+    changes = {}
+    seen = set()
+    for part in definition:
+        if part.payload_type != "InlineBase64" or is_ignored_part(part.path, ignore_parts):
+            continue
+        seen.add(part.path)
+        expected = local_parts.get(part.path)
+        if expected is None:
+            changes[part.path] = "extra"
+        elif part.sha256 != expected[0] and _digest(normalize_part(part.path, part.data)) != expected[1]:
+            changes[part.path] = "modified"
+    for path in local_parts.keys() - seen:
+        changes[path] = "missing"
+    return dict(sorted(changes.items()))
+
+
+def scan_drift(
+    token: str | Callable[[], str],
+    workspace_ids: list[str],
+    root: str,
+    ignore_parts: tuple[str, ...] = config.DRIFT_IGNORED_PARTS,
+    max_workers: int = config.DRIFT_MAX_WORKERS,
+    session: requests.Session | None = None,
+    item_cache: ItemInventoryCache | None = None,
+) -> dict:
+    """
+    Compare the items of a PBIP repository with their copies in many workspaces.
+
+    The repository is hashed once. Workspaces are listed concurrently and,
+    as each listing arrives, the definitions of the repository items found
+    in it are fetched by the same worker pool, so listings and downloads
+    overlap. Requests go through *session*, so a rate-limited
+    ``FabricSession`` keeps the scan within its budget. Items are matched
+    by type and display name; workspace items that are not in the
+    repository are ignored. Definitions are hashed and discarded as they
+    arrive.
+
+    Parameters
+    ----------
+    token : str or callable
+        A valid bearer access token, or a callable returning one for each
+        request so long runs pick up refreshed tokens.
+    workspace_ids : list[str]
+        Workspaces to scan.
+    root : str
+        Repository folder containing the PBIP item folders.
+    ignore_parts : tuple[str, ...]
+        ``fnmatch`` patterns of part paths to leave out of the comparison,
+        e.g. ``("*.platform", "definition/expressions.tmdl")`` when
+        parameters differ per workspace.
+    max_workers : int
+        Maximum number of requests in flight.
+    session : requests.Session, optional
+        Pooled HTTP session to reuse connections.
+    item_cache : ItemInventoryCache, optional
+        Inventory used to list the workspaces.
+
+    Returns
+    -------
+    dict
+        ``{"workspaces": {workspace_id: {"status", "error", "items"}}, "summary"}``.
+        A workspace is ``in_sync``, ``drifted`` or ``failed`` (not listed).
+        ``items`` is keyed by item folder and holds ``type``,
+        ``displayName``, ``itemId`` and ``status``: ``in_sync``, ``drifted``
+        (with ``parts``, see ``compare_definition``), ``missing`` (not in
+        the workspace) or ``failed`` (with ``error``). ``summary`` counts
+        workspaces and items per status and reports the elapsed ``seconds``.
+    """
+    started = time.perf_counter()
+    local = hash_local_items(root, ignore_parts)
+    ids = list(dict.fromkeys(workspace_ids))
+    workspaces = {
+        workspace_id: {"status": "in_sync", "error": None, "items": {}}
+        for workspace_id in ids
+    }
+
+    def compare(workspace_id: str, key: str, remote: dict) -> dict:
+        definition = get_item_definition(token, workspace_id, remote["id"], session=session)
+        changes = compare_definition(local[key]["parts"], definition, ignore_parts)
+        return {"status": "drifted", "parts": changes} if changes else {"status": "in_sync"}
+
+    def listed(workspace_id: str, items: list[dict]) -> dict[str, dict]:
+        by_key = {(item["type"].lower(), item["displayName"].lower()): item for item in items}
+        found = {}
+        for key, item in local.items():
+            remote = by_key.get((str(item["type"]).lower(), item["displayName"].lower()))
+            summary = {"type": item["type"], "displayName": item["displayName"], "itemId": remote["id"] if remote else None}
+            workspaces[workspace_id]["items"][key] = {**summary, "status": "missing"}
+            if remote is not None:
+                found[key] = remote
+        return found
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="msfabric-drift") as executor:
+        running: dict[Future, tuple] = {
+            executor.submit(get_items, token, workspace_id, session=session, item_cache=item_cache): (workspace_id, None)
+            for workspace_id in ids
+        }
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                workspace_id, key = running.pop(future)
+                workspace = workspaces[workspace_id]
+                try:
+                    result = future.result()
+                except Exception as ex:
+                    if key is None:
+                        workspace.update(status="failed", error=str(ex))
+                    else:
+                        workspace["items"][key].update(status="failed", error=str(ex))
+                    continue
+                if key is None:
+                    for item_key, remote in listed(workspace_id, result).items():
+                        running[executor.submit(compare, workspace_id, item_key, remote)] = (workspace_id, item_key)
+                else:
+                    workspace["items"][key].update(result)
+
+    item_counts = {"in_sync": 0, "drifted": 0, "missing": 0, "failed": 0}
+    for workspace in workspaces.values():
+        workspace["items"] = dict(sorted(workspace["items"].items()))
+        for item in workspace["items"].values():
+            item_counts[item["status"]] += 1
+        if workspace["status"] != "failed" and any(item["status"] != "in_sync" for item in workspace["items"].values()):
+            workspace["status"] = "drifted"
+
+    return {
+        "workspaces": workspaces,
+        "summary": {
+            "workspaces": len(workspaces),
+            "drifted": sum(workspace["status"] == "drifted" for workspace in workspaces.values()),
+            "failed": sum(workspace["status"] == "failed" for workspace in workspaces.values()),
+            "items": item_counts,
+            "seconds": time.perf_counter() - started,
+        },
+    }
+
+
+def format_drift_report(report: dict) -> str:
+    """Render a ``scan_drift`` report as text, one line per workspace and per item that is not in sync."""
+    lines = []
+    for workspace_id, workspace in report["workspaces"].items():
+        if workspace["status"] == "failed":
+            lines.append(f"{workspace_id}: failed ({workspace['error']})")
+            continue
+        items = workspace["items"]
+        off = {key: item for key, item in items.items() if item["status"] != "in_sync"}
+        lines.append(f"{workspace_id}: {workspace['status']} ({len(off)} of {len(items)} items)")
+        for key, item in off.items():
+            detail = item.get("error") or ", ".join(f"{path} {change}" for path, change in item.get("parts", {}).items())
+            lines.append(f"  {key}: {item['status']}" + (f" - {detail}" if detail else ""))
+    summary = report["summary"]
+    lines.append(
+        f"{summary['drifted']} of {summary['workspaces']} workspaces drifted, {summary['failed']} failed "
+        f"in {summary['seconds']:.1f}s"
+    )
+    return "\n".join(lines)
+
+
+class DriftMixin:
+    """Mixin that exposes drift detection as instance methods.
+
+    Requires the host class to provide a ``token_manager`` attribute (whose
+    ``get_token`` is called per request), a ``session`` attribute and an
+    ``item_cache`` attribute (see ``ItemsMixin``).
+    """
+
+    def scan_drift(
+        self,
+        workspace_ids: list[str],
+        root: str,
+        ignore_parts: tuple[str, ...] = config.DRIFT_IGNORED_PARTS,
+        max_workers: int = config.DRIFT_MAX_WORKERS,
+    ) -> dict:
+        """Compare a PBIP repository with many workspaces and return a per-workspace/item/part report."""
+        return scan_drift(
+            self.token_manager.get_token,
+            workspace_ids,
+            root,
+            ignore_parts=ignore_parts,
+            max_workers=max_workers,
+            session=self.session,
+            item_cache=self.item_cache,
+        )
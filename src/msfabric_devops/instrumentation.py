@@ -0,0 +1,479 @@
+import bisect
+import json
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+from urllib.parse import urlparse
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .throttling import endpoint_family
+
+_GUID = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE)
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is open
+HISTOGRAM_BOUNDS = (
+    0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5,
+    1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0,
+)
+
+PHASES = ("connect", "ttfb", "body", "duration")
+
+
+def endpoint_template(url: str) -> str:
+    """Return the path of *url* with ids replaced by ``{id}``, e.g. ``/v1/workspaces/{id}/items``."""
+    return _GUID.sub("{id}", urlparse(url).path.rstrip("/")) or "/"
+
+
+# Seconds spent opening connections by the current thread, see _TimedConnectionMixin
+_connect_time = threading.local()
+
+
+class _TimedConnectionMixin:
+    def connect(self) -> None:
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_time.seconds = getattr(_connect_time, "seconds", 0.0) + time.perf_counter() - started
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """``HTTPAdapter`` whose connections report the time spent in TCP/TLS setup."""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+def reset_connect_time() -> None:
+    """Start measuring connection setup time for the current thread."""
+    _connect_time.seconds = 0.0
+
+
+def connect_time() -> float:
+    """Seconds spent opening connections by the current thread since ``reset_connect_time``."""
+    return getattr(_connect_time, "seconds", 0.0)
+
+
+class RequestRecord:
+    """
+    One instrumented event.
+
+    ``kind`` is ``request`` for an HTTP exchange, ``retry`` for the backoff
+    before a transient failure is sent again, ``throttle`` for a 429 pause
+    and ``lro_wait`` for the time a long-running operation took to finish
+    after its 202 response.
+
+    Attributes
+    ----------
+    kind : str
+    method : str
+    url : str
+    endpoint : str
+        Path with ids replaced by ``{id}`` (see ``endpoint_template``).
+    family : str
+        Rate-limit family of the endpoint.
+    status : int or None
+        HTTP status (final operation status code for ``lro_wait``).
+    error : str or None
+        Exception raised by the request, if any.
+    start_time : float
+        Wall-clock start (``time.time()``).
+    duration : float
+        Seconds from start to end of the event.
+    connect, ttfb, body : float or None
+        Phases of a request: connection setup, time to the response headers
+        and time to read the body (``None`` for streamed responses).
+    bytes_sent, bytes_received : int
+        Request and response body sizes (on the wire, before gzip decoding).
+    attributes : dict
+        Extra details, e.g. ``attempt`` and ``delay`` for retries or
+        ``polls`` and ``operationStatus`` for operations.
+    """
+
+    __slots__ = (
+        "kind", "method", "url", "endpoint", "family", "status", "error",
+        "start_time", "duration", "connect", "ttfb", "body",
+        "bytes_sent", "bytes_received", "attributes",
+    )
+
+    def __init__(
+        self,
+        kind: str,
+        method: str,
+        url: str,
+        start_time: float,
+        duration: float,
+        status: int | None = None,
+        error: str | None = None,
+        connect: float | None = None,
+        ttfb: float | None = None,
+        body: float | None = None,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        attributes: dict | None = None,
+    ) -> None:
+        self.kind = kind
+        self.method = method.upper()
+        self.url = url
+        self.endpoint = endpoint_template(url)
+        self.family = endpoint_family(method, url)
+        self.status = status
+        self.error = error
+        self.start_time = start_time
+        self.duration = duration
+        self.connect = connect
+        self.ttfb = ttfb
+        self.body = body
+        self.bytes_sent = bytes_sent
+        self.bytes_received = bytes_received
+        self.attributes = attributes or {}
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"RequestRecord({self.kind} {self.method} {self.endpoint} {self.status} {self.duration:.3f}s)"
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram (see ``HISTOGRAM_BOUNDS``).
+
+    Percentiles are estimated as the upper bound of the bucket holding the
+    requested rank, which is enough to tell a 50 ms endpoint from a 5 s one
+    without keeping every sample.
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(HISTOGRAM_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """Return the estimated *q* quantile (``0 < q <= 1``) in seconds."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return HISTOGRAM_BOUNDS[index] if index < len(HISTOGRAM_BOUNDS) else self.max
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+            "max": self.max,
+        }
+
+
+class MemorySink:
+    """Keep the last *maxlen* records in memory (all of them when ``None``)."""
+
+    def __init__(self, maxlen: int | None = None) -> None:
+        self.records: deque[RequestRecord] = deque(maxlen=maxlen)
+
+    def emit(self, record: RequestRecord) -> None:
+        self.records.append(record)
+
+    def clear(self) -> None:
+        self.records.clear()
+
+
+class JsonLinesSink:
+    """Append every record as one JSON object per line to *path*."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def emit(self, record: RequestRecord) -> None:
+        line = json.dumps(record.to_dict())
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class OpenTelemetrySink:
+    """
+    Export records as OpenTelemetry spans.
+
+    Spans use the HTTP semantic convention attribute names and carry the
+    phase timings as ``msfabric.*`` attributes. Requires the optional
+    ``opentelemetry-api`` package; without a configured SDK the spans are
+    no-ops.
+
+    Parameters
+    ----------
+    tracer : opentelemetry.trace.Tracer, optional
+        Tracer to use (default ``trace.get_tracer("msfabric_devops")``).
+    """
+
+    def __init__(self, tracer=None) -> None:
+        if tracer is None:
+            try:
+                from opentelemetry import trace  # type: ignore
+            except ImportError as ex:
+                raise ImportError(
+                    "OpenTelemetrySink requires the 'opentelemetry-api' package: "
+                    "pip install opentelemetry-api"
+                ) from ex
+            tracer = trace.get_tracer("msfabric_devops")
+        self.tracer = tracer
+
+    def emit(self, record: RequestRecord) -> None:
+        start_ns = int(record.start_time * 1e9)
+        attributes = {
+            "http.request.method": record.method,
+            "url.full": record.url,
+            "url.template": record.endpoint,
+            "msfabric.kind": record.kind,
+            "msfabric.family": record.family,
+            "msfabric.bytes_sent": record.bytes_sent,
+            "msfabric.bytes_received": record.bytes_received,
+        }
+        if record.status is not None:
+            attributes["http.response.status_code"] = record.status
+        if record.error is not None:
+            attributes["error.type"] = record.error
+        for phase in ("connect", "ttfb", "body"):
+            value = getattr(record, phase)
+            if value is not None:
+                attributes[f"msfabric.{phase}_seconds"] = value
+        for name, value in record.attributes.items():
+            if isinstance(value, (str, bool, int, float)):
+                attributes[f"msfabric.{name}"] = value
+        span = self.tracer.start_span(
+            f"{record.method} {record.endpoint}" if record.kind == "request" else f"{record.kind} {record.endpoint}",
+            start_time=start_ns,
+            attributes=attributes,
+        )
+        span.end(end_time=start_ns + int(record.duration * 1e9))
+
+
+class Instrumentation:
+    """
+    Request hooks, latency histograms and counters of a client.
+
+    Disabled until it is enabled explicitly or a hook or sink is added.
+    While disabled the session skips all timing, so the cost per request
+    is one attribute check.
+
+    Each HTTP exchange of the session (retries, throttled attempts and LRO
+    polls included) produces a ``RequestRecord``. Its connect, TTFB, body
+    and total times are added to per-endpoint histograms, and the record is
+    passed to the *after* hooks and to every sink.
+
+    Parameters
+    ----------
+    sinks : list, optional
+        Objects with an ``emit(record)`` method, e.g. ``MemorySink``,
+        ``JsonLinesSink`` or ``OpenTelemetrySink``.
+    enabled : bool, optional
+        Start enabled. Defaults to ``True`` when *sinks* are given.
+
+    Examples
+    --------
+    ::
+
+        client = FabricClient()
+        client.instrumentation.enable()
+        client.deploy_folder(ws_id, "repo")
+        for row in client.instrumentation.report()[:5]:
+            print(row["endpoint"], row["count"], row["total"], row["p90"])
+    """
+
+    def __init__(self, sinks: list | None = None, enabled: bool | None = None) -> None:
+        self.sinks = list(sinks or [])
+        self.enabled = bool(self.sinks) if enabled is None else enabled
+        self._before: list[Callable[[str, str, dict], None]] = []
+        self._after: list[Callable[[RequestRecord], None]] = []
+        self._lock = threading.Lock()
+        self.reset()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Clear the histograms and counters."""
+        with self._lock:
+            self._histograms: dict[tuple[str, str, str], LatencyHistogram] = {}
+            self._counters = {
+                "requests": 0,
+                "errors": 0,
+                "retries": 0,
+                "throttled": 0,
+                "bytes_sent": 0,
+                "bytes_received": 0,
+                "retry_wait_seconds": 0.0,
+                "throttle_wait_seconds": 0.0,
+                "lro_wait_seconds": 0.0,
+            }
+
+    def add_hook(
+        self,
+        before: Callable[[str, str, dict], None] | None = None,
+        after: Callable[[RequestRecord], None] | None = None,
+    ) -> None:
+        """
+        Register request hooks and enable the instrumentation.
+
+        Parameters
+        ----------
+        before : callable, optional
+            ``before(method, url, headers)`` called before every send. It may
+            add headers, e.g. a correlation id.
+        after : callable, optional
+            ``after(record)`` called with every ``RequestRecord``.
+        """
+        if before is not None:
+            self._before.append(before)
+        if after is not None:
+            self._after.append(after)
+        self.enabled = True
+
+    def add_sink(self, sink) -> None:
+        """Export every record to *sink* and enable the instrumentation."""
+        self.sinks.append(sink)
+        self.enabled = True
+
+    def before_request(self, method: str, url: str, headers: dict) -> None:
+        for hook in self._before:
+            hook(method, url, headers)
+
+    def emit(self, record: RequestRecord) -> None:
+        """Add *record* to the histograms and counters, then run the hooks and sinks."""
+        with self._lock:
+            counters = self._counters
+            if record.kind == "request":
+                counters["requests"] += 1
+                counters["bytes_sent"] += record.bytes_sent
+                counters["bytes_received"] += record.bytes_received
+                if record.error is not None:
+                    counters["errors"] += 1
+                for phase in PHASES:
+                    value = record.duration if phase == "duration" else getattr(record, phase)
+                    if value is not None:
+                        self._histogram(record, phase).record(value)
+            elif record.kind == "retry":
+                counters["retries"] += 1
+                counters["retry_wait_seconds"] += record.duration
+            elif record.kind == "throttle":
+                counters["throttled"] += 1
+                counters["throttle_wait_seconds"] += record.duration
+            elif record.kind == "lro_wait":
+                counters["lro_wait_seconds"] += record.duration
+                self._histogram(record, "lro_wait").record(record.duration)
+        for hook in self._after:
+            hook(record)
+        for sink in self.sinks:
+            sink.emit(record)
+
+    def event(self, kind: str, method: str, url: str, seconds: float, **attributes: Any) -> None:
+        """Emit a ``retry``, ``throttle`` or ``lro_wait`` record lasting *seconds*."""
+        status = attributes.pop("status", None)
+        # Operation waits are reported once finished, pauses before they start
+        start_time = time.time() - seconds if kind == "lro_wait" else time.time()
+        self.emit(RequestRecord(kind, method, url, start_time, seconds, status=status, attributes=attributes))
+
+    def _histogram(self, record: RequestRecord, phase: str) -> LatencyHistogram:
+        key = (record.method, record.endpoint, phase)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = LatencyHistogram()
+        return histogram
+
+    def histogram(self, method: str, endpoint: str, phase: str = "duration") -> LatencyHistogram | None:
+        """Return the histogram of one endpoint and phase (``connect``, ``ttfb``, ``body``, ``duration``, ``lro_wait``)."""
+        return self._histograms.get((method.upper(), endpoint, phase))
+
+    def metrics(self) -> dict:
+        """
+        Return a snapshot of the counters and histograms.
+
+        ``{"requests", "errors", "retries", "throttled", "bytes_sent",
+        "bytes_received", "retry_wait_seconds", "throttle_wait_seconds",
+        "lro_wait_seconds", "endpoints": {"GET /v1/...": {phase: {...}}}}``
+        """
+        with self._lock:
+            endpoints: dict[str, dict] = {}
+            for (method, endpoint, phase), histogram in self._histograms.items():
+                endpoints.setdefault(f"{method} {endpoint}", {})[phase] = histogram.snapshot()
+            return {**self._counters, "endpoints": endpoints}
+
+    def report(self) -> list[dict]:
+        """
+        Return one row per endpoint, sorted by total time (requests plus
+        operation waits) so the most expensive endpoints come first.
+
+        Each row holds ``endpoint``, ``count``, ``total``, ``p50``, ``p90``,
+        ``max`` (request duration), ``connect``, ``ttfb``, ``body`` (mean
+        seconds) and ``lro_wait`` (total seconds).
+        """
+        rows = []
+        for endpoint, phases in self.metrics()["endpoints"].items():
+            duration = phases.get("duration", LatencyHistogram().snapshot())
+            lro_wait = phases.get("lro_wait", {}).get("total", 0.0)
+            rows.append({
+                "endpoint": endpoint,
+                "count": duration["count"],
+                "total": duration["total"] + lro_wait,
+                "p50": duration["p50"],
+                "p90": duration["p90"],
+                "max": duration["max"],
+                "connect": phases.get("connect", {}).get("mean", 0.0),
+                "ttfb": phases.get("ttfb", {}).get("mean", 0.0),
+                "body": phases.get("body", {}).get("mean", 0.0),
+                "lro_wait": lro_wait,
+            })
+        rows.sort(key=lambda row: row["total"], reverse=True)
+        return rows
@@ -1,11 +1,22 @@
 import base64
+import hashlib
 import json
 import os
-import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
+
+import requests
+
 from . import api
 from . import config
 from . import authenticate
+from . import tmdl
+from .cache import ItemInventoryCache
+from .definitions import ItemDefinition
+from .exceptions import FabricError, FabricNotFoundError
+from .lro import LongRunningOperation, OperationPoller
 
 
 def get_partitions(tmdl_content: str) -> list[str]:
@@ -13,102 +24,518 @@ def get_partitions(tmdl_content: str) -> list[str]:
     Extract all partition blocks from a TMDL file.
     Returns a list of strings, each containing one partition block.
     """
-    # Match 'partition <name> = <mode>' until the next unindented line or end of file
-    pattern = re.compile(
-        r"^\tpartition[\s\S]*?=(?:[\s\S]*?)(?=\r?\n\r?\n)",
-        re.MULTILINE | re.DOTALL
-    )
-    partitions = pattern.findall(tmdl_content)
-    return partitions
+    document = tmdl.parse_tmdl(tmdl_content)
+    return [
+        partition.text()
+        for table in document.children("table")
+        for partition in table.children("partition")
+    ]
 
 def set_partitions(tmdl_content: str, new_partitions: list[str], delimiter: str = "\r\n") -> str:
     """
     Remove all existing partition blocks in TMDL content and insert new partitions once
     at the location of the first partition block (or append at the end if none found).
+
+    Blank lines between partitions follow the file's own line endings;
+    *delimiter* is kept for backward compatibility and is no longer used.
     """
-    # Regex to match all partition blocks
-    pattern = r"(\tpartition[\s\S]*?(?=\r?\n\r?\n))"
+    document = tmdl.parse_tmdl(tmdl_content)
+    tables = document.children("table")
+    if not tables:
+        return tmdl_content
+    partitions = [
+        partition
+        for block in new_partitions
+        for partition in tmdl.parse_tmdl(block).children("partition")
+    ]
+    tables[0].replace_children("partition", partitions)
+    return document.text()
+
+def _retain_partitions(
+    local: ItemDefinition,
+    published: ItemDefinition,
+    retain_all_partitions: bool,
+    retain_partitions_tables: list[str],
+) -> None:
+    """Swap the partitions of local table files for the published ones, one parse per file."""
+    for published_part in published.under("definition/tables/", ".tmdl"):
+        part = local.get(published_part.path)
+        if part is None:
+            continue
+
+        local_document = tmdl.parse_tmdl(part.text)
+        table = next(iter(local_document.children("table")), None)
+        if table is None:
+            continue
+        if not (
+            retain_all_partitions
+            or table.name in retain_partitions_tables
+            or table.raw_name in retain_partitions_tables
+        ):
+            continue
+
+        published_document = tmdl.parse_tmdl(published_part.text)
+        target_partitions = [
+            partition
+            for published_table in published_document.children("table")
+            for partition in published_table.children("partition")
+        ]
+        if target_partitions:
+            table.replace_children("partition", target_partitions)
+            part.text = local_document.text()
+
+def _retain_roles(local: ItemDefinition, published: ItemDefinition) -> None:
+    """Replace local roles with the published ones and point ``model.tmdl`` at them."""
+    # remove roles from original path
+    for part in local.under("definition/roles/"):
+        local.remove(part.path)
+
+    # published roles are copied with their payload, never re-encoded
+    role_refs: list[str] = []
+    for part in published.under("definition/roles/", ".tmdl"):
+        document = tmdl.parse_tmdl(part.text)
+        role_refs.extend(role.raw_name for role in document.children("role"))
+        local.add(part.copy())
+
+    # edit model.tmdl to reference exactly the retained roles
+    model = local.get("definition/model.tmdl") or published.get("definition/model.tmdl")
+    if model is None:
+        return
+
+    model_document = tmdl.parse_tmdl(model.text)
+    model_document.replace_children(
+        "ref",
+        [tmdl.make_ref("role", raw_name) for raw_name in role_refs],
+        ref_type="role",
+        separate=False,
+    )
+    local.set("definition/model.tmdl", model_document.text())
 
-    matches = list(re.finditer(pattern, tmdl_content, flags=re.MULTILINE))
-    if matches:
-        # Use the start of the first match and the end of the last match
-        start = matches[0].start()
-        end = matches[-1].end()
+def list_item_files(path: Path) -> list[Path]:
+    """
+    Return the files of a PBIP item folder that make up its definition,
+    sorted by relative path so that the resulting parts are deterministic.
+    """
+    return sorted(
+        (
+            f for f in path.rglob("*")
+            if f.is_file()
+            and not f.name.startswith("item.")
+            and not f.suffix.lower() == ".abf"
+            and f.parent.name != ".pbi"
+        ),
+        key=lambda f: f.relative_to(path).as_posix(),
+    )
 
-        # Replace all partition blocks with new partitions exactly once
-        replaced_content = tmdl_content[:start] + delimiter.join(new_partitions) + tmdl_content[end:]
-    else:
-        # Do nothing
-        replaced_content = tmdl_content
+def rebind_pbir(text: str, semantic_model_id: str | None) -> bytes:
+    """
+    Return the bytes of a ``definition.pbir`` file, rewritten to point to
+    *semantic_model_id* through a ``byConnection`` reference when needed.
+    """
+    item_id = semantic_model_id
+    pbir_json = json.loads(text)
+
+    # Resolve semantic model connection
+    if item_id or (
+        pbir_json.get("datasetReference")
+        and pbir_json["datasetReference"].get("byPath", {}).get("path")
+    ):
+        if not item_id:
+            raise Exception(
+                "Report uses byPath connection. You MUST pass itemProperties.semanticModelId"
+            )
+
+        # Remove byPath
+        if "byPath" in pbir_json["datasetReference"]:
+            pbir_json["datasetReference"]["byPath"] = None
+
+        # Ensure $schema exists
+        if "$schema" not in pbir_json:
+            pbir_json["$schema"] = (
+                "https://developer.microsoft.com/json-schemas/"
+                "fabric/item/report/definitionProperties/2.0.0/schema.json"
+            )
+
+        schema = pbir_json["$schema"]
+
+        # Old vs new schema connection
+        if "1.0.0" in schema:
+            by_connection = {
+                "connectionString": None,
+                "pbiServiceModelId": None,
+                "pbiModelVirtualServerName": "sobe_wowvirtualserver",
+                "pbiModelDatabaseName": item_id,
+                "name": "EntityDataSource",
+                "connectionType": "pbiServiceXmlaStyleLive",
+            }
+        else:
+            by_connection = {
+                "connectionString": f"semanticmodelid={item_id}"
+            }
+
+        pbir_json["datasetReference"]["byConnection"] = by_connection
+        return json.dumps(pbir_json, indent=2).encode("utf-8")
+
+    return text.encode("utf-8")
+
+def read_part_bytes(file: Path, semantic_model_id: str | None = None) -> bytes:
+    """Read one definition file, rebinding ``.pbir`` files to *semantic_model_id*."""
+    if file.suffix.lower() == ".pbir":
+        return rebind_pbir(file.read_text(encoding="utf-8"), semantic_model_id)
+    return file.read_bytes()
+
+def _build_part(path: Path, file: Path, semantic_model_id: str | None) -> dict:
+    file_bytes = read_part_bytes(file, semantic_model_id)
+    return {
+        "Path": file.relative_to(path).as_posix(),
+        "Payload": base64.b64encode(file_bytes).decode("utf-8"),
+        "PayloadType": "InlineBase64",
+    }
+
+def part_payload_bytes(part: dict) -> bytes:
+    """
+    Return the raw content of a definition part whose ``Payload`` is a base64
+    ``str``, raw ``bytes`` or a ``Path`` still on disk (see ``build_item_parts``).
+    """
+    payload = part["Payload"]
+    if isinstance(payload, str):
+        return base64.b64decode(payload)
+    if isinstance(payload, Path):
+        return payload.read_bytes()
+    return bytes(payload)
+
+def build_item_parts(
+    path: Path,
+    files: list[Path],
+    semantic_model_id: str | None = None,
+    max_workers: int | None = None,
+    lazy: bool = False,
+) -> list[dict]:
+    """
+    Read and base64-encode *files* into definition parts using a thread pool.
+
+    Files are handed to the workers in batches to keep scheduling overhead
+    low on folders with thousands of small TMDL files. Parts are returned in
+    the order of *files* regardless of which worker finishes first.
+    ``max_workers=1`` builds them sequentially.
+
+    With ``lazy=True`` nothing is read or encoded up front: each part keeps
+    its ``Path`` as ``Payload`` (``.pbir`` files are rebound and kept as raw
+    bytes) for ``api.StreamingDefinitionBody`` to stream from disk.
+    """
+    if lazy:
+        return [
+            {
+                "Path": file.relative_to(path).as_posix(),
+                "Payload": read_part_bytes(file, semantic_model_id) if file.suffix.lower() == ".pbir" else file,
+                "PayloadType": "InlineBase64",
+            }
+            for file in files
+        ]
+
+    if max_workers == 1 or len(files) <= 1:
+        return [_build_part(path, file, semantic_model_id) for file in files]
+
+    def build_batch(batch: list[Path]) -> list[dict]:
+        return [_build_part(path, file, semantic_model_id) for file in batch]
+
+    batches = [files[i:i + config.PART_BATCH_SIZE] for i in range(0, len(files), config.PART_BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return [part for batch in executor.map(build_batch, batches) for part in batch]
+
+def hash_item_parts(parts: list[dict]) -> dict[str, str]:
+    """Return the SHA-256 of each part's content, keyed by part path."""
+    return {part["Path"]: hashlib.sha256(part_payload_bytes(part)).hexdigest() for part in parts}
+
+def diff_part_hashes(local: dict[str, str], published: dict[str, str]) -> list[str]:
+    """Return the sorted paths that were added, removed or modified between two hash maps."""
+    return sorted(
+        path for path in local.keys() | published.keys()
+        if local.get(path) != published.get(path)
+    )
+
+_MANIFEST_LOCK = threading.Lock()
+
+def _read_deploy_manifest(manifest_path: str) -> dict:
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def _record_deploy_manifest(manifest_path: str, item_id: str, entry: dict) -> None:
+    # Serialized so that concurrent imports sharing one manifest do not lose entries
+    with _MANIFEST_LOCK:
+        manifest = _read_deploy_manifest(manifest_path)
+        manifest[item_id] = entry
+        manifest_file = Path(manifest_path)
+        manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = manifest_file.with_name(manifest_file.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, manifest_file)
+
+def iter_items(
+    token: str,
+    workspace_id: str,
+    session: requests.Session | None = None,
+    prefetch: bool = False,
+) -> Iterator[dict]:
+    """
+    Lazily yield the items of a workspace, following ``continuationToken``.
 
-    return replaced_content
+    Pages are requested only as they are consumed; with *prefetch* the next
+    page is fetched in the background while the current one is processed.
+    """
+    uri = f"workspaces/{workspace_id}/items"
+    for page in api.iter_fabric_api_pages(uri, token, session=session, prefetch=prefetch):
+        yield from page
 
 def get_items(
     token: str,
     workspace_id: str,
+    session: requests.Session | None = None,
+    item_cache: ItemInventoryCache | None = None,
 ) -> list[dict]:
-    result = api.invoke_fabric_api_request(token=token, uri=f"workspaces/{workspace_id}/items")
+    if item_cache is not None:
+        cached = item_cache.get_items(workspace_id)
+        if cached is not None:
+            return cached
+    result = list(iter_items(token, workspace_id, session=session))
+    if item_cache is not None:
+        item_cache.set_items(workspace_id, result)
     return result
 
 def get_item_by_id(
     token: str,
     workspace_id: str,
     item_id: str,
+    session: requests.Session | None = None,
+    item_cache: ItemInventoryCache | None = None,
 ) -> dict:
-    result = api.invoke_fabric_api_request(token=token, uri=f"workspaces/{workspace_id}/items/{item_id}")
+    if item_cache is not None:
+        cached = item_cache.get_item(workspace_id, item_id)
+        if cached is not None:
+            return cached
+    result = api.invoke_fabric_api_request(token=token, uri=f"workspaces/{workspace_id}/items/{item_id}", session=session)
+    if item_cache is not None and result:
+        item_cache.put_item(workspace_id, result)
     return result
 
-def get_items_by_name(token: str, workspace_id: str, item_name: str) -> list[dict]:
-    items = get_items(token, workspace_id)
+def get_items_by_name(token: str, workspace_id: str, item_name: str, session: requests.Session | None = None, item_cache: ItemInventoryCache | None = None) -> list[dict]:
+    if item_cache is not None:
+        if not item_cache.is_loaded(workspace_id):
+            get_items(token, workspace_id, session=session, item_cache=item_cache)
+        cached = item_cache.find_items_by_name(workspace_id, item_name)
+        if cached is not None:
+            return cached
     result = []
-    for item in items:
+    for item in iter_items(token, workspace_id, session=session):
         if item['displayName'] == item_name:
             result.append(item)
     return result
 
-def get_item_definition_by_id(token: str, workspace_id: str, item_id: str, output_dir: str | None = None, format: str | None = None) -> dict:
+def get_item_definition(
+    token: str,
+    workspace_id: str,
+    item_id: str,
+    format: str | None = None,
+    session: requests.Session | None = None,
+    poller: OperationPoller | None = None,
+) -> ItemDefinition | LongRunningOperation:
     """
-    Exports a Fabric item from a Fabric workspace, optionnaly to a specified local path.
+    Exports a Fabric item definition as an ``ItemDefinition``.
 
     Args:
         workspace_id (str): The Fabric workspace ID.
         item_id (str): The Fabric item ID (e.g. semantic model).
-        path (str, optional): Output directory. Defaults to './pbipOutput'.
         format (str, optional): Optional export format (e.g., 'PBIP').
+        session (requests.Session, optional): Pooled HTTP session to reuse connections.
+        poller (OperationPoller, optional): When given, return immediately with a
+            ``LongRunningOperation`` future instead of blocking on the export.
 
     Returns:
-        dict: Response from the Fabric API request.
+        ItemDefinition: The definition parts indexed by path, decoded on first
+            access (or a future resolving to it).
     """
+    response = _get_definition_response(token, workspace_id, item_id, format, session, poller)
+    if poller is not None:
+        return response.then(ItemDefinition.from_response)
+    return ItemDefinition.from_response(response)
 
+def get_item_definition_by_id(
+    token: str,
+    workspace_id: str,
+    item_id: str,
+    output_dir: str | None = None,
+    format: str | None = None,
+    session: requests.Session | None = None,
+    poller: OperationPoller | None = None,
+) -> dict | LongRunningOperation:
+    """
+    Exports a Fabric item from a Fabric workspace, optionally writing its parts to a local directory.
+
+    Args:
+        workspace_id (str): The Fabric workspace ID.
+        item_id (str): The Fabric item ID (e.g. semantic model).
+        output_dir (str, optional): Directory to write the decoded parts to.
+            Nothing is written when omitted.
+        format (str, optional): Optional export format (e.g., 'PBIP').
+        session (requests.Session, optional): Pooled HTTP session to reuse connections.
+        poller (OperationPoller, optional): When given, return immediately with a
+            ``LongRunningOperation`` future instead of blocking on the export.
+
+    Returns:
+        dict: Response from the Fabric API request (or a future resolving to it).
+            Use ``get_item_definition`` for the parts indexed by path.
+    """
+    response = _get_definition_response(token, workspace_id, item_id, format, session, poller)
+    if poller is not None:
+        return response.then(lambda result: _save_definition_parts(result, output_dir))
+    return _save_definition_parts(response, output_dir)
+
+def _get_definition_response(
+    token: str,
+    workspace_id: str,
+    item_id: str,
+    format: str | None,
+    session: requests.Session | None,
+    poller: OperationPoller | None,
+) -> dict | LongRunningOperation:
     uri = f"workspaces/{workspace_id}/items/{item_id}/getDefinition"
 
     if format:
         uri += f"?format={format}"
 
     # POST request to the Fabric API
-    response = api.invoke_fabric_api_request(uri=uri, token=token,  method="POST")
-    if output_dir:
-        parts = response.get("definition", {}).get("parts", [])
-        for part in parts:
-            path = part["path"]
-            payload = part["payload"]
-            payload_type = part.get("payloadType")
-
-            # Compute full file path
-            if(output_dir):
-                full_path = os.path.join(output_dir, path)
-                os.makedirs(os.path.dirname(full_path), exist_ok=True)
-
-                # Decode Base64 payload (only for InlineBase64 types)
-                if payload_type == "InlineBase64":
-                    content = base64.b64decode(payload)
-                    with open(full_path, "wb") as f:
-                        f.write(content)
-                    print(f"✅ Saved: {full_path}")
-                else:
-                    print(f"⚠️ Skipped {path} (unsupported payloadType: {payload_type})")
+    return api.invoke_fabric_api_request(uri=uri, token=token,  method="POST", session=session, poller=poller)
+
+def _save_definition_parts(response: dict, output_dir: str | None) -> dict:
+    if not output_dir:
+        return response
+    saved = 0
+    for part in ItemDefinition.from_response(response):
+        # Decode Base64 payload (only for InlineBase64 types)
+        if part.payload_type != "InlineBase64":
+            config.print_color(f"Skipped {part.path} (unsupported payloadType: {part.payload_type})", "yellow")
+            continue
+        full_path = os.path.join(output_dir, part.path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "wb") as f:
+            f.write(part.data)
+        saved += 1
+    config.print_color(f"Saved {saved} definition parts to {output_dir}", "green")
     return response
 
+def _write_definition_part(output_dir: Path, part: dict) -> dict:
+    """Decode one part and write it under *output_dir* unless it is unchanged."""
+    path = part["path"]
+    payload_type = part.get("payloadType")
+    if payload_type != "InlineBase64":
+        return {"path": path, "payloadType": payload_type, "status": "skipped"}
+
+    full_path = (output_dir / path).resolve()
+    if not full_path.is_relative_to(output_dir):
+        raise FabricError(f"Refusing to write part outside of output directory: {path}")
+
+    content = base64.b64decode(part["payload"])
+    digest = hashlib.sha256(content).hexdigest()
+
+    status = "written"
+    if full_path.is_file() and full_path.stat().st_size == len(content):
+        if hashlib.sha256(full_path.read_bytes()).hexdigest() == digest:
+            status = "unchanged"
+
+    if status == "written":
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(full_path, "wb") as f:
+            f.write(content)
+
+    return {"path": path, "size": len(content), "sha256": digest, "status": status}
+
+def export_item_definition(
+    token: str,
+    workspace_id: str,
+    item_id: str,
+    output_dir: str,
+    format: str | None = None,
+    max_workers: int | None = None,
+    session: requests.Session | None = None,
+) -> dict:
+    """
+    Export a Fabric item definition to *output_dir* and return a manifest.
+
+    The ``getDefinition`` response is parsed incrementally while it is being
+    downloaded; parts are decoded and written by a worker pool, and files
+    whose content hash already matches are left untouched.
+
+    Parameters
+    ----------
+    token : str
+        A valid bearer access token.
+    workspace_id : str
+        The Fabric workspace ID.
+    item_id : str
+        The Fabric item ID.
+    output_dir : str
+        Local directory receiving the decoded files.
+    format : str, optional
+        Optional export format (e.g. ``"TMDL"`` or ``"PBIP"``).
+    max_workers : int, optional
+        Threads used to decode and write parts.
+    session : requests.Session, optional
+        Pooled HTTP session to reuse connections.
+
+    Returns
+    -------
+    dict
+        ``{"workspaceId", "itemId", "outputDir", "parts": [...], "written",
+        "unchanged", "skipped", "bytes"}`` where each part entry holds
+        ``path``, ``size``, ``sha256`` and ``status`` (``written``,
+        ``unchanged`` or ``skipped`` for non-inline payloads).
+    """
+    uri = f"workspaces/{workspace_id}/items/{item_id}/getDefinition"
+    if format:
+        uri += f"?format={format}"
+
+    output_path = Path(output_dir).resolve()
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    # Bound the number of decoded-but-unwritten parts held in memory
+    slots = threading.BoundedSemaphore(workers * 2)
+
+    def write(part: dict) -> dict:
+        try:
+            return _write_definition_part(output_path, part)
+        finally:
+            slots.release()
+
+    futures = []
+    response = api.invoke_fabric_api_request(uri=uri, token=token, method="POST", session=session, stream=True)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            if response is not None:
+                for part in api.iter_definition_parts(response):
+                    slots.acquire()
+                    futures.append(executor.submit(write, part))
+        finally:
+            if response is not None:
+                response.close()
+        entries = [future.result() for future in futures]
+
+    entries.sort(key=lambda entry: entry["path"])
+    return {
+        "workspaceId": workspace_id,
+        "itemId": item_id,
+        "outputDir": str(output_path),
+        "parts": entries,
+        "written": sum(entry["status"] == "written" for entry in entries),
+        "unchanged": sum(entry["status"] == "unchanged" for entry in entries),
+        "skipped": sum(entry["status"] == "skipped" for entry in entries),
+        "bytes": sum(entry.get("size", 0) for entry in entries),
+    }
+
 def import_item(
     token: str,
     workspace_id: str,
@@ -118,7 +545,14 @@ def import_item(
     retain_roles: bool = False,
     retain_all_partitions: bool = False,
     retain_partitions_tables: list[str] = [],
-) -> dict:
+    session: requests.Session | None = None,
+    poller: OperationPoller | None = None,
+    max_workers: int | None = None,
+    stream: bool = False,
+    item_cache: ItemInventoryCache | None = None,
+    incremental: bool = False,
+    manifest_path: str | None = None,
+) -> dict | LongRunningOperation:
     """
     Imports .pbir or .pbism items from PBIP folder into a Fabric workspace.
 
@@ -126,6 +560,21 @@ def import_item(
     :param workspace_id: Fabric workspace ID.
     :param item_properties: Optional override for displayName, type, semanticModelId, ...
     :param skip_if_exists: Do not update definition if item already exists.
+    :param session: Pooled HTTP session to reuse connections across calls.
+    :param poller: When given, return a ``LongRunningOperation`` future for the
+        create/update instead of blocking until the service has applied it.
+    :param max_workers: Threads used to read and encode the definition files
+        (``None`` lets ``ThreadPoolExecutor`` choose, ``1`` disables parallelism).
+    :param stream: Stream the request body from disk, base64-encoding files in
+        chunks, instead of building the whole JSON payload in memory.
+    :param item_cache: Inventory used to check whether the item exists without
+        listing the workspace on every import; patched when the item is created.
+    :param incremental: Skip ``updateDefinition`` when the content hashes of the
+        local parts match the last deployment recorded in *manifest_path* or,
+        without a manifest entry, the published definition. The result then
+        carries ``changedParts``, the paths that differ (empty when skipped).
+    :param manifest_path: JSON file recording the part hashes of every
+        successful import by item id. Implies *incremental*.
     """
 
     path = Path(path).resolve()
@@ -151,29 +600,13 @@ def import_item(
         raise Exception("Cannot determine item type.")
 
     # ----------------------------------------------------------------------
-    # 2. Read workspace existing items
-    # ----------------------------------------------------------------------
-
-    items = api.invoke_fabric_api_request(
-        token=token,
-        uri=f"workspaces/{workspace_id}/items",
-        method="GET"
-    )
-
-    # ----------------------------------------------------------------------
-    # 3. Enumerate files to upload
+    # 2. Enumerate files to upload
     # ----------------------------------------------------------------------
 
-    all_files = [
-        f for f in path.rglob("*")
-        if f.is_file()
-        and not f.name.startswith("item.")
-        and not f.suffix.lower() == ".abf"
-        and f.parent.name != ".pbi"
-    ]
+    all_files = list_item_files(path)
 
     # ----------------------------------------------------------------------
-    # 4. Determine displayName and type
+    # 3. Determine displayName and type
     # ----------------------------------------------------------------------
 
     display_name = None
@@ -193,217 +626,272 @@ def import_item(
         raise Exception("Missing required fields: itemType or displayName")
 
     # ----------------------------------------------------------------------
-    # 5. Build the Parts payload
+    # 4. Build the Parts payload
     # ----------------------------------------------------------------------
 
-    parts = []
-    item_id = item_properties.get("semanticModelId") if item_properties else None
-
-    for file in all_files:
-        relative_path = file.relative_to(path).as_posix()
-
-        if file.suffix.lower() == ".pbir":
-            text = file.read_text(encoding="utf-8")
-            pbir_json = json.loads(text)
-
-            # Resolve semantic model connection
-            if item_id or (
-                pbir_json.get("datasetReference")
-                and pbir_json["datasetReference"].get("byPath", {}).get("path")
-            ):
-                if not item_id:
-                    raise Exception(
-                        "Report uses byPath connection. You MUST pass itemProperties.semanticModelId"
-                    )
-
-                # Remove byPath
-                if "byPath" in pbir_json["datasetReference"]:
-                    pbir_json["datasetReference"]["byPath"] = None
-
-                # Ensure $schema exists
-                if "$schema" not in pbir_json:
-                    pbir_json["$schema"] = (
-                        "https://developer.microsoft.com/json-schemas/"
-                        "fabric/item/report/definitionProperties/2.0.0/schema.json"
-                    )
-
-                schema = pbir_json["$schema"]
-
-                # Old vs new schema connection
-                if "1.0.0" in schema:
-                    by_connection = {
-                        "connectionString": None,
-                        "pbiServiceModelId": None,
-                        "pbiModelVirtualServerName": "sobe_wowvirtualserver",
-                        "pbiModelDatabaseName": item_id,
-                        "name": "EntityDataSource",
-                        "connectionType": "pbiServiceXmlaStyleLive",
-                    }
-                else:
-                    by_connection = {
-                        "connectionString": f"semanticmodelid={item_id}"
-                    }
-
-                pbir_json["datasetReference"]["byConnection"] = by_connection
-                file_bytes = json.dumps(pbir_json, indent=2).encode("utf-8")
-            else:
-                file_bytes = text.encode("utf-8")
-        else:
-            file_bytes = file.read_bytes()
+    semantic_model_id = item_properties.get("semanticModelId") if item_properties else None
+    definition = ItemDefinition.from_parts(
+        build_item_parts(path, all_files, semantic_model_id=semantic_model_id, max_workers=max_workers, lazy=stream)
+    )
+
+    return import_definition(
+        token,
+        workspace_id,
+        definition,
+        display_name,
+        item_type,
+        skip_if_exists=skip_if_exists,
+        retain_roles=retain_roles,
+        retain_all_partitions=retain_all_partitions,
+        retain_partitions_tables=retain_partitions_tables,
+        session=session,
+        poller=poller,
+        stream=stream,
+        item_cache=item_cache,
+        incremental=incremental,
+        manifest_path=manifest_path,
+    )
+
+def import_definition(
+    token: str,
+    workspace_id: str,
+    definition: ItemDefinition,
+    display_name: str,
+    item_type: str,
+    skip_if_exists: bool = False,
+    retain_roles: bool = False,
+    retain_all_partitions: bool = False,
+    retain_partitions_tables: list[str] = [],
+    session: requests.Session | None = None,
+    poller: OperationPoller | None = None,
+    stream: bool = False,
+    item_cache: ItemInventoryCache | None = None,
+    incremental: bool = False,
+    manifest_path: str | None = None,
+) -> dict | LongRunningOperation:
+    """
+    Create or update an item from an in-memory ``ItemDefinition``.
+
+    This is ``import_item`` without the folder scan: the definition may come
+    from another workspace (``clone_item``), a snapshot or a rendered
+    template. *definition* is modified in place when published partitions
+    or roles are retained. See ``import_item`` for the other parameters;
+    with *stream* parts that were never encoded are base64-encoded while
+    the request body is sent.
+
+    When the existence check was answered by *item_cache* and the service
+    no longer knows the item (it was deleted outside this client), the
+    workspace is listed again and the import is retried once.
+    """
+    options = dict(
+        skip_if_exists=skip_if_exists,
+        retain_roles=retain_roles,
+        retain_all_partitions=retain_all_partitions,
+        retain_partitions_tables=retain_partitions_tables,
+        session=session,
+        poller=poller,
+        stream=stream,
+        item_cache=item_cache,
+        incremental=incremental,
+        manifest_path=manifest_path,
+    )
+    cached = item_cache is not None and item_cache.is_loaded(workspace_id)
+    try:
+        return _import_definition(token, workspace_id, definition, display_name, item_type, **options)
+    except FabricNotFoundError:
+        if not cached:
+            raise
+        config.print_color(f"{display_name} ({item_type}) no longer exists, listing the workspace again", "yellow")
+        item_cache.invalidate(workspace_id)
+        return _import_definition(token, workspace_id, definition, display_name, item_type, **options)
+
+def _import_definition(
+    token: str,
+    workspace_id: str,
+    definition: ItemDefinition,
+    display_name: str,
+    item_type: str,
+    skip_if_exists: bool,
+    retain_roles: bool,
+    retain_all_partitions: bool,
+    retain_partitions_tables: list[str],
+    session: requests.Session | None,
+    poller: OperationPoller | None,
+    stream: bool,
+    item_cache: ItemInventoryCache | None,
+    incremental: bool,
+    manifest_path: str | None,
+) -> dict | LongRunningOperation:
+
+    # ----------------------------------------------------------------------
+    # 1. Read workspace existing items
+    # ----------------------------------------------------------------------
 
-        parts.append({
-            "Path": relative_path,
-            "Payload": base64.b64encode(file_bytes).decode("utf-8"),
-            "PayloadType": "InlineBase64",
-        })
+    if item_cache is not None and item_cache.is_loaded(workspace_id):
+        items = None
+    else:
+        items = get_items(token, workspace_id, session=session, item_cache=item_cache)
 
+    incremental = incremental or manifest_path is not None
+    # Hashes of the local source, before published partitions/roles are merged in
+    local_hashes = definition.hashes() if incremental else None
 
     # ----------------------------------------------------------------------
-    # 6. Check if item exists
+    # 2. Check if item exists
     # ----------------------------------------------------------------------
 
-    existing = [
-        x for x in items
-        if x["type"].lower() == item_type.lower()
-        and x["displayName"].lower() == display_name.lower()
-    ]
+    if items is None:
+        cached_item = item_cache.find_item(workspace_id, item_type, display_name)
+        existing = [cached_item] if cached_item else []
+    else:
+        existing = [
+            x for x in items
+            if x["type"].lower() == item_type.lower()
+            and x["displayName"].lower() == display_name.lower()
+        ]
 
     item_id = existing[0]["id"] if existing else None
-    published_item_definition = get_item_definition_by_id(token, workspace_id, item_id) if existing else None
+
+    changed_parts = None
+    if incremental and existing and not skip_if_exists:
+        recorded = _read_deploy_manifest(manifest_path).get(item_id) if manifest_path else None
+        if recorded is not None:
+            changed_parts = diff_part_hashes(local_hashes, recorded["parts"])
+            if not changed_parts:
+                config.print_color(f"Unchanged: {display_name} ({item_type}), update skipped", "green")
+                unchanged = {"id": item_id, "displayName": display_name, "type": item_type, "changedParts": []}
+                return poller.completed(unchanged) if poller is not None else unchanged
+
+    # The published definition is only needed to merge partitions/roles or to
+    # diff against it when no manifest entry exists
+    needs_published = existing and not skip_if_exists and (
+        retain_roles or retain_all_partitions or retain_partitions_tables
+        or (incremental and changed_parts is None)
+    )
+    published_item_definition = get_item_definition(token, workspace_id, item_id, session=session) if needs_published else None
 
     # ----------------------------------------------------------------------
-    # 7. Keep existing partitions and update part payloads
+    # 3. Keep existing partitions and update part payloads
     # ----------------------------------------------------------------------
 
-    if (retain_all_partitions or retain_partitions_tables) and existing:
-        partition_definitions = []
-
-        for file in published_item_definition.get("definition", {}).get("parts", []):
-            if re.match(r"definition/tables/.*\.tmdl", file['path']):
-                content = base64.b64decode(file['payload']).decode('utf-8')
-                file_bytes = content.encode("utf-8")
-                target_partitions = get_partitions(content)
-                for part in parts:
-                    if part["Path"] == file["path"]:
-                        original_content = base64.b64decode(part['Payload']).decode('utf-8')
-                        table_name = re.findall(r'table (.*)', original_content)[0].strip()
-                        if retain_all_partitions or table_name in retain_partitions_tables:
-                            modified_content = set_partitions(original_content, target_partitions)
-                            part["Payload"] = base64.b64encode(modified_content.encode("utf-8")).decode("utf-8")
+    if (retain_all_partitions or retain_partitions_tables) and published_item_definition:
+        _retain_partitions(definition, published_item_definition, retain_all_partitions, retain_partitions_tables)
 
     # ----------------------------------------------------------------------
-    # 8. Keep existing roles and update part payloads
+    # 4. Keep existing roles and update part payloads
     # ----------------------------------------------------------------------
 
-    if retain_roles and existing:
-        role_definitions = []
-        role_names: list[str] = []
-
-        # remove roles from original path
-        parts[:] = [
-            part for part in parts
-            if not part["Path"].startswith('definition/roles/')
-        ]
+    if retain_roles and published_item_definition:
+        _retain_roles(definition, published_item_definition)
 
-        for file in published_item_definition.get("definition", {}).get("parts", []):
-            if re.match(r"definition/roles/.*\.tmdl", file['path']):
-                role_definitions.append(file)
-                content = base64.b64decode(file['payload']).decode('utf-8')
-                file_bytes = content.encode("utf-8")
-
-                role_name = re.findall(r'role (.*)', content)[0]
-                role_names.append(f'ref role {role_name}')
-                parts.append({
-                    "Path": f"{file['path']}",
-                    "Payload": base64.b64encode(file_bytes).decode("utf-8"),
-                    "PayloadType": "InlineBase64",
-                })
-
-        # edit model.tmdl to keep existing roles
-        for file in published_item_definition.get("definition", {}).get("parts", []):
-            if file['path'].endswith("definition/model.tmdl"):
-                content = base64.b64decode(file['payload']).decode('utf-8')
-                parts[:] = [
-                    part for part in parts
-                    if not part["Path"].endswith('definition/model.tmdl')
-                ]
-
-                # Split the content into lines
-                lines = content.splitlines()
-
-                # Filter out lines starting with 'ref role'
-                filtered_lines = [line for line in lines if not line.strip().startswith('ref role')]
-
-                # Join the lines back into a single string
-                modified_content = '\n'.join(filtered_lines)
-                modified_content += '\n' + '\n'.join(role_names)
-
-                # Re-encode the modified content to base64
-                modified_bytes = modified_content.encode('utf-8')
-                parts.append({
-                    "Path": f"definition/model.tmdl",
-                    "Payload": base64.b64encode(modified_bytes).decode('utf-8'),
-                    "PayloadType": "InlineBase64",
-                })
+    # Only parts modified above are re-encoded; streamed parts stay on disk
+    parts = definition.to_parts(encode=not stream)
 
     # ----------------------------------------------------------------------
-    # 9. Create or update
+    # 5. Create or update
     # ----------------------------------------------------------------------
 
     if item_id is None:
         # --- CREATE ---
-        payload = {
-            "displayName": display_name,
-            "type": item_type,
-            "definition": {"Parts": parts}
-        }
+        if stream:
+            body = api.StreamingDefinitionBody(
+                parts,
+                fields={"displayName": display_name, "type": item_type},
+            )
+        else:
+            body = json.dumps({
+                "displayName": display_name,
+                "type": item_type,
+                "definition": {"Parts": parts}
+            })
 
         result = api.invoke_fabric_api_request(
             token = token,
             uri=f"workspaces/{workspace_id}/items",
             method="POST",
-            body=json.dumps(payload)
+            body=body,
+            session=session,
+            poller=poller,
         )
 
-        return {
-            "id": result["id"],
-            "displayName": display_name,
-            "type": item_type
-        }
-
-    else:
-        # --- UPDATE ---
-        if skip_if_exists:
-            return {
-                "id": item_id,
+        def created(result: dict) -> dict:
+            if item_cache is not None:
+                item_cache.put_item(workspace_id, {**result, "displayName": display_name, "type": item_type})
+            created_item = {
+                "id": result["id"],
                 "displayName": display_name,
                 "type": item_type
             }
+            if incremental:
+                created_item["changedParts"] = sorted(local_hashes)
+                if manifest_path:
+                    _record_deploy_manifest(manifest_path, result["id"], {**created_item, "workspaceId": workspace_id, "parts": local_hashes})
+            return created_item
 
-        update_payload = {
-            "definition": {"Parts": parts}
+        return result.then(created) if poller is not None else created(result)
+
+    else:
+        # --- UPDATE ---
+        updated = {
+            "id": item_id,
+            "displayName": display_name,
+            "type": item_type
         }
 
-        api.invoke_fabric_api_request(
+        if skip_if_exists:
+            return poller.completed(updated) if poller is not None else updated
+
+        if incremental and changed_parts is None:
+            # Normalized first, so that the .platform the service rewrites
+            # and BOM, line-ending or pbir binding noise in the exported
+            # definition do not force an update
+            changed_parts = diff_part_hashes(
+                definition.normalized_hashes(config.INCREMENTAL_IGNORED_PARTS, keep_binding=True),
+                published_item_definition.normalized_hashes(config.INCREMENTAL_IGNORED_PARTS, keep_binding=True),
+            )
+            if not changed_parts:
+                config.print_color(f"Unchanged: {display_name} ({item_type}), update skipped", "green")
+                if manifest_path:
+                    _record_deploy_manifest(manifest_path, item_id, {**updated, "workspaceId": workspace_id, "parts": local_hashes})
+                unchanged = {**updated, "changedParts": []}
+                return poller.completed(unchanged) if poller is not None else unchanged
+
+        if stream:
+            body = api.StreamingDefinitionBody(parts)
+        else:
+            body = json.dumps({
+                "definition": {"Parts": parts}
+            })
+
+        result = api.invoke_fabric_api_request(
             token = token,
             uri=f"workspaces/{workspace_id}/items/{item_id}/updateDefinition",
             method="POST",
-            body=json.dumps(update_payload)
+            body=body,
+            session=session,
+            poller=poller,
         )
 
-        return {
-            "id": item_id,
-            "displayName": display_name,
-            "type": item_type
-        }
+        def applied(_) -> dict:
+            if not incremental:
+                return updated
+            if manifest_path:
+                _record_deploy_manifest(manifest_path, item_id, {**updated, "workspaceId": workspace_id, "parts": local_hashes})
+            return {**updated, "changedParts": changed_parts}
+
+        return result.then(applied) if poller is not None else applied(result)
 
 
 def delete_item_by_id(
     token: str,
     workspace_id: str,
     item_id: str,
+    session: requests.Session | None = None,
+    item_cache: ItemInventoryCache | None = None,
 ) -> None:
-    api.invoke_fabric_api_request(token=token, uri=f"workspaces/{workspace_id}/items/{item_id}", method="DELETE")
+    api.invoke_fabric_api_request(token=token, uri=f"workspaces/{workspace_id}/items/{item_id}", method="DELETE", session=session)
+    if item_cache is not None:
+        item_cache.remove_item(workspace_id, item_id)
     config.print_color(f"Deleted item: {item_id}", "green")
 
 
@@ -424,20 +912,47 @@ class ItemsMixin:
     """Mixin that exposes item operations as instance methods.
 
     Requires the host class to provide a ``token`` property that returns
-    a valid bearer access token.
+    a valid bearer access token, a ``session`` attribute holding the
+    pooled HTTP session shared by all calls, a ``poller`` attribute
+    holding the ``OperationPoller`` used when ``wait=False``, and an
+    ``item_cache`` attribute holding the ``ItemInventoryCache``.
     """
 
+    def iter_items(self, workspace_id: str, prefetch: bool = False) -> Iterator[dict]:
+        """Lazily yield the items of a workspace, fetching pages on demand."""
+        return iter_items(self.token, workspace_id, session=self.session, prefetch=prefetch)
+
     def get_items(self, workspace_id: str) -> list[dict]:
         """Return all items in a Fabric workspace."""
-        return get_items(self.token, workspace_id)
+        return get_items(self.token, workspace_id, session=self.session, item_cache=self.item_cache)
 
     def get_item_by_id(self, workspace_id: str, item_id: str) -> dict:
         """Return a single item by its ID."""
-        return get_item_by_id(self.token, workspace_id, item_id)
+        return get_item_by_id(self.token, workspace_id, item_id, session=self.session, item_cache=self.item_cache)
 
     def get_items_by_name(self, workspace_id: str, item_name: str) -> list[dict]:
         """Return all items whose ``displayName`` matches *item_name*."""
-        return get_items_by_name(self.token, workspace_id, item_name)
+        return get_items_by_name(self.token, workspace_id, item_name, session=self.session, item_cache=self.item_cache)
+
+    def get_item_definition(
+        self,
+        workspace_id: str,
+        item_id: str,
+        format: str | None = None,
+        wait: bool = True,
+    ) -> ItemDefinition | LongRunningOperation:
+        """Export a Fabric item definition as an ``ItemDefinition``.
+
+        With ``wait=False`` returns a ``LongRunningOperation`` future at once.
+        """
+        return get_item_definition(
+            self.token,
+            workspace_id,
+            item_id,
+            format,
+            session=self.session,
+            poller=None if wait else self.poller,
+        )
 
     def get_item_definition_by_id(
         self,
@@ -445,9 +960,40 @@ class ItemsMixin:
         item_id: str,
         output_dir: str | None = None,
         format: str | None = None,
+        wait: bool = True,
+    ) -> dict | LongRunningOperation:
+        """Export a Fabric item definition, optionally writing files to *output_dir*.
+
+        With ``wait=False`` returns a ``LongRunningOperation`` future at once.
+        """
+        return get_item_definition_by_id(
+            self.token,
+            workspace_id,
+            item_id,
+            output_dir,
+            format,
+            session=self.session,
+            poller=None if wait else self.poller,
+        )
+
+    def export_item_definition(
+        self,
+        workspace_id: str,
+        item_id: str,
+        output_dir: str,
+        format: str | None = None,
+        max_workers: int | None = None,
     ) -> dict:
-        """Export a Fabric item definition, optionally writing files to *output_dir*."""
-        return get_item_definition_by_id(self.token, workspace_id, item_id, output_dir, format)
+        """Stream an item definition to *output_dir* and return a manifest of sizes and hashes."""
+        return export_item_definition(
+            self.token,
+            workspace_id,
+            item_id,
+            output_dir,
+            format,
+            max_workers=max_workers,
+            session=self.session,
+        )
 
     def import_item(
         self,
@@ -458,8 +1004,19 @@ class ItemsMixin:
         retain_roles: bool = False,
         retain_all_partitions: bool = False,
         retain_partitions_tables: list[str] | None = None,
-    ) -> dict:
-        """Import a ``.pbir`` or ``.pbism`` item from a local PBIP folder."""
+        wait: bool = True,
+        max_workers: int | None = None,
+        stream: bool = False,
+        incremental: bool = False,
+        manifest_path: str | None = None,
+    ) -> dict | LongRunningOperation:
+        """Import a ``.pbir`` or ``.pbism`` item from a local PBIP folder.
+
+        With ``wait=False`` returns a ``LongRunningOperation`` future as soon
+        as the create/update request has been accepted by the service. With
+        ``incremental=True`` (or a *manifest_path*) unchanged definitions are
+        not uploaded again.
+        """
         return import_item(
             self.token,
             workspace_id,
@@ -469,8 +1026,190 @@ class ItemsMixin:
             retain_roles=retain_roles,
             retain_all_partitions=retain_all_partitions,
             retain_partitions_tables=retain_partitions_tables or [],
+            session=self.session,
+            poller=None if wait else self.poller,
+            max_workers=max_workers,
+            stream=stream,
+            item_cache=self.item_cache,
+            incremental=incremental,
+            manifest_path=manifest_path,
+        )
+
+    def import_definition(
+        self,
+        workspace_id: str,
+        definition: ItemDefinition,
+        display_name: str,
+        item_type: str,
+        skip_if_exists: bool = False,
+        retain_roles: bool = False,
+        retain_all_partitions: bool = False,
+        retain_partitions_tables: list[str] | None = None,
+        wait: bool = True,
+        stream: bool = False,
+        incremental: bool = False,
+        manifest_path: str | None = None,
+    ) -> dict | LongRunningOperation:
+        """Create or update an item from an in-memory ``ItemDefinition`` (see ``import_item``)."""
+        return import_definition(
+            self.token,
+            workspace_id,
+            definition,
+            display_name,
+            item_type,
+            skip_if_exists=skip_if_exists,
+            retain_roles=retain_roles,
+            retain_all_partitions=retain_all_partitions,
+            retain_partitions_tables=retain_partitions_tables or [],
+            session=self.session,
+            poller=None if wait else self.poller,
+            stream=stream,
+            item_cache=self.item_cache,
+            incremental=incremental,
+            manifest_path=manifest_path,
         )
 
     def delete_item_by_id(self, workspace_id: str, item_id: str) -> None:
         """Delete a Fabric item by its ID."""
-        delete_item_by_id(self.token, workspace_id, item_id)
+        delete_item_by_id(self.token, workspace_id, item_id, session=self.session, item_cache=self.item_cache)
+
+
+class AsyncItemsMixin:
+    """Mixin that exposes item operations as coroutines.
+
+    Requires the host class to provide a ``_run`` coroutine that calls
+    ``func(token, *args, session=..., **kwargs)`` off the event loop and
+    awaits any returned future, a ``poller`` attribute so that
+    long-running operations are polled without holding a worker, and an
+    ``item_cache`` attribute holding the ``ItemInventoryCache``.
+    """
+
+    async def get_items(self, workspace_id: str) -> list[dict]:
+        """Return all items in a Fabric workspace."""
+        return await self._run(get_items, workspace_id, item_cache=self.item_cache)
+
+    async def get_item_by_id(self, workspace_id: str, item_id: str) -> dict:
+        """Return a single item by its ID."""
+        return await self._run(get_item_by_id, workspace_id, item_id, item_cache=self.item_cache)
+
+    async def get_items_by_name(self, workspace_id: str, item_name: str) -> list[dict]:
+        """Return all items whose ``displayName`` matches *item_name*."""
+        return await self._run(get_items_by_name, workspace_id, item_name, item_cache=self.item_cache)
+
+    async def get_item_definition(
+        self,
+        workspace_id: str,
+        item_id: str,
+        format: str | None = None,
+    ) -> ItemDefinition:
+        """Export a Fabric item definition as an ``ItemDefinition``."""
+        return await self._run(
+            get_item_definition,
+            workspace_id,
+            item_id,
+            format,
+            poller=self.poller,
+        )
+
+    async def get_item_definition_by_id(
+        self,
+        workspace_id: str,
+        item_id: str,
+        output_dir: str | None = None,
+        format: str | None = None,
+    ) -> dict:
+        """Export a Fabric item definition, optionally writing files to *output_dir*."""
+        return await self._run(
+            get_item_definition_by_id,
+            workspace_id,
+            item_id,
+            output_dir,
+            format,
+            poller=self.poller,
+        )
+
+    async def export_item_definition(
+        self,
+        workspace_id: str,
+        item_id: str,
+        output_dir: str,
+        format: str | None = None,
+        max_workers: int | None = None,
+    ) -> dict:
+        """Stream an item definition to *output_dir* and return a manifest of sizes and hashes."""
+        return await self._run(
+            export_item_definition,
+            workspace_id,
+            item_id,
+            output_dir,
+            format,
+            max_workers=max_workers,
+        )
+
+    async def import_item(
+        self,
+        workspace_id: str,
+        path: str,
+        item_properties: dict | None = None,
+        skip_if_exists: bool = False,
+        retain_roles: bool = False,
+        retain_all_partitions: bool = False,
+        retain_partitions_tables: list[str] | None = None,
+        max_workers: int | None = None,
+        stream: bool = False,
+        incremental: bool = False,
+        manifest_path: str | None = None,
+    ) -> dict:
+        """Import a ``.pbir`` or ``.pbism`` item from a local PBIP folder."""
+        return await self._run(
+            import_item,
+            workspace_id,
+            path,
+            item_properties=item_properties,
+            skip_if_exists=skip_if_exists,
+            retain_roles=retain_roles,
+            retain_all_partitions=retain_all_partitions,
+            retain_partitions_tables=retain_partitions_tables or [],
+            poller=self.poller,
+            max_workers=max_workers,
+            stream=stream,
+            item_cache=self.item_cache,
+            incremental=incremental,
+            manifest_path=manifest_path,
+        )
+
+    async def import_definition(
+        self,
+        workspace_id: str,
+        definition: ItemDefinition,
+        display_name: str,
+        item_type: str,
+        skip_if_exists: bool = False,
+        retain_roles: bool = False,
+        retain_all_partitions: bool = False,
+        retain_partitions_tables: list[str] | None = None,
+        stream: bool = False,
+        incremental: bool = False,
+        manifest_path: str | None = None,
+    ) -> dict:
+        """Create or update an item from an in-memory ``ItemDefinition``."""
+        return await self._run(
+            import_definition,
+            workspace_id,
+            definition,
+            display_name,
+            item_type,
+            skip_if_exists=skip_if_exists,
+            retain_roles=retain_roles,
+            retain_all_partitions=retain_all_partitions,
+            retain_partitions_tables=retain_partitions_tables or [],
+            poller=self.poller,
+            stream=stream,
+            item_cache=self.item_cache,
+            incremental=incremental,
+            manifest_path=manifest_path,
+        )
+
+    async def delete_item_by_id(self, workspace_id: str, item_id: str) -> None:
+        """Delete a Fabric item by its ID."""
+        await self._run(delete_item_by_id, workspace_id, item_id, item_cache=self.item_cache)
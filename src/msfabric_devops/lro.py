@@ -0,0 +1,266 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from typing import Any, Callable
+
+import requests
+
+from . import api
+from . import config
+from .exceptions import FabricError
+
+
+class LongRunningOperation(Future):
+    """
+    Future for a Fabric long-running operation.
+
+    Resolves to the decoded operation result (or ``None`` when the operation
+    has no result body) and raises ``FabricError`` if the operation failed.
+    Use ``result()`` to block, ``add_done_callback()`` to react, or
+    ``asyncio.wrap_future()`` to await it from a coroutine.
+
+    Attributes
+    ----------
+    operation_url : str or None
+        Status URL of the operation, ``None`` if the service answered
+        synchronously.
+    status : str
+        Last status reported by the service (lower-cased).
+    """
+
+    def __init__(self, operation_url: str | None = None) -> None:
+        super().__init__()
+        self.operation_url = operation_url
+        self.status = "notstarted" if operation_url else "succeeded"
+        # (202 response, perf_counter) set by the poller, for instrumentation
+        self._started: tuple[requests.Response, float] | None = None
+
+    def then(self, func: Callable[[Any], Any]) -> "LongRunningOperation":
+        """
+        Return a new operation resolved with ``func(result)``.
+
+        For an operation tracked by an ``OperationPoller``, *func* runs on
+        the poller's callback workers, never on its polling thread.
+        """
+        chained = LongRunningOperation(self.operation_url)
+
+        def _done(future: Future) -> None:
+            if future.cancelled():
+                chained.cancel()
+                return
+            try:
+                result = func(future.result())
+            except BaseException as ex:
+                _resolve(chained, exception=ex)
+            else:
+                _resolve(chained, result=result)
+
+        self.add_done_callback(_done)
+        return chained
+
+
+class OperationPoller:
+    """
+    Single background thread that polls many long-running operations.
+
+    Operations are kept in a heap ordered by their next poll time, so any
+    number of outstanding operations share one thread and one pooled HTTP
+    session. Each poll honours the service ``Retry-After`` header and falls
+    back to capped exponential backoff (see ``api.next_poll_delay``).
+
+    Finished operations are handed to a small pool of callback workers,
+    which fetch the result and resolve the future. Done callbacks, including
+    ``LongRunningOperation.then`` functions, therefore run on those workers
+    and cannot stall the polling of other operations. Request errors are
+    raised from the future as ``FabricError``.
+
+    Parameters
+    ----------
+    session : requests.Session, optional
+        Pooled HTTP session used for status and result requests.
+    initial_delay : float
+        Delay before the first poll when the service gives no hint.
+    max_delay : float
+        Upper bound of the exponential backoff between polls.
+    token_provider : callable, optional
+        Returns the current bearer token. Called before every status and
+        result request, so operations outliving a token are polled with its
+        refreshed successor instead of the token they were submitted with.
+    callback_workers : int
+        Number of callback worker threads.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        initial_delay: float = config.LRO_INITIAL_DELAY,
+        max_delay: float = config.LRO_MAX_DELAY,
+        token_provider: Callable[[], str] | None = None,
+        callback_workers: int = config.LRO_CALLBACK_WORKERS,
+    ) -> None:
+        self.session = session
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.token_provider = token_provider
+        self._queue: list[tuple[float, int, LongRunningOperation, dict, int]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._callbacks = ThreadPoolExecutor(
+            max_workers=callback_workers,
+            thread_name_prefix="msfabric-lro-callback",
+        )
+        self._closed = False
+
+    def __len__(self) -> int:
+        """Number of operations still being polled."""
+        with self._condition:
+            return len(self._queue)
+
+    def completed(self, result: Any) -> LongRunningOperation:
+        """Return an already resolved operation for a synchronous response."""
+        operation = LongRunningOperation()
+        operation.set_result(result)
+        return operation
+
+    def submit(self, response: requests.Response, headers: dict) -> LongRunningOperation:
+        """
+        Track the operation started by a 202 *response*.
+
+        Parameters
+        ----------
+        response : requests.Response
+            The 202 response carrying the operation ``Location``.
+        headers : dict
+            Request headers used for polls. Their ``Authorization`` is
+            replaced by the *token_provider* token when one is set.
+        """
+        operation_url = response.headers.get("Location")
+        if not operation_url:
+            raise FabricError("LRO response has no Location header")
+
+        operation = LongRunningOperation(operation_url)
+        operation._started = (response, time.perf_counter())
+        delay = self._delay(0, response.headers.get("Retry-After"))
+        self._schedule(delay, operation, headers, 0)
+        return operation
+
+    def close(self) -> None:
+        """Stop polling and fail every operation that is still pending."""
+        with self._condition:
+            self._closed = True
+            pending = [entry[2] for entry in self._queue]
+            self._queue.clear()
+            self._condition.notify_all()
+        for operation in pending:
+            _resolve(operation, exception=FabricError("Operation poller was closed"))
+        if self._thread is not None:
+            self._thread.join()
+        self._callbacks.shutdown(wait=False)
+
+    def _delay(self, attempt: int, retry_after: str | None) -> float:
+        return api.next_poll_delay(attempt, retry_after, self.initial_delay, self.max_delay)
+
+    def _schedule(self, delay: float, operation: LongRunningOperation, headers: dict, attempt: int) -> None:
+        with self._condition:
+            if self._closed:
+                raise FabricError("Operation poller was closed")
+            heapq.heappush(
+                self._queue,
+                (time.monotonic() + delay, next(self._sequence), operation, headers, attempt),
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="msfabric-lro-poller",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._queue:
+                        wait = self._queue[0][0] - time.monotonic()
+                        if wait <= 0:
+                            break
+                        self._condition.wait(wait)
+                    else:
+                        self._condition.wait()
+                if self._closed:
+                    return
+                _, _, operation, headers, attempt = heapq.heappop(self._queue)
+            self._poll(operation, headers, attempt)
+
+    def _headers(self, headers: dict) -> dict:
+        if self.token_provider is None:
+            return headers
+        return {**headers, "Authorization": f"Bearer {self.token_provider()}"}
+
+    def _poll(self, operation: LongRunningOperation, headers: dict, attempt: int) -> None:
+        if operation.cancelled():
+            return
+        try:
+            status, lro_response = api.get_operation_state(
+                operation.operation_url, self._headers(headers), self.session
+            )
+        except Exception as ex:
+            self._callbacks.submit(_resolve, operation, exception=_fabric_error(ex))
+            return
+        operation.status = status
+        if status not in ["succeeded", "failed"]:
+            delay = self._delay(attempt + 1, lro_response.headers.get("Retry-After"))
+            try:
+                self._schedule(delay, operation, headers, attempt + 1)
+            except FabricError as ex:
+                # Closed while this operation was being polled
+                _resolve(operation, exception=ex)
+            return
+        self._callbacks.submit(self._complete, operation, status, lro_response, headers, attempt)
+
+    def _complete(
+        self,
+        operation: LongRunningOperation,
+        status: str,
+        lro_response: requests.Response,
+        headers: dict,
+        attempt: int,
+    ) -> None:
+        try:
+            response, started = operation._started
+            api.record_operation_wait(self.session, response, time.perf_counter() - started, attempt + 1, status)
+            result_response = api.complete_operation(
+                status, lro_response, self._headers(headers), self.session
+            )
+            result = (
+                api.parse_fabric_api_response(result_response)
+                if result_response is not None
+                else None
+            )
+        except Exception as ex:
+            _resolve(operation, exception=_fabric_error(ex))
+        else:
+            _resolve(operation, result=result)
+
+
+def _fabric_error(ex: Exception) -> Exception:
+    if isinstance(ex, requests.RequestException):
+        error = FabricError(str(ex))
+        error.__cause__ = ex
+        return error
+    return ex
+
+
+def _resolve(operation: Future, result: Any = None, exception: BaseException | None = None) -> None:
+    # The caller may have cancelled the operation while it was being polled
+    try:
+        if exception is not None:
+            operation.set_exception(exception)
+        else:
+            operation.set_result(result)
+    except InvalidStateError:
+        pass
@@ -0,0 +1,168 @@
+import random
+import time
+from urllib.parse import urlparse
+
+import requests
+
+from . import config
+from .throttling import parse_retry_after
+
+# Methods that can be sent twice without changing the outcome
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# POST actions of the Fabric API that are safe to repeat: exporting a
+# definition has no side effect and replacing it with the same parts twice
+# leaves the item in the same state
+IDEMPOTENT_POST_ACTIONS = ("/getdefinition", "/updatedefinition")
+
+
+class RetryPolicy:
+    """
+    Decide whether and when a failed request is sent again.
+
+    Transient failures (connection errors, timeouts and the statuses in
+    *retry_statuses*) are retried with decorrelated-jitter backoff: each
+    delay is drawn between *base_delay* and three times the previous one,
+    capped at *max_delay*, so parallel callers spread out instead of
+    retrying in lock-step. A ``Retry-After`` header on the response takes
+    precedence. Retries stop after *max_attempts* sends or once the next
+    attempt would start after *deadline* seconds.
+
+    Requests that may have been processed are only retried when repeating
+    them is harmless: idempotent methods and the idempotent Fabric POST
+    actions (``getDefinition``/``updateDefinition``). A POST that creates an
+    item is retried only when the connection could not be established, so
+    the service never saw it.
+
+    Subclass and override ``is_retryable`` to change the classification.
+
+    Parameters
+    ----------
+    max_attempts : int
+        Maximum number of sends, the first one included.
+    base_delay : float
+        Smallest delay between two attempts, in seconds.
+    max_delay : float
+        Largest delay between two attempts, in seconds.
+    deadline : float
+        Total time budget of a request and its retries, in seconds.
+    retry_statuses : frozenset[int]
+        HTTP statuses considered transient.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = config.RETRY_MAX_ATTEMPTS,
+        base_delay: float = config.RETRY_BASE_DELAY,
+        max_delay: float = config.RETRY_MAX_DELAY,
+        deadline: float = config.RETRY_DEADLINE,
+        retry_statuses: frozenset[int] = config.RETRY_STATUSES,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def is_idempotent(self, method: str, url: str) -> bool:
+        """Return ``True`` if sending the request twice is harmless."""
+        method = method.upper()
+        if method in IDEMPOTENT_METHODS:
+            return True
+        return method == "POST" and urlparse(url).path.rstrip("/").lower().endswith(IDEMPOTENT_POST_ACTIONS)
+
+    def is_retryable(
+        self,
+        method: str,
+        url: str,
+        response: requests.Response | None = None,
+        exception: BaseException | None = None,
+    ) -> bool:
+        """Classify one failed attempt as transient (``True``) or final."""
+        if exception is not None:
+            if isinstance(exception, requests.exceptions.ConnectTimeout):
+                # Never reached the service, safe for any method
+                return True
+            if not self.is_idempotent(method, url):
+                return False
+            return isinstance(exception, (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+                requests.exceptions.ChunkedEncodingError,
+            ))
+        if response is not None and response.status_code in self.retry_statuses:
+            return self.is_idempotent(method, url)
+        return False
+
+    def retry_delay(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        elapsed: float,
+        previous_delay: float | None = None,
+        response: requests.Response | None = None,
+        exception: BaseException | None = None,
+    ) -> float | None:
+        """
+        Return the seconds to wait before sending the request again, or
+        ``None`` when it must not be retried.
+
+        Parameters
+        ----------
+        attempt : int
+            Number of sends already made (1 after the first failure).
+        elapsed : float
+            Seconds since the first send.
+        previous_delay : float, optional
+            Delay applied before the current attempt, if any.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if not self.is_retryable(method, url, response=response, exception=exception):
+            return None
+
+        delay = None
+        if response is not None:
+            delay = parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            upper = max(self.base_delay, (previous_delay or self.base_delay) * 3)
+            delay = min(self.max_delay, random.uniform(self.base_delay, upper))
+
+        if elapsed + delay > self.deadline:
+            return None
+        return delay
+
+
+def send_with_retry(send, policy: RetryPolicy | None, method: str, url: str, on_retry=None) -> requests.Response:
+    """
+    Call ``send()`` until it returns a final response under *policy*.
+
+    The last response (or exception) is handed back to the caller once
+    the policy gives up. ``on_retry(attempt, delay, response, exception)``
+    is called before each wait.
+    """
+    if policy is None:
+        return send()
+
+    started = time.monotonic()
+    attempt = 0
+    delay = None
+    while True:
+        attempt += 1
+        response = error = None
+        try:
+            response = send()
+        except requests.exceptions.RequestException as ex:
+            error = ex
+            delay = policy.retry_delay(method, url, attempt, time.monotonic() - started, delay, exception=ex)
+            if delay is None:
+                raise
+        else:
+            delay = policy.retry_delay(method, url, attempt, time.monotonic() - started, delay, response=response)
+            if delay is None:
+                return response
+            response.close()
+        if on_retry is not None:
+            on_retry(attempt, delay, response, error)
+        time.sleep(delay)
@@ -1,7 +1,52 @@
 import os
 import json
-import re
+from concurrent.futures import ThreadPoolExecutor
 from . import config
+from . import tmdl
+
+def set_tmsl_parameter_value(expression: str | list[str], value: str) -> str | list[str]:
+    """
+    Return a TMSL parameter *expression* (a string or a list of lines) with its value replaced.
+
+    Raises
+    ------
+    ValueError
+        If the expression is not a text parameter (see ``tmdl.set_m_string_value``).
+    """
+    if isinstance(expression, list):
+        # Multi-line expressions are stored as a list of lines
+        return tmdl.set_m_string_value("\n".join(expression), value).split("\n")
+    return tmdl.set_m_string_value(expression or "", value)
+
+
+def set_parameter_values(expressions: dict, parameters: dict[str, str]) -> None:
+    """
+    Set Power Query text parameter values in parsed expressions, in place.
+
+    *expressions* maps every name of *parameters* to a TMDL ``expression``
+    node (see ``tmdl.set_parameter_value``) or to a TMSL expression object
+    of ``model.bim`` (see ``set_tmsl_parameter_value``).
+
+    Raises
+    ------
+    ValueError
+        If one or more parameters are not text parameters. The others are
+        still set, so callers must discard the document.
+    """
+    not_text_keys = []
+    for name, value in parameters.items():
+        expression = expressions[name]
+        try:
+            if isinstance(expression, tmdl.TmdlNode):
+                tmdl.set_parameter_value(expression, value)
+            else:
+                expression["expression"] = set_tmsl_parameter_value(expression.get("expression"), value)
+        except ValueError:
+            not_text_keys.append(name)
+
+    if not_text_keys:
+        raise ValueError(f"The following parameters are not text parameters and were not changed: {not_text_keys}")
+
 
 def set_semantic_model_parameters(
     path: str,
@@ -31,7 +76,26 @@ def set_semantic_model_parameters(
         If the model definition cannot be located at *path*.
     ValueError
         If *fail_if_not_found* is ``True`` and one or more parameter names
-        are absent from the model.
+        are absent from the model, or if a parameter is not a text
+        parameter (e.g. a date or a query). Nothing is written then.
+    """
+    file_name, changed, missing_keys = _apply_parameters(path, parameters, fail_if_not_found)
+
+    if missing_keys:
+        config.print_color("Parameter(s) not found: " + ", ".join(missing_keys), "yellow")
+    if changed:
+        config.print_color(f"{file_name} updated ✅", "green")
+    else:
+        config.print_color("No changes needed", "yellow")
+
+
+def _apply_parameters(path: str, parameters: dict[str, str], fail_if_not_found: bool) -> tuple[str, bool, list[str]]:
+    """
+    Write *parameters* to the model at *path* without printing anything.
+
+    Returns the name of the parameter file, whether it was rewritten and
+    the parameter names that were not found (see
+    ``set_semantic_model_parameters`` for the rules and errors).
     """
     model_path = os.path.join(path, "definition")
 
@@ -45,6 +109,7 @@ def set_semantic_model_parameters(
         raise FileNotFoundError(f"Cannot find semantic model definition: '{model_path}'")
 
     changed = False
+    missing_keys = []
 
     # ----- Load model -----
     # tmdl
@@ -55,39 +120,36 @@ def set_semantic_model_parameters(
             raise FileNotFoundError(f"expressions.tmdl not found at: {file_path}")
 
         # Read file
-        with open(file_path, "r", encoding="utf-8") as f:
+        # newline="" keeps CRLF line endings as they are
+        with open(file_path, "r", encoding="utf-8", newline="") as f:
             content = f.read()
 
         original = content
-        missing_keys = []
 
-        # Apply replacements
-        for key, value in parameters.items():
-            pattern = rf"{re.escape(key)}\s*=\s*\".*?\""
-            # Check if key exists
-            if not re.search(pattern, content):
-                missing_keys.append(key)
-                continue  # skip replacement
+        # Parse once and index the parameter expressions by name
+        document = tmdl.parse_tmdl(content)
+        expressions = {
+            node.name: node
+            for node in document.children("expression")
+            if node.expression is not None
+        }
 
-            # Replace
-            replacement = f'{key} = "{value}"'
-            content = re.sub(pattern, replacement, content)
+        # Apply replacements, skipping the keys that do not exist
+        missing_keys = [key for key in parameters if key not in expressions]
+        set_parameter_values(expressions, {key: value for key, value in parameters.items() if key in expressions})
+
+        content = document.text()
 
         # Raise error if any key is missing
         if missing_keys and fail_if_not_found:
             raise ValueError(f"The following parameters were not found in the file: {missing_keys}")
-        elif missing_keys:
-            config.print_color("Parameter(s) not found: " + ", ".join(missing_keys), "yellow")
 
         # Save only if modified
         if content != original:
-            with open(file_path, "w", encoding="utf-8") as f:
+            with open(file_path, "w", encoding="utf-8", newline="") as f:
                 f.write(content)
-
-            config.print_color("expressions.tmdl updated ✅", "green")
-        else:
-            config.print_color("No changes needed", "yellow")
-        return
+            changed = True
+        return "expressions.tmdl", changed, missing_keys
 
     # model.bim
     else:
@@ -98,30 +160,83 @@ def set_semantic_model_parameters(
         # ----- Update expression parameters -----
         expressions = model.get("model", {}).get("expressions", [])
 
-        for name, value in parameters.items():
-            match = next((expr for expr in expressions if expr.get("name") == name), None)
+        # Index once so that every parameter is a dict lookup (first match wins)
+        expressions_by_name = {}
+        for expr in expressions:
+            expressions_by_name.setdefault(expr.get("name"), expr)
 
-            if not match:
+        for name in parameters:
+            if name not in expressions_by_name:
                 if fail_if_not_found:
                     raise ValueError(f"Cannot find parameter with name '{name}'")
-                else:
-                    config.print_color(f"Cannot find parameter with name '{name}'","yellow")
-                    continue
-
-            expr_text = match.get("expression")
+                missing_keys.append(name)
 
-            # Equivalent of: -replace """?(.*)""? meta", """$parameterValue"" meta"
-            expr_text = re.sub(r'\"?.*\"?\s+meta', f'"{value}" meta', expr_text)
-
-            match["expression"] = expr_text
-            changed = True
+        applied = {name: value for name, value in parameters.items() if name in expressions_by_name}
+        set_parameter_values(expressions_by_name, applied)
+        changed = bool(applied)
 
         # ----- Save if changed -----
         if changed:
             with open(model_path, "w", encoding="utf-8") as f:
                 json.dump(model, f, indent=2)
-        else:
-            config.print_color("No changes applied","yellow")
+        return "model.bim", changed, missing_keys
+
+
+def set_semantic_model_parameters_many(
+    paths: list[str],
+    parameters: dict[str, str],
+    fail_if_not_found: bool = False,
+    max_workers: int | None = None,
+) -> dict[str, Exception | None]:
+    """
+    Apply the same parameter values to many local semantic models in parallel.
+
+    Each model is handled like ``set_semantic_model_parameters`` on a thread
+    pool; a failure in one model does not stop the others. The workers do
+    not print: once all models are done, one line per model is printed, in
+    the order of *paths*.
+
+    Parameters
+    ----------
+    paths : list[str]
+        Root directories of the semantic models.
+    parameters : dict[str, str]
+        Mapping of parameter name → new value.
+    fail_if_not_found : bool
+        Passed to ``set_semantic_model_parameters`` for every model.
+    max_workers : int, optional
+        Number of models processed at once (``None`` lets
+        ``ThreadPoolExecutor`` choose).
+
+    Returns
+    -------
+    dict[str, Exception | None]
+        For every path, ``None`` on success or the exception it raised.
+    """
+
+    def apply(path: str) -> tuple[str, bool, list[str]] | Exception:
+        try:
+            return _apply_parameters(path, parameters, fail_if_not_found)
+        except Exception as ex:
+            return ex
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        outcomes = dict(zip(paths, executor.map(apply, paths)))
+
+    results = {}
+    for path, outcome in outcomes.items():
+        if isinstance(outcome, Exception):
+            config.print_color(f"{path}: failed: {outcome}", "red")
+            results[path] = outcome
+            continue
+        file_name, changed, missing_keys = outcome
+        message = f"{path}: {file_name} updated" if changed else f"{path}: no changes needed"
+        if missing_keys:
+            message += " (not found: " + ", ".join(missing_keys) + ")"
+        config.print_color(message, "green" if changed and not missing_keys else "yellow")
+        results[path] = None
+    return results
+
 
 def main():
     set_semantic_model_parameters(
@@ -155,3 +270,41 @@ class SemanticModelsMixin:
     ) -> None:
         """Set Power Query parameter values in a local semantic model definition."""
         set_semantic_model_parameters(path, parameters, fail_if_not_found)
+
+    def set_semantic_model_parameters_many(
+        self,
+        paths: list[str],
+        parameters: dict[str, str],
+        fail_if_not_found: bool = False,
+        max_workers: int | None = None,
+    ) -> dict[str, Exception | None]:
+        """Apply the same parameter values to many local semantic models in parallel."""
+        return set_semantic_model_parameters_many(paths, parameters, fail_if_not_found, max_workers)
+
+
+class AsyncSemanticModelsMixin:
+    """Mixin that exposes local semantic model operations as coroutines.
+
+    The edits read and write local files, so they run on the host class's
+    worker pool through its ``_offload`` coroutine instead of blocking the
+    event loop.
+    """
+
+    async def set_semantic_model_parameters(
+        self,
+        path: str,
+        parameters: dict[str, str],
+        fail_if_not_found: bool = False,
+    ) -> None:
+        """Set Power Query parameter values in a local semantic model definition."""
+        await self._offload(set_semantic_model_parameters, path, parameters, fail_if_not_found)
+
+    async def set_semantic_model_parameters_many(
+        self,
+        paths: list[str],
+        parameters: dict[str, str],
+        fail_if_not_found: bool = False,
+        max_workers: int | None = None,
+    ) -> dict[str, Exception | None]:
+        """Apply the same parameter values to many local semantic models in parallel."""
+        return await self._offload(set_semantic_model_parameters_many, paths, parameters, fail_if_not_found, max_workers)
@@ -0,0 +1,532 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+import requests
+
+from . import config
+from .cache import ItemInventoryCache
+from .definitions import DefinitionPart, ItemDefinition
+from .exceptions import FabricError, FabricNotFoundError
+from .items import diff_part_hashes, get_item_by_id, get_item_definition, get_items, import_item
+from .lro import LongRunningOperation, OperationPoller
+
+
+class SnapshotStore:
+    """
+    Content-addressed history of item definitions on local disk.
+
+    Every part is stored once as a blob named by the SHA-256 of its
+    content, under ``objects/``; a snapshot is a small JSON manifest
+    mapping part paths to blob hashes, under
+    ``snapshots/<workspace id>/<item id>/<timestamp>.json``. Parts that did
+    not change since any earlier snapshot, of any item, in any workspace,
+    are not written again, so disk usage and write I/O grow with what
+    changed rather than with the number of items.
+
+    Blobs are stored uncompressed so that a restore can hard-link them
+    into a folder and ``definition`` can hand them to ``import_item`` as
+    files streamed from disk.
+
+    ``save`` and ``gc`` can run concurrently: within a process ``gc`` waits
+    for the saves in progress and holds new ones back, and across
+    processes it leaves blobs written or reused in the last
+    ``config.SNAPSHOT_GC_GRACE`` seconds alone, so that a snapshot whose
+    manifest is not written yet keeps its blobs.
+
+    Parameters
+    ----------
+    root : str
+        Directory of the store, created if missing.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = Path(root).resolve()
+        self.objects = self.root / "objects"
+        self.snapshots_dir = self.root / "snapshots"
+        self.objects.mkdir(parents=True, exist_ok=True)
+        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+        self._guard = threading.Condition()
+        self._saves = 0
+        self._waiting_saves = 0
+        self._collecting = False
+
+    # ------------------------------------------------------------------
+    # Blobs
+    # ------------------------------------------------------------------
+
+    def blob_path(self, digest: str) -> Path:
+        return self.objects / digest[:2] / digest[2:]
+
+    def has_blob(self, digest: str) -> bool:
+        return self.blob_path(digest).is_file()
+
+    def put_blob(self, data: bytes, digest: str | None = None) -> tuple[str, bool]:
+        """Store *data* unless present; return its hash and whether it was written."""
+        digest = digest or hashlib.sha256(data).hexdigest()
+        path = self.blob_path(digest)
+        try:
+            # Reused blobs count as new for the gc grace period
+            os.utime(path)
+            return digest, False
+        except FileNotFoundError:
+            pass
+        except OSError:
+            # Present but read-only
+            return digest, False
+        path.parent.mkdir(exist_ok=True)
+        # Written under a unique name and renamed, so that concurrent
+        # writers of the same blob never expose a partial file
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+        return digest, True
+
+    def get_blob(self, digest: str) -> bytes:
+        return self.blob_path(digest).read_bytes()
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _saving(self):
+        with self._guard:
+            self._waiting_saves += 1
+            self._guard.wait_for(lambda: not self._collecting)
+            self._waiting_saves -= 1
+            self._saves += 1
+        try:
+            yield
+        finally:
+            with self._guard:
+                self._saves -= 1
+                self._guard.notify_all()
+
+    def _manifest_path(self, snapshot_id: str) -> Path:
+        path = (self.snapshots_dir / f"{snapshot_id}.json").resolve()
+        if not path.is_relative_to(self.snapshots_dir):
+            raise FabricError(f"Invalid snapshot id: {snapshot_id}")
+        return path
+
+    def save(
+        self,
+        definition: ItemDefinition,
+        workspace_id: str,
+        item_id: str,
+        display_name: str | None = None,
+        item_type: str | None = None,
+    ) -> dict:
+        """
+        Record *definition* as a new snapshot of an item.
+
+        Returns
+        -------
+        dict
+            The manifest: ``id``, ``createdAt``, ``workspaceId``, ``itemId``,
+            ``displayName``, ``type``, ``format``, ``parts`` (path -> hash),
+            ``skipped`` (non-inline parts), ``bytes``, ``newBytes`` (bytes
+            actually written) and ``changedParts`` (paths that differ from
+            the previous snapshot of the item, all of them for the first).
+        """
+        with self._saving():
+            return self._save(definition, workspace_id, item_id, display_name, item_type)
+
+    def _save(
+        self,
+        definition: ItemDefinition,
+        workspace_id: str,
+        item_id: str,
+        display_name: str | None,
+        item_type: str | None,
+    ) -> dict:
+        previous = self.latest(workspace_id, item_id)
+        parts: dict[str, str] = {}
+        skipped: list[str] = []
+        size = written = 0
+        for part in definition:
+            if part.payload_type != "InlineBase64":
+                skipped.append(part.path)
+                continue
+            digest = part.sha256
+            data = part.data
+            _, created = self.put_blob(data, digest)
+            written += len(data) if created else 0
+            parts[part.path] = digest
+            size += len(data)
+
+        created_at = datetime.now(timezone.utc)
+        snapshot_id = f"{workspace_id}/{item_id}/{created_at.strftime('%Y%m%dT%H%M%S%fZ')}"
+        manifest = {
+            "id": snapshot_id,
+            "createdAt": created_at.isoformat(),
+            "workspaceId": workspace_id,
+            "itemId": item_id,
+            "displayName": display_name,
+            "type": item_type,
+            "format": definition.format,
+            "parts": dict(sorted(parts.items())),
+            "skipped": sorted(skipped),
+            "bytes": size,
+            "newBytes": written,
+            "changedParts": diff_part_hashes(parts, previous["parts"] if previous else {}),
+        }
+        manifest_path = self._manifest_path(snapshot_id)
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = manifest_path.with_name(manifest_path.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_file, manifest_path)
+        return manifest
+
+    def load(self, snapshot_id: str) -> dict:
+        """Return the manifest of a snapshot."""
+        try:
+            with open(self._manifest_path(snapshot_id), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise FabricNotFoundError(f"Snapshot not found: {snapshot_id}") from None
+
+    def list_snapshots(self, workspace_id: str | None = None, item_id: str | None = None) -> list[str]:
+        """Return snapshot ids, oldest first within each item, optionally for one workspace or item."""
+        base = self.snapshots_dir
+        if workspace_id:
+            base = base / workspace_id
+            if item_id:
+                base = base / item_id
+        if not base.is_dir():
+            return []
+        return sorted(
+            path.relative_to(self.snapshots_dir).with_suffix("").as_posix()
+            for path in base.rglob("*.json")
+        )
+
+    def latest(self, workspace_id: str, item_id: str) -> dict | None:
+        """Return the manifest of the most recent snapshot of an item, or ``None``."""
+        snapshot_ids = self.list_snapshots(workspace_id, item_id)
+        return self.load(snapshot_ids[-1]) if snapshot_ids else None
+
+    def delete(self, snapshot_id: str) -> None:
+        """Delete a snapshot manifest; its blobs are reclaimed by ``gc``."""
+        try:
+            self._manifest_path(snapshot_id).unlink()
+        except FileNotFoundError:
+            raise FabricNotFoundError(f"Snapshot not found: {snapshot_id}") from None
+
+    def gc(self, grace: float = config.SNAPSHOT_GC_GRACE) -> dict:
+        """
+        Remove the blobs no snapshot refers to; return ``{"removed", "bytes"}``.
+
+        Blobs written or reused less than *grace* seconds ago are kept (see
+        the class documentation), as are temporary files of writers still
+        in progress.
+        """
+        with self._guard:
+            # Saves held back by the previous collection go first
+            self._guard.wait_for(lambda: not self._collecting and not self._waiting_saves)
+            self._collecting = True
+            self._guard.wait_for(lambda: not self._saves)
+        try:
+            return self._gc(grace)
+        finally:
+            with self._guard:
+                self._collecting = False
+                self._guard.notify_all()
+
+    def _gc(self, grace: float) -> dict:
+        referenced = set()
+        for snapshot_id in self.list_snapshots():
+            try:
+                referenced.update(self.load(snapshot_id)["parts"].values())
+            except FabricNotFoundError:
+                # Deleted since it was listed
+                continue
+        cutoff = time.time() - grace
+        removed = size = 0
+        for path in self.objects.glob("*/*"):
+            if path.name.startswith(".tmp-") or path.parent.name + path.name in referenced:
+                continue
+            try:
+                stat = path.stat()
+                if stat.st_mtime > cutoff:
+                    continue
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            size += stat.st_size
+            removed += 1
+        return {"removed": removed, "bytes": size}
+
+    # ------------------------------------------------------------------
+    # Restore
+    # ------------------------------------------------------------------
+
+    def definition(self, snapshot_id: str) -> ItemDefinition:
+        """Return a snapshot as an ``ItemDefinition`` whose parts are read from the store on demand."""
+        manifest = self.load(snapshot_id)
+        return ItemDefinition(
+            (DefinitionPart(path, data=self.blob_path(digest)) for path, digest in manifest["parts"].items()),
+            format=manifest.get("format"),
+        )
+
+    def restore(self, snapshot_id: str, output_dir: str, link: bool = False) -> dict:
+        """
+        Write a snapshot into a PBIP item folder.
+
+        Files whose content already matches are left untouched, so restoring
+        over an earlier restore only writes what changed. Files of
+        *output_dir* that are not part of the snapshot are kept.
+
+        Parameters
+        ----------
+        snapshot_id : str
+            Id of the snapshot (see ``list_snapshots``).
+        output_dir : str
+            Item folder, created if missing.
+        link : bool
+            Hard-link the blobs instead of copying them (falls back to a
+            copy across file systems). Linked files share their content with
+            the store and must not be edited in place.
+
+        Returns
+        -------
+        dict
+            ``{"snapshotId", "outputDir", "written", "unchanged", "bytes"}``.
+        """
+        manifest = self.load(snapshot_id)
+        output_path = Path(output_dir).resolve()
+        written = unchanged = size = 0
+        for path, digest in manifest["parts"].items():
+            target = (output_path / path).resolve()
+            if not target.is_relative_to(output_path):
+                raise FabricError(f"Refusing to write part outside of output directory: {path}")
+            blob = self.blob_path(digest)
+            blob_size = blob.stat().st_size
+            size += blob_size
+            if target.is_file() and target.stat().st_size == blob_size:
+                if hashlib.sha256(target.read_bytes()).hexdigest() == digest:
+                    unchanged += 1
+                    continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if target.exists():
+                target.unlink()
+            if link:
+                try:
+                    os.link(blob, target)
+                except OSError:
+                    shutil.copyfile(blob, target)
+            else:
+                shutil.copyfile(blob, target)
+            written += 1
+        return {
+            "snapshotId": snapshot_id,
+            "outputDir": str(output_path),
+            "written": written,
+            "unchanged": unchanged,
+            "bytes": size,
+        }
+
+
+def snapshot_item(
+    token: str,
+    workspace_id: str,
+    item_id: str,
+    store: SnapshotStore,
+    format: str | None = None,
+    item: dict | None = None,
+    session: requests.Session | None = None,
+    item_cache: ItemInventoryCache | None = None,
+) -> dict:
+    """
+    Export an item definition into *store* and return the snapshot manifest.
+
+    Parameters
+    ----------
+    token : str
+        A valid bearer access token.
+    workspace_id : str
+        The Fabric workspace ID.
+    item_id : str
+        The Fabric item ID.
+    store : SnapshotStore
+        Store receiving the snapshot.
+    format : str, optional
+        Optional export format (e.g. ``"TMDL"``).
+    item : dict, optional
+        The item as listed, for its ``displayName`` and ``type``; looked up
+        when omitted.
+    session : requests.Session, optional
+        Pooled HTTP session to reuse connections.
+    item_cache : ItemInventoryCache, optional
+        Inventory used to look the item up.
+    """
+    if item is None:
+        item = get_item_by_id(token, workspace_id, item_id, session=session, item_cache=item_cache)
+    definition = get_item_definition(token, workspace_id, item_id, format=format, session=session)
+    return store.save(definition, workspace_id, item_id, item.get("displayName"), item.get("type"))
+
+
+def snapshot_workspace(
+    token: str | Callable[[], str],
+    workspace_id: str,
+    store: SnapshotStore,
+    item_types: list[str] | None = None,
+    format: str | None = None,
+    max_workers: int = config.SNAPSHOT_MAX_WORKERS,
+    session: requests.Session | None = None,
+    item_cache: ItemInventoryCache | None = None,
+) -> dict[str, dict]:
+    """
+    Snapshot every item of a workspace concurrently.
+
+    The workspace is listed once; a failure (e.g. an item type without a
+    definition API) is reported for its item and does not stop the batch.
+
+    Parameters
+    ----------
+    token : str or callable
+        A valid bearer access token, or a callable returning one for each
+        request so long runs pick up refreshed tokens.
+    workspace_id : str
+        The Fabric workspace ID.
+    store : SnapshotStore
+        Store receiving the snapshots.
+    item_types : list[str], optional
+        Only snapshot items of these types, e.g. ``["SemanticModel", "Report"]``.
+    format : str, optional
+        Optional export format.
+    max_workers : int
+        Maximum number of definitions exported at the same time.
+    session : requests.Session, optional
+        Pooled HTTP session to reuse connections.
+    item_cache : ItemInventoryCache, optional
+        Inventory used to list the workspace.
+
+    Returns
+    -------
+    dict[str, dict]
+        For every item id: ``status`` (``saved`` or ``failed``),
+        ``snapshot`` (the manifest or ``None``) and ``error``.
+    """
+    wanted = {item_type.lower() for item_type in item_types} if item_types else None
+    items = [
+        item for item in get_items(token, workspace_id, session=session, item_cache=item_cache)
+        if wanted is None or item["type"].lower() in wanted
+    ]
+
+    def snapshot(item: dict) -> dict:
+        try:
+            manifest = snapshot_item(token, workspace_id, item["id"], store, format=format, item=item, session=session)
+        except Exception as ex:
+            config.print_color(f"Failed to snapshot {item['displayName']} ({item['type']}): {ex}", "red")
+            return {"status": "failed", "snapshot": None, "error": str(ex)}
+        return {"status": "saved", "snapshot": manifest, "error": None}
+
+    if not items:
+        return {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="msfabric-snapshots") as executor:
+        return dict(zip((item["id"] for item in items), executor.map(snapshot, items)))
+
+
+def import_snapshot(
+    token: str,
+    workspace_id: str,
+    store: SnapshotStore,
+    snapshot_id: str,
+    item_properties: dict | None = None,
+    session: requests.Session | None = None,
+    poller: OperationPoller | None = None,
+    item_cache: ItemInventoryCache | None = None,
+    **import_options,
+) -> dict | LongRunningOperation:
+    """
+    Import a snapshot into a workspace with ``import_item``.
+
+    The snapshot is hard-linked into a temporary PBIP folder (no content is
+    copied on most file systems) and streamed from there. The item keeps
+    its recorded display name unless *item_properties* overrides it;
+    *import_options* are passed on to ``import_item`` (e.g. ``retain_roles``).
+    """
+    manifest = store.load(snapshot_id)
+    properties = {"displayName": manifest.get("displayName"), **(item_properties or {})}
+    if not properties["displayName"]:
+        del properties["displayName"]
+    with tempfile.TemporaryDirectory(prefix="msfabric-snapshot-") as tmp:
+        store.restore(snapshot_id, tmp, link=True)
+        return import_item(
+            token,
+            workspace_id,
+            tmp,
+            item_properties=properties,
+            session=session,
+            poller=poller,
+            item_cache=item_cache,
+            stream=True,
+            **import_options,
+        )
+
+
+class SnapshotsMixin:
+    """Mixin that exposes definition snapshots as instance methods.
+
+    Requires the host class to provide a ``token`` property, a
+    ``token_manager`` attribute (used by bulk calls to resolve the token per
+    request), a ``session`` attribute, a ``poller`` attribute and an
+    ``item_cache`` attribute (see ``ItemsMixin``).
+    """
+
+    def snapshot_item(self, workspace_id: str, item_id: str, store: SnapshotStore, format: str | None = None) -> dict:
+        """Export an item definition into *store* and return the snapshot manifest."""
+        return snapshot_item(self.token, workspace_id, item_id, store, format=format, session=self.session, item_cache=self.item_cache)
+
+    def snapshot_workspace(
+        self,
+        workspace_id: str,
+        store: SnapshotStore,
+        item_types: list[str] | None = None,
+        format: str | None = None,
+        max_workers: int = config.SNAPSHOT_MAX_WORKERS,
+    ) -> dict[str, dict]:
+        """Snapshot every item of a workspace concurrently; returns a result per item id."""
+        return snapshot_workspace(
+            self.token_manager.get_token,
+            workspace_id,
+            store,
+            item_types=item_types,
+            format=format,
+            max_workers=max_workers,
+            session=self.session,
+            item_cache=self.item_cache,
+        )
+
+    def import_snapshot(
+        self,
+        workspace_id: str,
+        store: SnapshotStore,
+        snapshot_id: str,
+        item_properties: dict | None = None,
+        wait: bool = True,
+        **import_options,
+    ) -> dict | LongRunningOperation:
+        """Import a snapshot into a workspace (see ``import_item`` for *import_options*)."""
+        return import_snapshot(
+            self.token,
+            workspace_id,
+            store,
+            snapshot_id,
+            item_properties=item_properties,
+            session=self.session,
+            poller=None if wait else self.poller,
+            item_cache=self.item_cache,
+            **import_options,
+        )
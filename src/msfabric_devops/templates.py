@@ -0,0 +1,252 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+import requests
+
+from . import config
+from . import tmdl
+from .cache import ItemInventoryCache
+from .definitions import ItemDefinition
+from .items import build_item_parts, import_definition, list_item_files
+from .semantic_models import set_parameter_values
+
+TMDL_EXPRESSIONS_PATH = "definition/expressions.tmdl"
+TMSL_MODEL_PATH = "model.bim"
+
+
+class ModelTemplate:
+    """
+    A semantic model folder loaded once and rendered for many environments.
+
+    The folder is read and base64-encoded once, and the file holding the
+    Power Query parameters (``definition/expressions.tmdl`` or
+    ``model.bim``) is parsed once. ``render`` returns an ``ItemDefinition``
+    in which only that file is re-encoded, and only when the parameter
+    values change it. Values are set like ``set_semantic_model_parameters``
+    sets them (see ``set_parameter_values``): in ``expressions.tmdl`` only
+    the string literals of the rendered parameters change, and every
+    other byte is kept. Every other part shares the template's payload.
+    Nothing is written to disk.
+
+    Parameters
+    ----------
+    path : str
+        Root directory of the semantic model (parent of ``definition/`` or
+        the folder containing ``model.bim``).
+    display_name : str, optional
+        Item name; defaults to the ``.platform`` display name or the folder name.
+    max_workers : int, optional
+        Threads used to read and encode the files (see ``build_item_parts``).
+
+    Raises
+    ------
+    FileNotFoundError
+        If the model has neither ``definition/expressions.tmdl`` nor ``model.bim``.
+    """
+
+    def __init__(self, path: str, display_name: str | None = None, max_workers: int | None = None) -> None:
+        self.path = Path(path).resolve()
+        self.item_type = "SemanticModel"
+        self.display_name = display_name or self._platform_display_name() or self.path.stem
+        self.definition = ItemDefinition.from_parts(
+            build_item_parts(self.path, list_item_files(self.path), max_workers=max_workers)
+        )
+        # Rendering mutates the parsed parameter file in place, then restores it
+        self._lock = threading.Lock()
+
+        if TMDL_EXPRESSIONS_PATH in self.definition:
+            self.parameter_path = TMDL_EXPRESSIONS_PATH
+            self._document = tmdl.parse_tmdl(self.definition[TMDL_EXPRESSIONS_PATH].text)
+            self._expressions = {
+                node.name: node
+                for node in self._document.children("expression")
+                if node.expression is not None
+            }
+            # Multi-line parameters keep their value in the body lines after ``=``
+            self._originals = {name: (node.expression, list(node.body)) for name, node in self._expressions.items()}
+        elif TMSL_MODEL_PATH in self.definition:
+            self.parameter_path = TMSL_MODEL_PATH
+            self._document = json.loads(self.definition[TMSL_MODEL_PATH].text)
+            self._expressions = {}
+            for expression in self._document.get("model", {}).get("expressions", []):
+                self._expressions.setdefault(expression.get("name"), expression)
+            self._originals = {name: expression.get("expression") for name, expression in self._expressions.items()}
+        else:
+            raise FileNotFoundError(f"Cannot find semantic model parameters in: '{self.path}'")
+        self._original_text = self.definition[self.parameter_path].text
+
+    def _platform_display_name(self) -> str | None:
+        platform_file = self.path / ".platform"
+        if not platform_file.is_file():
+            return None
+        with open(platform_file, "r", encoding="utf-8") as f:
+            return json.load(f).get("metadata", {}).get("displayName")
+
+    @property
+    def parameters(self) -> list[str]:
+        """Names of the parameters that can be set."""
+        return list(self._expressions)
+
+    def _render_parameter_file(self, parameters: dict[str, str]) -> str | None:
+        # Returns None when no value changes, so the template's part is kept as is
+        try:
+            set_parameter_values(self._expressions, parameters)
+            if self.parameter_path == TMDL_EXPRESSIONS_PATH:
+                content = self._document.text()
+                return content if content != self._original_text else None
+            changed = any(self._expressions[name]["expression"] != self._originals[name] for name in parameters)
+            return json.dumps(self._document, indent=2) if changed else None
+        finally:
+            for name in parameters:
+                if self.parameter_path == TMDL_EXPRESSIONS_PATH:
+                    node = self._expressions[name]
+                    node.expression, node.body[:] = self._originals[name]
+                else:
+                    self._expressions[name]["expression"] = self._originals[name]
+
+    def render(self, parameters: dict[str, str], fail_if_not_found: bool = False) -> ItemDefinition:
+        """
+        Return the definition of the model with *parameters* applied.
+
+        Raises
+        ------
+        ValueError
+            If a parameter is not a text parameter, or if
+            *fail_if_not_found* is ``True`` and one or more parameter names
+            are absent from the model (otherwise they are reported and
+            ignored).
+        """
+        missing_keys = [name for name in parameters if name not in self._expressions]
+        if missing_keys and fail_if_not_found:
+            raise ValueError(f"The following parameters were not found in the model: {missing_keys}")
+        elif missing_keys:
+            config.print_color("Parameter(s) not found: " + ", ".join(missing_keys), "yellow")
+
+        applied = {name: value for name, value in parameters.items() if name in self._expressions}
+        with self._lock:
+            content = self._render_parameter_file(applied) if applied else None
+
+        variant = ItemDefinition((part.copy() for part in self.definition), format=self.definition.format)
+        if content is not None:
+            variant.set(self.parameter_path, content)
+        return variant
+
+    def render_many(
+        self,
+        environments: dict[str, dict[str, str]],
+        fail_if_not_found: bool = False,
+    ) -> dict[str, ItemDefinition]:
+        """Render one definition per environment from a ``{environment: parameters}`` matrix."""
+        return {
+            environment: self.render(parameters, fail_if_not_found)
+            for environment, parameters in environments.items()
+        }
+
+
+def deploy_template(
+    token: str | Callable[[], str],
+    template: ModelTemplate,
+    environments: dict[str, dict],
+    max_workers: int = config.DEPLOY_MAX_WORKERS,
+    fail_if_not_found: bool = False,
+    session: requests.Session | None = None,
+    item_cache: ItemInventoryCache | None = None,
+    **import_options,
+) -> dict[str, dict]:
+    """
+    Render *template* for every environment and import the variants concurrently.
+
+    Parameters
+    ----------
+    token : str or callable
+        A valid bearer access token, or a callable returning one for each
+        request so long runs pick up refreshed tokens.
+    template : ModelTemplate
+        Model loaded once for all environments.
+    environments : dict[str, dict]
+        ``{environment: {"workspaceId": ..., "parameters": {...},
+        "displayName": ...}}``; ``displayName`` is optional and defaults to
+        the template's.
+    max_workers : int
+        Maximum number of environments deployed at the same time.
+    fail_if_not_found : bool
+        Fail an environment whose parameters are not all in the model.
+    session : requests.Session, optional
+        Pooled HTTP session to reuse connections.
+    item_cache : ItemInventoryCache, optional
+        Inventory shared by the imports.
+    **import_options
+        Passed to every ``import_definition`` call, e.g. ``retain_roles=True``
+        or ``manifest_path=...``.
+
+    Returns
+    -------
+    dict[str, dict]
+        For every environment: ``workspaceId``, ``status`` (``deployed`` or
+        ``failed``), ``seconds`` and either ``result`` (the imported item)
+        or ``error``.
+    """
+
+    def deploy(environment: str) -> dict:
+        target = environments[environment]
+        started = time.perf_counter()
+        try:
+            definition = template.render(target.get("parameters") or {}, fail_if_not_found)
+            result = import_definition(
+                token,
+                target["workspaceId"],
+                definition,
+                target.get("displayName") or template.display_name,
+                template.item_type,
+                session=session,
+                item_cache=item_cache,
+                **import_options,
+            )
+        except Exception as ex:
+            config.print_color(f"Failed to deploy {template.display_name} to {environment}: {ex}", "red")
+            return {"workspaceId": target.get("workspaceId"), "status": "failed", "error": str(ex)}
+        config.print_color(f"Deployed: {template.display_name} to {environment}", "green")
+        return {
+            "workspaceId": target["workspaceId"],
+            "status": "deployed",
+            "result": result,
+            "seconds": time.perf_counter() - started,
+        }
+
+    if not environments:
+        return {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="msfabric-templates") as executor:
+        return dict(zip(environments, executor.map(deploy, environments)))
+
+
+class TemplatesMixin:
+    """Mixin that exposes multi-environment template deployment as instance methods.
+
+    Requires the host class to provide a ``token_manager`` attribute (whose
+    ``get_token`` is called per request), a ``session`` attribute and an
+    ``item_cache`` attribute (see ``ItemsMixin``).
+    """
+
+    def deploy_template(
+        self,
+        template: ModelTemplate,
+        environments: dict[str, dict],
+        max_workers: int = config.DEPLOY_MAX_WORKERS,
+        fail_if_not_found: bool = False,
+        **import_options,
+    ) -> dict[str, dict]:
+        """Render a ``ModelTemplate`` per environment and import the variants concurrently."""
+        return deploy_template(
+            self.token_manager.get_token,
+            template,
+            environments,
+            max_workers=max_workers,
+            fail_if_not_found=fail_if_not_found,
+            session=self.session,
+            item_cache=self.item_cache,
+            **import_options,
+        )
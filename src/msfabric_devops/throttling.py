@@ -0,0 +1,206 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+from . import config
+
+
+def endpoint_family(method: str, url: str) -> str:
+    """
+    Return the rate-limit family of a Fabric API request.
+
+    ``definitions`` covers ``getDefinition``/``updateDefinition`` and item
+    creation (which uploads a definition), ``operations`` covers long-running
+    operation polls, and the remaining calls fall into ``items``,
+    ``workspaces`` or ``default``.
+    """
+    path = urlparse(url).path.rstrip("/").lower()
+    if "/operations/" in path:
+        return "operations"
+    if path.endswith(("/getdefinition", "/updatedefinition")):
+        return "definitions"
+    if "/items" in path:
+        if method.upper() == "POST" and path.endswith("/items"):
+            return "definitions"
+        return "items"
+    if "/workspaces" in path:
+        return "workspaces"
+    return "default"
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the delay in seconds of a ``Retry-After`` header (seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _check_budget(family: str, rate: float, burst: float) -> None:
+    # A zero rate would never refill the bucket, a burst below 1 never holds a request
+    if rate <= 0 or burst < 1:
+        raise ValueError(f"Rate limit of {family!r} needs a rate above 0 and a burst of at least 1, got ({rate}, {burst})")
+
+
+class _Bucket:
+    __slots__ = ("max_rate", "rate", "burst", "tokens", "updated", "requests", "throttled", "wait_seconds")
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.requests = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class RateLimiter:
+    """
+    Client-wide request budget shared by every thread using a session.
+
+    Each endpoint family (see ``endpoint_family``) has a token bucket of
+    *rate* requests per second with bursts of up to *burst* requests. A
+    ``429 Too Many Requests`` from any request pauses **all** senders until
+    its ``Retry-After`` deadline, empties the bucket of that family and
+    halves its rate; the rate then climbs back by a small step after every
+    successful request. Parallel callers therefore settle at the throughput
+    the service sustains instead of being throttled in waves.
+
+    Parameters
+    ----------
+    budgets : dict[str, tuple[float, float]], optional
+        ``(rate, burst)`` per family, merged over ``config.RATE_LIMITS``.
+        Families without a budget use the ``default`` entry.
+    max_retries : int
+        Number of times a throttled request is sent again before the 429
+        response is returned to the caller.
+    fallback_delay : float
+        Pause applied when a 429 carries no usable ``Retry-After``; it
+        doubles with consecutive throttles of the same request.
+
+    Raises
+    ------
+    ValueError
+        If a budget has a rate of 0 or less or a burst below 1.
+
+    Examples
+    --------
+    ::
+
+        client = FabricClient(rate_limits={"definitions": (1.0, 2)})
+        ...
+        print(client.rate_limiter.metrics())
+    """
+
+    def __init__(
+        self,
+        budgets: dict[str, tuple[float, float]] | None = None,
+        max_retries: int = config.THROTTLE_MAX_RETRIES,
+        fallback_delay: float = config.THROTTLE_FALLBACK_DELAY,
+    ) -> None:
+        self.budgets = {**config.RATE_LIMITS, **(budgets or {})}
+        for family, (rate, burst) in self.budgets.items():
+            _check_budget(family, rate, burst)
+        self.max_retries = max_retries
+        self.fallback_delay = fallback_delay
+        self._lock = threading.Lock()
+        self._buckets: dict[str, _Bucket] = {}
+        self._paused_until = 0.0
+
+    def acquire(self, family: str = "default") -> float:
+        """
+        Block until a request of *family* may be sent.
+
+        Returns
+        -------
+        float
+            Seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                bucket = self._bucket(family)
+                now = time.monotonic()
+                bucket.refill(now)
+                delay = self._paused_until - now
+                if delay <= 0 and bucket.tokens >= 1:
+                    bucket.tokens -= 1
+                    bucket.requests += 1
+                    bucket.wait_seconds += waited
+                    return waited
+                if bucket.tokens < 1:
+                    delay = max(delay, (1 - bucket.tokens) / bucket.rate)
+            time.sleep(delay)
+            waited += delay
+
+    def throttled(self, family: str, retry_after: str | None = None, attempt: int = 0) -> float:
+        """
+        Record a 429 for *family* and pause every sender.
+
+        Returns
+        -------
+        float
+            The pause applied, in seconds.
+        """
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = self.fallback_delay * (2 ** attempt)
+        with self._lock:
+            bucket = self._bucket(family)
+            bucket.throttled += 1
+            bucket.tokens = 0.0
+            bucket.rate = max(bucket.rate / 2, bucket.max_rate / 16)
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        return delay
+
+    def succeeded(self, family: str) -> None:
+        """Let the rate of *family* recover after a request that was not throttled."""
+        with self._lock:
+            bucket = self._bucket(family)
+            if bucket.rate < bucket.max_rate:
+                bucket.rate = min(bucket.max_rate, bucket.rate + bucket.max_rate / 32)
+
+    def metrics(self) -> dict:
+        """
+        Return a snapshot of the limiter counters.
+
+        ``{"requests", "throttled", "wait_seconds", "families": {family:
+        {"requests", "throttled", "wait_seconds", "rate"}}}``
+        """
+        with self._lock:
+            families = {
+                family: {
+                    "requests": bucket.requests,
+                    "throttled": bucket.throttled,
+                    "wait_seconds": bucket.wait_seconds,
+                    "rate": bucket.rate,
+                }
+                for family, bucket in self._buckets.items()
+            }
+        return {
+            "requests": sum(entry["requests"] for entry in families.values()),
+            "throttled": sum(entry["throttled"] for entry in families.values()),
+            "wait_seconds": sum(entry["wait_seconds"] for entry in families.values()),
+            "families": families,
+        }
+
+    def _bucket(self, family: str) -> _Bucket:
+        bucket = self._buckets.get(family)
+        if bucket is None:
+            rate, burst = self.budgets.get(family, self.budgets["default"])
+            _check_budget(family, rate, burst)
+            bucket = self._buckets[family] = _Bucket(rate, burst)
+        return bucket
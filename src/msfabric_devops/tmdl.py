@@ -0,0 +1,419 @@
+import re
+from typing import Iterator
+
+# Keywords that open a TMDL object. Any other line is a property, an
+# expression line or a comment, and is kept verbatim in its parent's body.
+OBJECT_KEYWORDS = frozenset({
+    "model", "database", "table", "column", "measure", "partition",
+    "hierarchy", "level", "calculationGroup", "calculationItem",
+    "relationship", "role", "tablePermission", "columnPermission", "member",
+    "expression", "dataSource", "perspective", "perspectiveTable",
+    "perspectiveColumn", "perspectiveMeasure", "perspectiveHierarchy",
+    "culture", "linguisticMetadata", "queryGroup", "annotation",
+    "extendedProperty", "function", "calendar", "ref", "createOrReplace",
+})
+
+_UNQUOTED_NAME = re.compile(r"[^\s=:]+")
+# A Power Query text parameter: an M string literal, optionally followed by
+# its ``meta [...]`` record, with the surrounding whitespace
+_M_TEXT_PARAMETER = re.compile(r'(\s*)("(?:[^"]|"")*")(\s*(?:meta\b.*)?)\Z', re.DOTALL)
+
+
+class TmdlNode:
+    """
+    One TMDL object (``table``, ``partition``, ``role``, ``ref``, ...).
+
+    A node keeps its source lines verbatim: ``header`` holds the ``///``
+    description lines and the declaration line, ``body`` holds, in source
+    order, the raw property/expression/blank lines and the child nodes.
+    Serializing a parsed document with ``text()`` therefore returns the
+    original input unchanged, and edits only touch the nodes they replace.
+
+    Attributes
+    ----------
+    kind : str
+        Object keyword, e.g. ``"table"``; ``"document"`` for the root.
+    name : str or None
+        Unquoted object name, e.g. ``Sales Data`` for ``table 'Sales Data'``.
+    raw_name : str or None
+        Name as written in the source, quotes included.
+    ref_type : str or None
+        Referenced object type for ``ref`` nodes (``ref role Reader`` has
+        ``ref_type="role"`` and ``name="Reader"``).
+    depth : int
+        Indentation level of the declaration (``-1`` for the document).
+    """
+
+    __slots__ = ("kind", "name", "raw_name", "ref_type", "depth", "header", "body", "_expression_start")
+
+    def __init__(
+        self,
+        kind: str,
+        name: str | None = None,
+        raw_name: str | None = None,
+        depth: int = -1,
+        ref_type: str | None = None,
+    ) -> None:
+        self.kind = kind
+        self.name = name
+        self.raw_name = raw_name
+        self.ref_type = ref_type
+        self.depth = depth
+        self.header: list[str] = []
+        self.body: list["str | TmdlNode"] = []
+        self._expression_start: int | None = None
+
+    def __repr__(self) -> str:
+        return f"TmdlNode({self.kind!r}, {self.name!r})"
+
+    def text(self) -> str:
+        """Return the TMDL source of this node and its children."""
+        return "".join(self._iter_lines())
+
+    def _iter_lines(self) -> Iterator[str]:
+        yield from self.header
+        for item in self.body:
+            if isinstance(item, TmdlNode):
+                yield from item._iter_lines()
+            else:
+                yield item
+
+    # ------------------------------------------------------------------
+    # Navigation
+    # ------------------------------------------------------------------
+
+    def children(self, kind: str | None = None, ref_type: str | None = None) -> list["TmdlNode"]:
+        """Return the direct child nodes, optionally filtered by *kind* and *ref_type*."""
+        return [item for item in self.body if _matches(item, kind, ref_type)]
+
+    def find(self, kind: str, name: str) -> "TmdlNode | None":
+        """Return the first child of *kind* named *name*, or ``None``."""
+        for child in self.children(kind):
+            if child.name == name:
+                return child
+        return None
+
+    # ------------------------------------------------------------------
+    # Default expression (``partition X = m``, ``expression P = "a" meta [...]``)
+    # ------------------------------------------------------------------
+
+    @property
+    def expression(self) -> str | None:
+        """Single-line expression after ``=`` on the declaration line, or ``None``."""
+        if self._expression_start is None:
+            return None
+        line = self.header[-1]
+        return line[self._expression_start:len(line) - len(_line_ending(line))]
+
+    @expression.setter
+    def expression(self, value: str) -> None:
+        if self._expression_start is None:
+            raise ValueError(f"{self.kind} {self.raw_name} has no default expression")
+        line = self.header[-1]
+        self.header[-1] = line[:self._expression_start] + value + _line_ending(line)
+
+    # ------------------------------------------------------------------
+    # Editing
+    # ------------------------------------------------------------------
+
+    def replace_children(
+        self,
+        kind: str,
+        nodes: list["TmdlNode"],
+        ref_type: str | None = None,
+        separate: bool = True,
+    ) -> list["TmdlNode"]:
+        """
+        Replace every child of *kind* with *nodes* and return the removed ones.
+
+        The new nodes are inserted where the first removed child was, or
+        appended when there was none. With *separate* each inserted node is
+        preceded by a blank line, the usual layout between TMDL objects.
+        """
+        newline = _newline_of(self)
+        removed: list[TmdlNode] = []
+        position = None
+        body: list[str | TmdlNode] = []
+        for item in self.body:
+            if _matches(item, kind, ref_type):
+                # Drop the blank separator that preceded the removed node
+                while body and isinstance(body[-1], str) and not body[-1].strip():
+                    body.pop()
+                if position is None:
+                    position = len(body)
+                removed.append(item)
+                continue
+            body.append(item)
+
+        if position is None:
+            position = len(body)
+        if position > 0 and body:
+            _ensure_line_ending(body, position, newline)
+
+        inserted: list[str | TmdlNode] = []
+        for node in nodes:
+            if separate and (inserted or position > 0):
+                inserted.append(newline)
+            _ensure_trailing_newline(node, newline)
+            inserted.append(node)
+        body[position:position] = inserted
+        self.body = body
+        return removed
+
+    def remove_children(self, kind: str, ref_type: str | None = None) -> list["TmdlNode"]:
+        """Remove every child of *kind* (and its blank separator) and return them."""
+        return self.replace_children(kind, [], ref_type=ref_type)
+
+
+def parse_tmdl(text: str) -> TmdlNode:
+    """
+    Parse TMDL source into a tree of ``TmdlNode`` in a single pass.
+
+    Objects are recognized by their keyword and nested by indentation
+    (one tab, or four spaces, per level). Multi-line expressions, whether
+    indented after a trailing ``=`` or fenced with triple backticks, are
+    kept as raw lines of the object that declares them, so code that looks
+    like a declaration inside M or DAX is never mistaken for one.
+
+    Parameters
+    ----------
+    text : str
+        Content of a ``.tmdl`` file.
+
+    Returns
+    -------
+    TmdlNode
+        The ``"document"`` root; ``root.text() == text``.
+    """
+    root = TmdlNode("document")
+    if text.startswith("\ufeff"):
+        # Keep the byte order mark out of the first declaration
+        root.header.append("\ufeff")
+        text = text[1:]
+    stack = [root]
+    pending: list[str] = []
+    block_indent: int | None = None
+    fenced = False
+
+    def flush(node: TmdlNode) -> None:
+        node.body.extend(pending)
+        pending.clear()
+
+    for line in text.splitlines(keepends=True):
+        stripped = line.strip()
+
+        if fenced:
+            flush(stack[-1])
+            stack[-1].body.append(line)
+            if stripped.endswith("```"):
+                fenced = False
+            continue
+
+        if not stripped:
+            pending.append(line)
+            continue
+
+        indent = _indent(line)
+        if block_indent is not None:
+            if indent > block_indent:
+                flush(stack[-1])
+                stack[-1].body.append(line)
+                continue
+            block_indent = None
+
+        while stack[-1] is not root and indent <= stack[-1].depth:
+            stack.pop()
+        parent = stack[-1]
+
+        if stripped.startswith("///"):
+            pending.append(line)
+            continue
+
+        node = _parse_declaration(stripped, indent)
+        if node is None:
+            flush(parent)
+            parent.body.append(line)
+        else:
+            # Trailing ``///`` lines describe the new object, the rest stays with the parent
+            split = len(pending)
+            while split > 0 and pending[split - 1].lstrip().startswith("///"):
+                split -= 1
+            node.header = pending[split:] + [line]
+            del pending[split:]
+            flush(parent)
+            parent.body.append(node)
+            stack.append(node)
+            if node._expression_start is not None:
+                node._expression_start += len(line) - len(line.lstrip())
+
+        if stripped.count("```") % 2 == 1:
+            fenced = True
+        elif stripped.endswith("="):
+            # Multi-line expression: deeper-indented lines belong to it
+            block_indent = indent + 1 if node is not None else indent
+
+    flush(root)
+    return root
+
+
+def quote_name(name: str) -> str:
+    """Return *name* as written in TMDL, single-quoted when it needs to be."""
+    if _UNQUOTED_NAME.fullmatch(name) and "'" not in name and "." not in name:
+        return name
+    return "'" + name.replace("'", "''") + "'"
+
+
+def make_ref(ref_type: str, raw_name: str, newline: str = "\n") -> TmdlNode:
+    """Return a ``ref <ref_type> <name>`` node, e.g. for ``model.tmdl``."""
+    return parse_tmdl(f"ref {ref_type} {raw_name}{newline}").children()[0]
+
+
+def set_m_string_value(expression: str, value: str) -> str:
+    """
+    Replace the value of a Power Query parameter expression such as
+    ``"dev" meta [IsParameterQuery=true, ...]`` with the M string *value*.
+
+    Everything around the string literal (indentation, line breaks and the
+    ``meta`` record) is kept as is.
+
+    Raises
+    ------
+    ValueError
+        If *expression* is not a text parameter, e.g. ``#date(2024, 1, 1)
+        meta [...]`` or a query; its value cannot be set as a string.
+    """
+    match = _M_TEXT_PARAMETER.match(expression)
+    if match is None:
+        raise ValueError(f"Not a text parameter expression: {expression.strip()[:80]!r}")
+    literal = '"' + value.replace('"', '""') + '"'
+    return match.group(1) + literal + match.group(3)
+
+
+def set_parameter_value(node: TmdlNode, value: str) -> None:
+    """
+    Set the value of the Power Query text parameter declared by *node*.
+
+    Handles both layouts of an ``expression`` object: the value on the
+    declaration line (``expression P = "dev" meta [...]``) and the value
+    on the indented lines after a trailing ``=``. Only the string literal
+    is replaced; every other line is kept verbatim.
+
+    Raises
+    ------
+    ValueError
+        If *node* has no default expression, or its expression is not an M
+        string literal (see ``set_m_string_value``).
+    """
+    if node.expression is None:
+        raise ValueError(f"{node.kind} {node.raw_name} has no default expression")
+    if node.expression.strip():
+        node.expression = set_m_string_value(node.expression, value)
+        return
+
+    end = _expression_block_end(node)
+    if end == 0:
+        raise ValueError(f"{node.kind} {node.raw_name} has an empty expression")
+    source = "".join(node.body[:end])
+    node.body[:end] = set_m_string_value(source, value).splitlines(keepends=True)
+
+
+def _expression_block_end(node: TmdlNode) -> int:
+    # Raw lines indented deeper than the properties form the multi-line
+    # expression; trailing blank lines belong to what follows
+    end = 0
+    for index, item in enumerate(node.body):
+        if not isinstance(item, str):
+            break
+        if item.strip():
+            if _indent(item) <= node.depth + 1:
+                break
+            end = index + 1
+    return end
+
+
+def _parse_declaration(stripped: str, indent: int) -> TmdlNode | None:
+    keyword, _, rest = stripped.partition(" ")
+    if keyword not in OBJECT_KEYWORDS:
+        return None
+
+    ref_type = None
+    offset = len(keyword) + 1
+    if keyword == "ref":
+        ref_type, _, rest = rest.lstrip().partition(" ")
+        if not ref_type:
+            return None
+        offset = stripped.index(ref_type, offset) + len(ref_type) + 1
+
+    leading = len(rest) - len(rest.lstrip())
+    rest = rest.lstrip()
+    offset += leading
+    if rest.startswith("'"):
+        end = 1
+        while end < len(rest):
+            if rest[end] == "'":
+                if rest[end + 1:end + 2] == "'":
+                    end += 2
+                    continue
+                break
+            end += 1
+        raw_name = rest[:end + 1]
+        name = raw_name[1:-1].replace("''", "'")
+    else:
+        match = _UNQUOTED_NAME.match(rest)
+        if match is None:
+            # e.g. an ``expression = ...`` property rather than an object
+            return None
+        raw_name = name = match.group(0)
+
+    node = TmdlNode(keyword, name=name, raw_name=raw_name, depth=indent, ref_type=ref_type)
+    tail = rest[len(raw_name):]
+    equals = tail.find("=")
+    if equals >= 0 and not tail[:equals].strip():
+        after = tail[equals + 1:]
+        node._expression_start = offset + len(raw_name) + equals + 1 + (len(after) - len(after.lstrip(" \t")))
+    return node
+
+
+def _indent(line: str) -> int:
+    leading = line[:len(line) - len(line.lstrip(" \t"))]
+    return leading.count("\t") + leading.count(" ") // 4
+
+
+def _line_ending(line: str) -> str:
+    if line.endswith("\r\n"):
+        return "\r\n"
+    if line.endswith("\n") or line.endswith("\r"):
+        return line[-1]
+    return ""
+
+
+def _newline_of(node: TmdlNode) -> str:
+    for line in node._iter_lines():
+        ending = _line_ending(line)
+        if ending:
+            return ending
+    return "\n"
+
+
+def _matches(item: "str | TmdlNode", kind: str | None, ref_type: str | None) -> bool:
+    return (
+        isinstance(item, TmdlNode)
+        and (kind is None or item.kind == kind)
+        and (ref_type is None or item.ref_type == ref_type)
+    )
+
+
+def _ensure_trailing_newline(node: TmdlNode, newline: str) -> None:
+    # The last line of a file has no line ending; add one before moving it
+    if node.body:
+        _ensure_line_ending(node.body, len(node.body), newline)
+    elif node.header and not _line_ending(node.header[-1]):
+        node.header[-1] += newline
+
+
+def _ensure_line_ending(body: list, position: int, newline: str) -> None:
+    last = body[position - 1]
+    if isinstance(last, TmdlNode):
+        _ensure_trailing_newline(last, newline)
+    elif not _line_ending(last):
+        body[position - 1] = last + newline
@@ -1,49 +1,129 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator
+
+import requests
+
 from . import config
 from . import authenticate
 from . import api
+from .cache import WorkspaceDirectory
+from .exceptions import FabricNotFoundError
+
+
+def iter_workspaces(
+    token: str,
+    session: requests.Session | None = None,
+    prefetch: bool = False,
+) -> Iterator[dict]:
+    """
+    Lazily yield the Fabric workspaces accessible to the authenticated principal.
+
+    Pages are fetched on demand by following ``continuationToken``, so
+    breaking out of the loop stops further requests.
+
+    Parameters
+    ----------
+    token : str
+        A valid bearer access token.
+    session : requests.Session, optional
+        Pooled HTTP session to reuse connections.
+    prefetch : bool
+        Fetch the next page in the background while the current one is consumed.
+
+    Yields
+    ------
+    dict
+        Workspace objects, each containing at minimum ``id`` and ``displayName``.
+    """
+    for page in api.iter_fabric_api_pages("workspaces", token, session=session, prefetch=prefetch):
+        yield from page
 
 
-def get_workspaces(token: str) -> list[dict]:
+def get_workspaces(
+    token: str,
+    session: requests.Session | None = None,
+    workspace_directory: WorkspaceDirectory | None = None,
+) -> list[dict]:
     """
     Return all Fabric workspaces accessible to the authenticated principal.
 
+    Every page of the listing is fetched (see ``iter_workspaces``).
+
     Parameters
     ----------
     token : str
         A valid bearer access token (see ``get_access_token``).
+    session : requests.Session, optional
+        Pooled HTTP session to reuse connections (see ``api.FabricSession``).
+    workspace_directory : WorkspaceDirectory, optional
+        Cached workspace index; answered from it while fresh, refreshed otherwise.
 
     Returns
     -------
     list[dict]
         Workspace objects, each containing at minimum ``id`` and ``displayName``.
     """
-    return api.invoke_fabric_api_request("workspaces", token)
-
-
-def get_workspace_by_id(token: str, workspace_id: str) -> dict:
+    if workspace_directory is not None:
+        cached = workspace_directory.get_workspaces()
+        if cached is not None:
+            return cached
+    workspaces = list(iter_workspaces(token, session=session))
+    if workspace_directory is not None:
+        workspace_directory.set_workspaces(workspaces)
+    return workspaces
+
+
+def get_workspace_by_id(
+    token: str,
+    workspace_id: str,
+    session: requests.Session | None = None,
+    workspace_directory: WorkspaceDirectory | None = None,
+) -> dict:
     """
     Return a single workspace by its ID.
 
+    Uses the ``GET workspaces/{id}`` endpoint, so the cost does not depend
+    on the number of workspaces in the tenant.
+
     Parameters
     ----------
     token : str
         A valid bearer access token.
     workspace_id : str
         The GUID of the target workspace.
+    session : requests.Session, optional
+        Pooled HTTP session to reuse connections.
+    workspace_directory : WorkspaceDirectory, optional
+        Cached workspace index, consulted first and patched with the result.
 
     Returns
     -------
     dict
         The matching workspace object, or an empty dict if not found.
     """
-    result = {}
-    for workspace in get_workspaces(token):
-        if workspace["id"] == workspace_id:
-            result = workspace
-    return result
-
-
-def get_workspaces_by_name(token: str, workspace_name: str) -> list[dict]:
+    if workspace_directory is not None:
+        cached = workspace_directory.get_workspace(workspace_id)
+        if cached is not None:
+            return cached
+    try:
+        workspace = api.invoke_fabric_api_request(f"workspaces/{workspace_id}", token, session=session)
+    except FabricNotFoundError:
+        workspace = None
+    if not workspace:
+        if workspace_directory is not None:
+            workspace_directory.remove_workspace(workspace_id)
+        return {}
+    if workspace_directory is not None:
+        workspace_directory.put_workspace(workspace)
+    return workspace
+
+
+def get_workspaces_by_name(
+    token: str,
+    workspace_name: str,
+    session: requests.Session | None = None,
+    workspace_directory: WorkspaceDirectory | None = None,
+) -> list[dict]:
     """
     Return all workspaces whose ``displayName`` matches *workspace_name*.
 
@@ -55,20 +135,36 @@ def get_workspaces_by_name(token: str, workspace_name: str) -> list[dict]:
         A valid bearer access token.
     workspace_name : str
         The exact display name to search for (case-sensitive).
+    session : requests.Session, optional
+        Pooled HTTP session to reuse connections.
+    workspace_directory : WorkspaceDirectory, optional
+        Cached workspace index. The tenant is listed once per TTL and name
+        lookups are then answered from its name index.
 
     Returns
     -------
     list[dict]
         All matching workspace objects. Empty list if none found.
     """
+    if workspace_directory is not None:
+        if not workspace_directory.is_loaded():
+            get_workspaces(token, session=session, workspace_directory=workspace_directory)
+        cached = workspace_directory.find_workspaces_by_name(workspace_name)
+        if cached is not None:
+            return cached
     result = []
-    for workspace in get_workspaces(token):
+    for workspace in iter_workspaces(token, session=session):
         if workspace["displayName"] == workspace_name:
             result.append(workspace)
     return result
 
 
-def create_workspace(token: str, workspace_name: str) -> dict | None:
+def create_workspace(
+    token: str,
+    workspace_name: str,
+    session: requests.Session | None = None,
+    workspace_directory: WorkspaceDirectory | None = None,
+) -> dict | None:
     """
     Create a new workspace and return the created resource.
 
@@ -81,20 +177,35 @@ def create_workspace(token: str, workspace_name: str) -> dict | None:
         A valid bearer access token.
     workspace_name : str
         Display name for the new workspace.
+    session : requests.Session, optional
+        Pooled HTTP session to reuse connections.
+    workspace_directory : WorkspaceDirectory, optional
+        Cached workspace index used for the existence check and patched
+        with the new workspace.
 
     Returns
     -------
     dict or None
         The newly created workspace object, or ``None`` if the name already exists.
     """
-    test_existing_workspace = get_workspaces_by_name(token, workspace_name)
+    test_existing_workspace = get_workspaces_by_name(
+        token, workspace_name, session=session, workspace_directory=workspace_directory
+    )
     if len(test_existing_workspace) > 0:
         config.print_color(f"Warning : Workspace {workspace_name} already exists.", "yellow")
     else:
-        return api.invoke_fabric_api_request("workspaces", token, method="POST", body={"displayName": workspace_name})
-
-
-def delete_workspace(token: str, workspace_id: str) -> None:
+        workspace = api.invoke_fabric_api_request("workspaces", token, method="POST", body={"displayName": workspace_name}, session=session)
+        if workspace_directory is not None and workspace:
+            workspace_directory.put_workspace(workspace)
+        return workspace
+
+
+def delete_workspace(
+    token: str,
+    workspace_id: str,
+    session: requests.Session | None = None,
+    workspace_directory: WorkspaceDirectory | None = None,
+) -> None:
     """
     Delete the workspace identified by *workspace_id*.
 
@@ -104,36 +215,218 @@ def delete_workspace(token: str, workspace_id: str) -> None:
         A valid bearer access token.
     workspace_id : str
         The GUID of the workspace to delete.
+    session : requests.Session, optional
+        Pooled HTTP session to reuse connections.
+    workspace_directory : WorkspaceDirectory, optional
+        Cached workspace index the workspace is removed from.
     """
-    api.invoke_fabric_api_request(f"workspaces/{workspace_id}", token, method="DELETE")
+    api.invoke_fabric_api_request(f"workspaces/{workspace_id}", token, method="DELETE", session=session)
+    if workspace_directory is not None:
+        workspace_directory.remove_workspace(workspace_id)
+
+
+def create_workspaces(
+    token: str | Callable[[], str],
+    workspace_names: list[str],
+    max_workers: int = config.WORKSPACE_MAX_WORKERS,
+    session: requests.Session | None = None,
+    workspace_directory: WorkspaceDirectory | None = None,
+) -> dict[str, dict]:
+    """
+    Create many workspaces concurrently.
+
+    The tenant is listed once (or not at all while *workspace_directory*
+    is fresh) to find the names that already exist; the remaining
+    workspaces are then created in parallel. Requests go through *session*,
+    so a rate-limited ``FabricSession`` keeps the batch within its budget.
+    A failure is reported for its workspace and does not stop the batch.
+
+    Parameters
+    ----------
+    token : str or callable
+        A valid bearer access token, or a callable returning one for each
+        request so long runs pick up refreshed tokens.
+    workspace_names : list[str]
+        Display names of the workspaces to create. Duplicates are created once.
+    max_workers : int
+        Maximum number of creations in flight.
+    session : requests.Session, optional
+        Pooled HTTP session to reuse connections.
+    workspace_directory : WorkspaceDirectory, optional
+        Cached workspace index used for the existence check and patched
+        with the new workspaces.
+
+    Returns
+    -------
+    dict[str, dict]
+        For every name, in input order: ``status`` (``created``, ``exists``
+        or ``failed``), ``workspace`` (the created or existing workspace, or
+        ``None``) and ``error`` (message or ``None``).
+    """
+    names = list(dict.fromkeys(workspace_names))
+    existing: dict[str, dict] = {}
+    for workspace in get_workspaces(token, session=session, workspace_directory=workspace_directory):
+        existing.setdefault(workspace["displayName"], workspace)
+
+    def create(name: str) -> dict:
+        try:
+            workspace = api.invoke_fabric_api_request("workspaces", token, method="POST", body={"displayName": name}, session=session)
+        except Exception as ex:
+            return {"status": "failed", "workspace": None, "error": str(ex)}
+        if workspace_directory is not None and workspace:
+            workspace_directory.put_workspace(workspace)
+        return {"status": "created", "workspace": workspace, "error": None}
+
+    results = {
+        name: {"status": "exists", "workspace": existing[name], "error": None}
+        for name in names if name in existing
+    }
+    missing = [name for name in names if name not in existing]
+    if missing:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="msfabric-workspaces") as executor:
+            results.update(zip(missing, executor.map(create, missing)))
+
+    for name, result in results.items():
+        if result["status"] == "failed":
+            config.print_color(f"Failed to create workspace {name}: {result['error']}", "red")
+        elif result["status"] == "exists":
+            config.print_color(f"Warning : Workspace {name} already exists.", "yellow")
+    return {name: results[name] for name in names}
+
+
+def delete_workspaces(
+    token: str | Callable[[], str],
+    workspace_ids: list[str],
+    max_workers: int = config.WORKSPACE_MAX_WORKERS,
+    session: requests.Session | None = None,
+    workspace_directory: WorkspaceDirectory | None = None,
+) -> dict[str, dict]:
+    """
+    Delete many workspaces concurrently.
+
+    A workspace that no longer exists is reported as ``not_found`` rather
+    than as a failure, so a teardown can safely be run again. A failure is
+    reported for its workspace and does not stop the batch.
+
+    Parameters
+    ----------
+    token : str or callable
+        A valid bearer access token, or a callable returning one for each
+        request so long runs pick up refreshed tokens.
+    workspace_ids : list[str]
+        GUIDs of the workspaces to delete.
+    max_workers : int
+        Maximum number of deletions in flight.
+    session : requests.Session, optional
+        Pooled HTTP session to reuse connections.
+    workspace_directory : WorkspaceDirectory, optional
+        Cached workspace index the workspaces are removed from.
+
+    Returns
+    -------
+    dict[str, dict]
+        For every id, in input order: ``status`` (``deleted``, ``not_found``
+        or ``failed``) and ``error`` (message or ``None``).
+    """
+    ids = list(dict.fromkeys(workspace_ids))
+
+    def delete(workspace_id: str) -> dict:
+        try:
+            delete_workspace(token, workspace_id, session=session, workspace_directory=workspace_directory)
+        except FabricNotFoundError:
+            if workspace_directory is not None:
+                workspace_directory.remove_workspace(workspace_id)
+            return {"status": "not_found", "error": None}
+        except Exception as ex:
+            config.print_color(f"Failed to delete workspace {workspace_id}: {ex}", "red")
+            return {"status": "failed", "error": str(ex)}
+        return {"status": "deleted", "error": None}
+
+    if not ids:
+        return {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="msfabric-workspaces") as executor:
+        return dict(zip(ids, executor.map(delete, ids)))
 
 
 class WorkspacesMixin:
     """Mixin that exposes workspace operations as instance methods.
 
     Requires the host class to provide a ``token`` property that returns
-    a valid bearer access token.
+    a valid bearer access token, a ``token_manager`` attribute used by the
+    bulk calls to resolve the token per request, a ``session`` attribute
+    holding the pooled HTTP session shared by all calls, and a
+    ``workspace_directory`` attribute holding the ``WorkspaceDirectory``
+    used for lookups.
     """
 
+    def iter_workspaces(self, prefetch: bool = False) -> Iterator[dict]:
+        """Lazily yield workspaces, fetching pages only as they are consumed."""
+        return iter_workspaces(self.token, session=self.session, prefetch=prefetch)
+
     def get_workspaces(self) -> list[dict]:
         """Return all Fabric workspaces accessible to the authenticated principal."""
-        return get_workspaces(self.token)
+        return get_workspaces(self.token, session=self.session, workspace_directory=self.workspace_directory)
 
     def get_workspace_by_id(self, workspace_id: str) -> dict:
         """Return a single workspace by its ID."""
-        return get_workspace_by_id(self.token, workspace_id)
+        return get_workspace_by_id(self.token, workspace_id, session=self.session, workspace_directory=self.workspace_directory)
 
     def get_workspaces_by_name(self, workspace_name: str) -> list[dict]:
         """Return all workspaces whose ``displayName`` matches *workspace_name*."""
-        return get_workspaces_by_name(self.token, workspace_name)
+        return get_workspaces_by_name(self.token, workspace_name, session=self.session, workspace_directory=self.workspace_directory)
 
     def create_workspace(self, workspace_name: str) -> dict | None:
         """Create a new workspace. Returns ``None`` if the name already exists."""
-        return create_workspace(self.token, workspace_name)
+        return create_workspace(self.token, workspace_name, session=self.session, workspace_directory=self.workspace_directory)
 
     def delete_workspace(self, workspace_id: str) -> None:
         """Delete the workspace identified by *workspace_id*."""
-        delete_workspace(self.token, workspace_id)
+        delete_workspace(self.token, workspace_id, session=self.session, workspace_directory=self.workspace_directory)
+
+    def create_workspaces(self, workspace_names: list[str], max_workers: int = config.WORKSPACE_MAX_WORKERS) -> dict[str, dict]:
+        """Create many workspaces concurrently after a single listing; returns a result per name."""
+        return create_workspaces(self.token_manager.get_token, workspace_names, max_workers=max_workers, session=self.session, workspace_directory=self.workspace_directory)
+
+    def delete_workspaces(self, workspace_ids: list[str], max_workers: int = config.WORKSPACE_MAX_WORKERS) -> dict[str, dict]:
+        """Delete many workspaces concurrently; returns a result per id."""
+        return delete_workspaces(self.token_manager.get_token, workspace_ids, max_workers=max_workers, session=self.session, workspace_directory=self.workspace_directory)
+
+
+class AsyncWorkspacesMixin:
+    """Mixin that exposes workspace operations as coroutines.
+
+    Requires the host class to provide a ``_run`` coroutine that calls
+    ``func(token, *args, session=..., **kwargs)`` off the event loop, and
+    a ``workspace_directory`` attribute (see ``WorkspacesMixin``).
+    """
+
+    async def get_workspaces(self) -> list[dict]:
+        """Return all Fabric workspaces accessible to the authenticated principal."""
+        return await self._run(get_workspaces, workspace_directory=self.workspace_directory)
+
+    async def get_workspace_by_id(self, workspace_id: str) -> dict:
+        """Return a single workspace by its ID."""
+        return await self._run(get_workspace_by_id, workspace_id, workspace_directory=self.workspace_directory)
+
+    async def get_workspaces_by_name(self, workspace_name: str) -> list[dict]:
+        """Return all workspaces whose ``displayName`` matches *workspace_name*."""
+        return await self._run(get_workspaces_by_name, workspace_name, workspace_directory=self.workspace_directory)
+
+    async def create_workspace(self, workspace_name: str) -> dict | None:
+        """Create a new workspace. Returns ``None`` if the name already exists."""
+        return await self._run(create_workspace, workspace_name, workspace_directory=self.workspace_directory)
+
+    async def delete_workspace(self, workspace_id: str) -> None:
+        """Delete the workspace identified by *workspace_id*."""
+        await self._run(delete_workspace, workspace_id, workspace_directory=self.workspace_directory)
+
+    async def create_workspaces(self, workspace_names: list[str], max_workers: int = config.WORKSPACE_MAX_WORKERS) -> dict[str, dict]:
+        """Create many workspaces concurrently after a single listing; returns a result per name."""
+        return await self._run(create_workspaces, workspace_names, max_workers=max_workers, workspace_directory=self.workspace_directory)
+
+    async def delete_workspaces(self, workspace_ids: list[str], max_workers: int = config.WORKSPACE_MAX_WORKERS) -> dict[str, dict]:
+        """Delete many workspaces concurrently; returns a result per id."""
+        return await self._run(delete_workspaces, workspace_ids, max_workers=max_workers, workspace_directory=self.workspace_directory)
 
 
 def main():
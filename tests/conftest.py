@@ -0,0 +1,31 @@
+import pytest
+
+from msfabric_devops import FabricClient
+
+from .fabric_simulator import FabricSimulator
+
+# Budgets far above what the tests send, so that the client-side rate
+# limiter never delays them
+UNLIMITED = {family: (10000.0, 10000) for family in ("default", "workspaces", "items", "definitions", "operations")}
+
+
+@pytest.fixture
+def simulator():
+    """An in-memory Fabric API answering operations without delay."""
+    with FabricSimulator(poll_after=0) as simulator:
+        yield simulator
+
+
+@pytest.fixture
+def client(simulator):
+    """A ``FabricClient`` routed to ``simulator``, with caching disabled."""
+    client = simulator.attach(
+        FabricClient(item_cache_ttl=0, workspace_cache_ttl=0, rate_limits=UNLIMITED)
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def workspace_id(client):
+    return client.create_workspace("tests")["id"]
@@ -0,0 +1,410 @@
+"""Local simulator of the Fabric REST API endpoints used by msfabric_devops.
+
+Serves workspaces, items, ``getDefinition``/``updateDefinition``, 202
+long-running operations, ``continuationToken`` pagination and 429 throttling
+with ``Retry-After`` from an in-memory store, with configurable latency.
+``FabricSimulator.attach(client)`` points a ``FabricClient`` at it without any
+Azure AD or cloud access, so tests, benchmarks and manual experiments run
+offline. The ``simulator`` and ``client`` fixtures of ``tests/conftest.py``
+and ``benchmarks/conftest.py`` wrap it.
+
+    python -m tests.fabric_simulator [--port 8765] [--latency 0.02]
+
+Used as a module::
+
+    with FabricSimulator(latency=0.02, lro_seconds=0.2) as simulator:
+        client = simulator.attach(FabricClient())
+        ws = client.create_workspace("bench")
+"""
+import argparse
+import json
+import math
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from azure.core.credentials import AccessToken
+
+from msfabric_devops import config
+from msfabric_devops.authenticate import TokenManager
+from msfabric_devops.instrumentation import TimedHTTPAdapter
+
+
+class SimulatorState:
+    """In-memory workspaces, items, definitions and operations."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.workspaces: dict[str, dict] = {}
+        self.items: dict[str, dict] = {}
+        self.definitions: dict[str, list[dict]] = {}
+        # operation id -> {"ready_at", "result", "has_result"}
+        self.operations: dict[str, dict] = {}
+        self.requests = 0
+        self.throttled = 0
+        # (method, path, Authorization header) of every request, in arrival order
+        self.log: list[tuple[str, str, str | None]] = []
+        # Client (host, port) pairs, one per TCP connection opened
+        self.connections: set[tuple[str, int]] = set()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    simulator: "FabricSimulator"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    def _handle(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        simulator = self.simulator
+        state = simulator.state
+        url = urlparse(self.path)
+        path = url.path[len("/v1/"):] if url.path.startswith("/v1/") else url.path.lstrip("/")
+        with state.lock:
+            state.requests += 1
+            state.log.append((method, path, self.headers.get("Authorization")))
+            state.connections.add(self.client_address)
+
+        retry_after = simulator.take_token()
+        if retry_after is not None:
+            state.throttled += 1
+            self._reply(429, {"errorCode": "RequestBlocked", "message": "Request is blocked by the upstream service until the Retry-After time"},
+                        {"Retry-After": f"{retry_after:g}"})
+            return
+
+        with state.lock:
+            state.in_flight += 1
+            state.peak_in_flight = max(state.peak_in_flight, state.in_flight)
+        try:
+            time.sleep(simulator.latency + len(raw_body) / simulator.upload_bandwidth)
+        finally:
+            with state.lock:
+                state.in_flight -= 1
+        query = parse_qs(url.query)
+        try:
+            body = json.loads(raw_body) if raw_body else None
+        except ValueError:
+            self._reply(400, {"errorCode": "InvalidRequest", "message": "Body is not valid JSON"})
+            return
+        status, payload, headers = simulator.route(method, path, query, body)
+        self._reply(status, payload, headers)
+
+    def _reply(self, status: int, payload, headers: dict | None = None) -> None:
+        data = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if data:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        try:
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class FabricSimulator:
+    """
+    Threaded HTTP server emulating the Fabric REST API.
+
+    Parameters
+    ----------
+    latency : float
+        Seconds added to every request (service processing plus network).
+    upload_bandwidth : float
+        Request body bytes processed per second, added to the latency.
+    lro_seconds : float
+        Time an item creation, ``getDefinition`` or ``updateDefinition``
+        operation takes to complete after its 202.
+    poll_after : float
+        ``Retry-After`` sent on 202 and running operation responses.
+    page_size : int
+        Entries per page of workspace and item listings.
+    rate_limit : tuple[float, float], optional
+        ``(requests per second, burst)`` accepted before answering 429 with
+        the seconds until the next slot as ``Retry-After``.
+    port : int
+        Port to listen on (``0`` picks a free one).
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        upload_bandwidth: float = 50e6,
+        lro_seconds: float = 0.0,
+        poll_after: float = 0.05,
+        page_size: int = 100,
+        rate_limit: tuple[float, float] | None = None,
+        port: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.upload_bandwidth = upload_bandwidth
+        self.lro_seconds = lro_seconds
+        self.poll_after = poll_after
+        self.page_size = page_size
+        self.rate_limit = rate_limit
+        self.state = SimulatorState()
+        self._tokens = rate_limit[1] if rate_limit else 0.0
+        self._tokens_at = time.monotonic()
+        self._rate_lock = threading.Lock()
+
+        handler = type("Handler", (_Handler,), {"simulator": self})
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.api_url = f"{self.url}/v1"
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "FabricSimulator":
+        self._thread = threading.Thread(target=self.server.serve_forever, name="fabric-simulator", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "FabricSimulator":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def attach(self, client):
+        """
+        Route *client* to the simulator and give it a static token.
+
+        Requests for ``config.API_URL`` are rewritten to the simulator by an
+        adapter mounted on the client's session with the same pool sizes as
+        the one it replaces, so connection pooling, the rate limiter,
+        retries and instrumentation behave as against the real service.
+        """
+        pooled = client.session.get_adapter(config.API_URL)
+        adapter = _RewriteAdapter(
+            config.API_URL, self.api_url,
+            pool_connections=pooled._pool_connections,
+            pool_maxsize=pooled._pool_maxsize,
+            pool_block=pooled._pool_block,
+        )
+        client.session.mount(config.API_URL, adapter)
+        # Operation Location headers point at the simulator itself
+        client.session.mount(self.url, adapter)
+        client.token_manager = TokenManager(_StaticCredential())
+        return client
+
+    # ------------------------------------------------------------------
+    # Throttling
+    # ------------------------------------------------------------------
+
+    def take_token(self) -> float | None:
+        """Consume one request slot; return the ``Retry-After`` seconds when none is left."""
+        if self.rate_limit is None:
+            return None
+        rate, burst = self.rate_limit
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(burst, self._tokens + (now - self._tokens_at) * rate)
+            self._tokens_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return None
+            return math.ceil((1 - self._tokens) / rate * 100) / 100
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+
+    def route(self, method: str, path: str, query: dict, body) -> tuple[int, object, dict]:
+        state = self.state
+        with state.lock:
+            if match := re.fullmatch(r"operations/([^/]+)(/result)?", path):
+                return self._operation(match.group(1), bool(match.group(2)))
+            if path == "workspaces":
+                if method == "GET":
+                    return self._page(list(state.workspaces.values()), query)
+                return self._create_workspace(body)
+            if match := re.fullmatch(r"workspaces/([^/]+)", path):
+                return self._workspace(method, match.group(1))
+            if match := re.fullmatch(r"workspaces/([^/]+)/items", path):
+                return self._items(method, match.group(1), query, body)
+            if match := re.fullmatch(r"workspaces/([^/]+)/items/([^/]+)(?:/(getDefinition|updateDefinition))?", path):
+                return self._item(method, match.group(1), match.group(2), match.group(3), body)
+        return _error(404, "EntityNotFound", f"Unknown path {path}")
+
+    def _page(self, entries: list, query: dict) -> tuple[int, object, dict]:
+        start = int(query.get("continuationToken", ["0"])[0])
+        page = {"value": entries[start:start + self.page_size]}
+        if start + self.page_size < len(entries):
+            page["continuationToken"] = str(start + self.page_size)
+            page["continuationUri"] = f"{self.api_url}/?continuationToken={page['continuationToken']}"
+        return 200, page, {}
+
+    def _start_operation(self, result=None, has_result: bool = False) -> tuple[int, object, dict]:
+        operation_id = str(uuid.uuid4())
+        self.state.operations[operation_id] = {
+            "ready_at": time.monotonic() + self.lro_seconds,
+            "result": result,
+            "has_result": has_result,
+        }
+        headers = {
+            "Location": f"{self.api_url}/operations/{operation_id}",
+            "x-ms-operation-id": operation_id,
+            "Retry-After": f"{self.poll_after:g}",
+        }
+        return 202, None, headers
+
+    def _operation(self, operation_id: str, result: bool) -> tuple[int, object, dict]:
+        operation = self.state.operations.get(operation_id)
+        if operation is None:
+            return _error(404, "OperationNotFound", operation_id)
+        if result:
+            return 200, operation["result"], {}
+        if time.monotonic() < operation["ready_at"]:
+            return 200, {"status": "Running", "percentComplete": None}, {"Retry-After": f"{self.poll_after:g}"}
+        headers = {"Location": f"{self.api_url}/operations/{operation_id}/result"} if operation["has_result"] else {}
+        return 200, {"status": "Succeeded", "percentComplete": 100}, headers
+
+    def _create_workspace(self, body: dict) -> tuple[int, object, dict]:
+        name = (body or {}).get("displayName")
+        if any(ws["displayName"] == name for ws in self.state.workspaces.values()):
+            return _error(409, "WorkspaceNameAlreadyExists", f"Workspace '{name}' already exists")
+        workspace = {"id": str(uuid.uuid4()), "displayName": name, "description": "", "type": "Workspace"}
+        self.state.workspaces[workspace["id"]] = workspace
+        return 201, workspace, {}
+
+    def _workspace(self, method: str, workspace_id: str) -> tuple[int, object, dict]:
+        workspace = self.state.workspaces.get(workspace_id)
+        if workspace is None:
+            return _error(404, "WorkspaceNotFound", f"Workspace {workspace_id} not found")
+        if method == "DELETE":
+            del self.state.workspaces[workspace_id]
+            for item_id in [i for i, item in self.state.items.items() if item["workspaceId"] == workspace_id]:
+                del self.state.items[item_id]
+                self.state.definitions.pop(item_id, None)
+            return 200, None, {}
+        return 200, workspace, {}
+
+    def _items(self, method: str, workspace_id: str, query: dict, body: dict) -> tuple[int, object, dict]:
+        if workspace_id not in self.state.workspaces:
+            return _error(404, "WorkspaceNotFound", f"Workspace {workspace_id} not found")
+        if method == "GET":
+            item_type = query.get("type", [None])[0]
+            items = [
+                item for item in self.state.items.values()
+                if item["workspaceId"] == workspace_id and (item_type is None or item["type"] == item_type)
+            ]
+            return self._page(items, query)
+
+        body = body or {}
+        name, item_type = body.get("displayName"), body.get("type")
+        if any(
+            item["workspaceId"] == workspace_id and item["displayName"] == name and item["type"] == item_type
+            for item in self.state.items.values()
+        ):
+            return _error(409, "ItemDisplayNameAlreadyInUse", f"Item '{name}' already exists")
+        item = {"id": str(uuid.uuid4()), "type": item_type, "displayName": name, "description": "", "workspaceId": workspace_id}
+        self.state.items[item["id"]] = item
+        self.state.definitions[item["id"]] = _parts(body)
+        if "definition" in body:
+            return self._start_operation(item, has_result=True)
+        return 201, item, {}
+
+    def _item(self, method: str, workspace_id: str, item_id: str, action: str | None, body: dict) -> tuple[int, object, dict]:
+        item = self.state.items.get(item_id)
+        if item is None or item["workspaceId"] != workspace_id:
+            return _error(404, "ItemNotFound", f"Item {item_id} not found")
+        if action == "getDefinition":
+            parts = [
+                {"path": part["path"], "payload": part["payload"], "payloadType": part["payloadType"]}
+                for part in self.state.definitions.get(item_id, [])
+            ]
+            return self._start_operation({"definition": {"parts": parts}}, has_result=True)
+        if action == "updateDefinition":
+            self.state.definitions[item_id] = _parts(body or {})
+            return self._start_operation()
+        if method == "DELETE":
+            del self.state.items[item_id]
+            self.state.definitions.pop(item_id, None)
+            return 200, None, {}
+        return 200, item, {}
+
+
+def _parts(body: dict) -> list[dict]:
+    definition = body.get("definition") or {}
+    parts = definition.get("Parts") or definition.get("parts") or []
+    return [
+        {
+            "path": part.get("Path", part.get("path")),
+            "payload": part.get("Payload", part.get("payload")),
+            "payloadType": part.get("PayloadType", part.get("payloadType", "InlineBase64")),
+        }
+        for part in parts
+    ]
+
+
+def _error(status: int, code: str, message: str) -> tuple[int, object, dict]:
+    return status, {"errorCode": code, "message": message, "requestId": str(uuid.uuid4())}, {}
+
+
+class _StaticCredential:
+    def get_token(self, *scopes, **kwargs) -> AccessToken:
+        return AccessToken("simulator", int(time.time()) + 3600)
+
+
+class _RewriteAdapter(TimedHTTPAdapter):
+    """Send requests for *prefix* to *target* instead."""
+
+    def __init__(self, prefix: str, target: str, **pool_options) -> None:
+        super().__init__(**pool_options)
+        self.prefix = prefix
+        self.target = target
+
+    def send(self, request, *args, **kwargs):
+        if request.url.startswith(self.prefix):
+            request.url = self.target + request.url[len(self.prefix):]
+        return super().send(request, *args, **kwargs)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--lro-seconds", type=float, default=0.5)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=None, help="requests per second before 429s")
+    args = parser.parse_args()
+
+    simulator = FabricSimulator(
+        latency=args.latency,
+        lro_seconds=args.lro_seconds,
+        page_size=args.page_size,
+        rate_limit=(args.rate, args.rate * 2) if args.rate else None,
+        port=args.port,
+    )
+    print(f"Fabric simulator listening on {simulator.api_url} (Ctrl+C to stop)")
+    try:
+        simulator.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
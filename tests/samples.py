@@ -0,0 +1,66 @@
+"""Builders of PBIP item folders used by the tests and benchmarks."""
+import json
+from pathlib import Path
+
+
+def make_model(
+    root: Path,
+    name: str,
+    tables: int = 2,
+    columns: int = 3,
+    parameters: dict[str, str] | None = None,
+    roles: list[str] | None = None,
+) -> Path:
+    """Write a TMDL semantic model folder ``<root>/<name>.SemanticModel`` and return it."""
+    model = root / f"{name}.SemanticModel"
+    (model / "definition" / "tables").mkdir(parents=True)
+    (model / ".platform").write_text(json.dumps({
+        "metadata": {"type": "SemanticModel", "displayName": name},
+    }), encoding="utf-8")
+    (model / "definition.pbism").write_text('{"version": "4.0"}', encoding="utf-8")
+    model_tmdl = "model Model\n\tculture: en-US\n"
+    if roles:
+        model_tmdl += "".join(f"\nref role {role}" for role in roles) + "\n"
+        (model / "definition" / "roles").mkdir()
+        for role in roles:
+            (model / "definition" / "roles" / f"{role}.tmdl").write_text(
+                f"role {role}\n\tmodelPermission: read\n", encoding="utf-8",
+            )
+    (model / "definition" / "model.tmdl").write_text(model_tmdl, encoding="utf-8")
+    if parameters:
+        (model / "definition" / "expressions.tmdl").write_text("\n".join(
+            f'expression {name} = "{value}" meta [IsParameterQuery=true, Type="Text", IsParameterQueryRequired=true]\n'
+            f"\tlineageTag: {index}\n"
+            for index, (name, value) in enumerate(parameters.items())
+        ), encoding="utf-8")
+    for i in range(tables):
+        body = "".join(f"\tcolumn Col{c}\n\t\tdataType: string\n\n" for c in range(columns))
+        (model / "definition" / "tables" / f"Table{i}.tmdl").write_text(
+            f"table Table{i}\n{body}\tpartition Table{i} = m\n\t\tmode: import\n\t\tsource = Source\n",
+            encoding="utf-8",
+        )
+    return model
+
+
+def make_report(root: Path, name: str, model: Path, pages: int = 3) -> Path:
+    """Write a report folder bound ``byPath`` to the *model* folder and return it."""
+    report = root / f"{name}.Report"
+    report.mkdir(parents=True)
+    (report / ".platform").write_text(json.dumps({
+        "metadata": {"type": "Report", "displayName": name},
+    }), encoding="utf-8")
+    (report / "definition.pbir").write_text(json.dumps({
+        "version": "4.0",
+        "datasetReference": {"byPath": {"path": f"../{model.name}"}},
+    }), encoding="utf-8")
+    (report / "report.json").write_text(json.dumps({"sections": [{"name": f"s{i}"} for i in range(pages)]}), encoding="utf-8")
+    return report
+
+
+def make_repository(root: Path, models: int, reports_per_model: int, tables: int = 2, columns: int = 3) -> Path:
+    """Write *models* semantic models, each with *reports_per_model* reports, under *root*."""
+    for m in range(models):
+        model = make_model(root, f"Model{m}", tables=tables, columns=columns)
+        for r in range(reports_per_model):
+            make_report(root, f"Model{m}_Report{r}", model)
+    return root
@@ -0,0 +1,156 @@
+import base64
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from msfabric_devops import FabricClient
+from msfabric_devops.api import FabricSession, StreamingDefinitionBody, iter_definition_parts
+from msfabric_devops.exceptions import FabricError
+
+from .conftest import UNLIMITED
+from .samples import make_model
+
+
+def test_session_keeps_connections_alive():
+    session = FabricSession()
+
+    assert session.headers["Connection"] == "keep-alive"
+    assert session.get_adapter("https://api.fabric.microsoft.com/v1/") is session.get_adapter("http://localhost/")
+
+
+def test_sequential_calls_reuse_one_connection(client, simulator):
+    client.create_workspace("pooled")
+    for _ in range(20):
+        client.get_workspaces()
+
+    assert simulator.state.requests > 20
+    assert len(simulator.state.connections) == 1
+
+
+def test_operation_polls_reuse_the_connection(client, simulator, workspace_id, tmp_path):
+    client.import_item(workspace_id, str(make_model(tmp_path, "Pooled")))
+
+    assert any(path.startswith("operations/") for _, path, _ in simulator.state.log)
+    assert len(simulator.state.connections) == 1
+
+
+def test_concurrent_calls_are_bounded_by_the_pool(simulator):
+    simulator.latency = 0.02
+    client = simulator.attach(FabricClient(pool_maxsize=4, rate_limits=UNLIMITED, workspace_cache_ttl=0))
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for _ in range(2):
+                list(executor.map(lambda _: client.get_workspaces(), range(40)))
+    finally:
+        client.close()
+
+    assert simulator.state.requests == 80
+    assert len(simulator.state.connections) <= 4
+
+
+def seed_items(simulator, workspace_id, count):
+    for i in range(count):
+        simulator.state.items[f"seed-{i}"] = {
+            "id": f"seed-{i}", "type": "Report", "displayName": f"Seed {i}", "workspaceId": workspace_id,
+        }
+
+
+def item_page_requests(simulator, workspace_id) -> int:
+    return sum(1 for method, path, _ in simulator.state.log if (method, path) == ("GET", f"workspaces/{workspace_id}/items"))
+
+
+def test_listing_follows_continuation_tokens(client, simulator, workspace_id):
+    simulator.page_size = 10
+    seed_items(simulator, workspace_id, 25)
+
+    items = client.get_items(workspace_id)
+
+    assert [item["id"] for item in items] == [f"seed-{i}" for i in range(25)]
+    assert item_page_requests(simulator, workspace_id) == 3
+
+
+def test_iterator_requests_pages_as_they_are_consumed(client, simulator, workspace_id):
+    simulator.page_size = 10
+    seed_items(simulator, workspace_id, 25)
+
+    items = client.iter_items(workspace_id)
+    first = [next(items) for _ in range(10)]
+
+    assert first[-1]["id"] == "seed-9"
+    assert item_page_requests(simulator, workspace_id) == 1
+    assert len(list(items)) == 15
+    assert item_page_requests(simulator, workspace_id) == 3
+
+
+def test_prefetching_iterator_returns_the_same_items(client, simulator, workspace_id):
+    simulator.page_size = 10
+    seed_items(simulator, workspace_id, 25)
+
+    prefetched = list(client.iter_items(workspace_id, prefetch=True))
+
+    assert prefetched == list(client.iter_items(workspace_id))
+
+
+def test_streaming_body_renders_every_payload_kind(tmp_path):
+    on_disk = tmp_path / "model.tmdl"
+    on_disk.write_bytes(b"model Model\n" * 1000)
+    parts = [
+        {"Path": "encoded.json", "Payload": base64.b64encode(b"{}").decode(), "PayloadType": "InlineBase64"},
+        {"Path": "raw.pbir", "Payload": b'{"version": "4.0"}', "PayloadType": "InlineBase64"},
+        {"Path": "definition/model.tmdl", "Payload": on_disk, "PayloadType": "InlineBase64"},
+    ]
+    body = StreamingDefinitionBody(parts, {"displayName": "Sales", "type": "SemanticModel"}, chunk_size=100)
+
+    rendered = b"".join(body)
+
+    assert len(rendered) == len(body)
+    assert b"".join(body) == rendered
+    document = json.loads(rendered)
+    assert (document["displayName"], document["type"]) == ("Sales", "SemanticModel")
+    assert [base64.b64decode(part["Payload"]) for part in document["definition"]["Parts"]] == [
+        b"{}", b'{"version": "4.0"}', on_disk.read_bytes(),
+    ]
+
+
+def test_streamed_import_uploads_the_files(client, simulator, workspace_id, tmp_path):
+    model = make_model(tmp_path, "Streamed", tables=5)
+
+    item = client.import_item(workspace_id, str(model), stream=True)
+
+    uploaded = {part["path"]: base64.b64decode(part["payload"]) for part in simulator.state.definitions[item["id"]]}
+    assert uploaded["definition/tables/Table4.tmdl"] == (model / "definition" / "tables" / "Table4.tmdl").read_bytes()
+    assert len(uploaded) == 8
+
+
+def streamed_response(data: bytes, status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(data)
+    return response
+
+
+def test_definition_parts_are_parsed_while_streaming():
+    parts = [
+        {"path": f"definition/tables/Table{i}.tmdl", "payload": base64.b64encode(b"x" * 100 * i).decode(), "payloadType": "InlineBase64"}
+        for i in range(5)
+    ]
+    data = "\ufeff".encode("utf-8") + json.dumps({"definition": {"format": "TMDL", "parts": parts}}).encode("utf-8")
+
+    assert list(iter_definition_parts(streamed_response(data), chunk_size=7)) == parts
+
+
+def test_streamed_error_payload_raises():
+    data = json.dumps({"errorCode": "ItemNotFound", "message": "Item not found"}).encode("utf-8")
+
+    with pytest.raises(FabricError, match="ItemNotFound"):
+        list(iter_definition_parts(streamed_response(data, 404)))
+
+
+def test_truncated_definition_raises():
+    data = b'{"definition": {"parts": [{"path": "a", "payload": "QQ=='
+
+    with pytest.raises(FabricError, match="ended"):
+        list(iter_definition_parts(streamed_response(data), chunk_size=8))
@@ -0,0 +1,166 @@
+import os
+import threading
+import time
+
+import pytest
+from azure.core.credentials import AccessToken
+
+from msfabric_devops import authenticate, config
+from msfabric_devops.authenticate import EncryptedTokenCache, TokenManager
+from msfabric_devops.exceptions import FabricAuthError
+
+
+class Credential:
+    """Credential stand-in counting its calls; issues *tokens* in turn, repeating the last one."""
+
+    def __init__(self, *tokens, fail: bool = False) -> None:
+        self.tokens = list(tokens)
+        self.fail = fail
+        self.calls = 0
+
+    def get_token(self, *scopes, **kwargs) -> AccessToken:
+        self.calls += 1
+        if self.fail and self.calls > 1:
+            raise RuntimeError("credential unavailable")
+        return self.tokens[min(self.calls, len(self.tokens)) - 1]
+
+
+def token(value: str, seconds: float) -> AccessToken:
+    return AccessToken(value, int(time.time() + seconds))
+
+
+def wait_for_refresh() -> None:
+    for thread in threading.enumerate():
+        if thread.name == "msfabric-token":
+            thread.join(5)
+
+
+def test_token_is_cached_while_valid():
+    credential = Credential(token("a", 3600))
+    manager = TokenManager(credential)
+
+    assert [manager.get_token() for _ in range(100)] == ["a"] * 100
+    assert credential.calls == 1
+
+
+def test_background_refresh_adopts_a_newer_token():
+    credential = Credential(token("a", 3600), token("b", 7200))
+    manager = TokenManager(credential)
+    manager.get_token()
+    manager._refresh_at = 0.0
+
+    assert manager.get_token() == "a"
+    wait_for_refresh()
+
+    assert manager.get_token() == "b"
+    assert credential.calls == 2
+
+
+def test_unchanged_token_backs_off_instead_of_refreshing_on_every_call():
+    credential = Credential(token("a", 3600))
+    manager = TokenManager(credential, refresh_backoff=30)
+    manager.get_token()
+    manager._refresh_at = 0.0
+
+    manager.get_token()
+    wait_for_refresh()
+    for _ in range(100):
+        assert manager.get_token() == "a"
+
+    assert credential.calls == 2
+    assert time.time() + 25 < manager._refresh_at <= time.time() + 30
+
+
+def test_backoff_doubles_up_to_the_refresh_margin_and_resets_on_a_new_token():
+    credential = Credential(token("a", 3600))
+    manager = TokenManager(credential, refresh_margin=100, refresh_backoff=30)
+    manager.get_token()
+
+    delays = []
+    for _ in range(4):
+        manager._refresh_at = 0.0
+        manager.get_token()
+        wait_for_refresh()
+        delays.append(round(manager._refresh_at - time.time()))
+
+    assert delays == [30, 60, 100, 100]
+    credential.tokens.append(token("b", 7200))
+    manager._refresh_at = 0.0
+    manager.get_token()
+    wait_for_refresh()
+    assert manager._backoff == 30
+
+
+def test_failed_background_refresh_keeps_the_token_and_backs_off():
+    credential = Credential(token("a", 3600), fail=True)
+    manager = TokenManager(credential, refresh_backoff=30)
+    manager.get_token()
+    manager._refresh_at = 0.0
+
+    manager.get_token()
+    wait_for_refresh()
+    for _ in range(100):
+        assert manager.get_token() == "a"
+
+    assert credential.calls == 2
+
+
+def test_backoff_never_outlives_the_minimum_validity():
+    credential = Credential(token("a", 120))
+    manager = TokenManager(credential, refresh_margin=300, min_validity=60, refresh_backoff=1000)
+    manager.get_token()
+    manager._refresh_at = 0.0
+
+    manager.get_token()
+    wait_for_refresh()
+
+    assert manager._refresh_at <= manager._token.expires_on - 60
+
+
+@pytest.fixture
+def no_configured_key(monkeypatch):
+    monkeypatch.setattr(config, "TOKEN_CACHE_KEY", None)
+    monkeypatch.setattr(config, "TOKEN_CACHE_KEY_FILE", None)
+
+
+def test_token_cache_requires_a_key(tmp_path, no_configured_key):
+    with pytest.raises(FabricAuthError, match="needs a key"):
+        EncryptedTokenCache(str(tmp_path / "cache" / "tokens.bin"))
+
+    assert not (tmp_path / "cache").exists()
+
+
+def test_token_cache_refuses_a_key_file_next_to_the_cache(tmp_path, no_configured_key):
+    with pytest.raises(FabricAuthError, match="next to the cache"):
+        EncryptedTokenCache(str(tmp_path / "tokens.bin"), key_path=str(tmp_path / "tokens.key"))
+
+
+def test_token_cache_key_file_is_created_once_and_shared(tmp_path, no_configured_key):
+    cache_path = str(tmp_path / "cache" / "tokens.bin")
+    key_path = tmp_path / "keys" / "tokens.key"
+    caches = []
+
+    def open_cache():
+        caches.append(EncryptedTokenCache(cache_path, key_path=str(key_path)))
+
+    threads = [threading.Thread(target=open_cache) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    caches[0].store("identity", token("shared", 3600))
+
+    assert [cache.load("identity").token for cache in caches] == ["shared"] * 8
+    assert sorted(os.listdir(key_path.parent)) == ["tokens.key"]
+    if os.name == "posix":
+        assert key_path.stat().st_mode & 0o777 == 0o600
+
+
+def test_token_cache_fails_clearly_on_a_truncated_key_file(tmp_path, no_configured_key, monkeypatch):
+    monkeypatch.setattr(authenticate.time, "sleep", lambda seconds: None)
+    key_path = tmp_path / "keys" / "tokens.key"
+    key_path.parent.mkdir()
+    key_path.write_bytes(b"")
+
+    with pytest.raises(FabricAuthError, match="empty or truncated"):
+        EncryptedTokenCache(str(tmp_path / "tokens.bin"), key_path=str(key_path))
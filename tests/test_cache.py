@@ -0,0 +1,114 @@
+import time
+
+from msfabric_devops import FabricClient, config
+from msfabric_devops.cache import ItemInventoryCache
+
+from .conftest import UNLIMITED
+from .samples import make_model
+
+ITEMS = [
+    {"id": "1", "type": "SemanticModel", "displayName": "Sales"},
+    {"id": "2", "type": "Report", "displayName": "Sales"},
+    {"id": "3", "type": "Report", "displayName": "Finance"},
+]
+
+
+def test_item_cache_indexes_by_id_key_and_name():
+    cache = ItemInventoryCache(ttl=60)
+    cache.set_items("ws", ITEMS)
+
+    assert cache.get_item("ws", "3") == ITEMS[2]
+    assert cache.find_item("ws", "report", "SALES") == ITEMS[1]
+    assert sorted(cache.find_items_by_name("ws", "Sales"), key=lambda item: item["id"]) == ITEMS[:2]
+    assert cache.find_items_by_name("ws", "sales") == []
+    assert cache.get_items("other") is None
+
+
+def test_item_cache_patches_and_expires():
+    cache = ItemInventoryCache(ttl=60)
+    cache.set_items("ws", ITEMS)
+
+    cache.put_item("ws", {"id": "2", "type": "Report", "displayName": "Renamed"})
+    cache.remove_item("ws", "3")
+
+    assert cache.find_item("ws", "Report", "Sales") is None
+    assert cache.find_item("ws", "Report", "Renamed")["id"] == "2"
+    assert [item["id"] for item in cache.get_items("ws")] == ["1", "2"]
+
+    cache.ttl = 0.01
+    time.sleep(0.02)
+    assert not cache.is_loaded("ws")
+
+
+def test_item_cache_disabled_with_zero_ttl():
+    cache = ItemInventoryCache(ttl=0)
+    cache.set_items("ws", ITEMS)
+
+    assert cache.get_items("ws") is None
+
+
+def test_item_cache_is_not_corrupted_by_caller_mutation():
+    cache = ItemInventoryCache(ttl=60)
+    stored = [dict(item) for item in ITEMS]
+    cache.set_items("ws", stored)
+    stored[0]["displayName"] = "Changed before lookup"
+
+    for item in cache.get_items("ws"):
+        item["displayName"] = "Changed"
+    cache.get_item("ws", "1")["type"] = "Changed"
+    for item in cache.find_items_by_name("ws", "Sales"):
+        item["id"] = "Changed"
+
+    assert cache.get_items("ws") == ITEMS
+    assert cache.find_item("ws", "SemanticModel", "Sales") == ITEMS[0]
+
+
+def test_item_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "inventory.json"
+    ItemInventoryCache(ttl=60, path=str(path)).set_items("ws", ITEMS)
+
+    assert ItemInventoryCache(ttl=60, path=str(path)).find_item("ws", "Report", "Finance") == ITEMS[2]
+
+
+def test_client_answers_repeated_listings_from_the_cache(simulator):
+    client = simulator.attach(FabricClient(item_cache_ttl=60, rate_limits=UNLIMITED))
+    try:
+        workspace_id = client.create_workspace("cached")["id"]
+        simulator.state.items["seed"] = {"id": "seed", "type": "Report", "displayName": "Seed", "workspaceId": workspace_id}
+        for _ in range(5):
+            assert [item["id"] for item in client.get_items(workspace_id)] == ["seed"]
+        client.get_items(workspace_id)[0]["displayName"] = "Changed"
+        assert client.get_items_by_name(workspace_id, "Seed")[0]["id"] == "seed"
+    finally:
+        client.close()
+
+    listings = [path for method, path, _ in simulator.state.log if path == f"workspaces/{workspace_id}/items"]
+    assert len(listings) == 1
+
+
+def test_client_does_not_cache_items_by_default():
+    client = FabricClient(rate_limits=UNLIMITED)
+    try:
+        client.item_cache.set_items("ws", ITEMS)
+        assert not client.item_cache.is_loaded("ws")
+    finally:
+        client.close()
+
+
+def test_import_relists_when_a_cached_item_was_deleted(simulator, tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "print_color", lambda *args, **kwargs: None)
+    client = simulator.attach(FabricClient(item_cache_ttl=60, rate_limits=UNLIMITED))
+    model = make_model(tmp_path, "Sales")
+    try:
+        workspace_id = client.create_workspace("cached")["id"]
+        first = client.import_item(workspace_id, str(model))
+        # Deleted outside the client, after the listing was cached
+        del simulator.state.items[first["id"]]
+        second = client.import_item(workspace_id, str(model))
+    finally:
+        client.close()
+
+    assert second["id"] != first["id"]
+    assert simulator.state.items[second["id"]]["displayName"] == "Sales"
+    listings = [path for method, path, _ in simulator.state.log if path == f"workspaces/{workspace_id}/items" and method == "GET"]
+    assert len(listings) == 2
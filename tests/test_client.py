@@ -0,0 +1,52 @@
+import asyncio
+
+from msfabric_devops import AsyncFabricClient
+
+from .conftest import UNLIMITED
+from .test_lro import CountingTokens
+from .samples import make_model
+
+
+def run_async(simulator, coroutine_function, **options):
+    async def main():
+        async with simulator.attach(AsyncFabricClient(rate_limits=UNLIMITED, workspace_cache_ttl=0, **options)) as client:
+            return await coroutine_function(client)
+
+    return asyncio.run(main())
+
+
+def test_async_client_limits_in_flight_requests(simulator):
+    simulator.latency = 0.05
+
+    async def list_many(client):
+        await client.create_workspace("async")
+        return await asyncio.gather(*(client.get_workspaces() for _ in range(10)))
+
+    results = run_async(simulator, list_many, max_concurrency=2)
+
+    assert [len(workspaces) for workspaces in results] == [1] * 10
+    assert simulator.state.peak_in_flight == 2
+
+
+def test_async_client_offloads_local_model_edits(simulator, tmp_path):
+    model = make_model(tmp_path, "Sales", parameters={"Server": "dev"})
+
+    async def set_parameters(client):
+        return await client.set_semantic_model_parameters_many([str(model)], {"Server": "prod"})
+
+    results = run_async(simulator, set_parameters)
+
+    assert results == {str(model): None}
+    assert '"prod"' in (model / "definition" / "expressions.tmdl").read_text(encoding="utf-8")
+
+
+def test_async_client_resolves_the_token_per_request(simulator):
+    async def create(client):
+        client.token_manager = CountingTokens()
+        return await client.create_workspace("async")
+
+    run_async(simulator, create)
+
+    tokens = [authorization for _, _, authorization in simulator.state.log]
+    assert len(tokens) >= 2
+    assert len(set(tokens)) == len(tokens)
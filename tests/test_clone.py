@@ -0,0 +1,112 @@
+import base64
+import json
+
+import pytest
+
+from msfabric_devops import FabricClient, clone, config
+from msfabric_devops.definitions import pbir_semantic_model_id
+
+from .conftest import UNLIMITED
+from .fabric_simulator import FabricSimulator
+from .samples import make_model, make_report
+from .test_lro import CountingTokens
+
+
+@pytest.fixture(autouse=True)
+def quiet(monkeypatch):
+    monkeypatch.setattr(config, "print_color", lambda *args, **kwargs: None)
+
+
+def parts(simulator, item_id) -> dict[str, bytes]:
+    return {part["path"]: base64.b64decode(part["payload"]) for part in simulator.state.definitions[item_id]}
+
+
+def bound_model(simulator, report_id) -> str | None:
+    return pbir_semantic_model_id(json.loads(parts(simulator, report_id)["definition.pbir"]))
+
+
+@pytest.fixture
+def repository(client, workspace_id, tmp_path):
+    """Two models with a report each, deployed to ``workspace_id``; returns ``{displayName: id}``."""
+    for name in ("Sales", "Stock"):
+        make_report(tmp_path, f"{name} Report", make_model(tmp_path, name))
+    results = client.deploy_folder(workspace_id, str(tmp_path))
+    return {result["displayName"]: result["result"]["id"] for result in results.values()}
+
+
+def test_clone_item_copies_the_definition(client, simulator, workspace_id, repository):
+    target = client.create_workspace("target")["id"]
+
+    cloned = client.clone_item(workspace_id, repository["Sales"], client, target)
+    again = client.clone_item(workspace_id, repository["Sales"], client, target)
+
+    assert cloned["id"] != repository["Sales"]
+    assert again["id"] == cloned["id"]
+    assert parts(simulator, cloned["id"]) == parts(simulator, repository["Sales"])
+
+
+def test_clone_item_rebinds_a_report(client, simulator, workspace_id, repository):
+    target = client.create_workspace("target")["id"]
+
+    cloned = client.clone_item(workspace_id, repository["Sales Report"], client, target, semantic_model_id="model-b")
+
+    assert bound_model(simulator, cloned["id"]) == "model-b"
+
+
+def test_clone_items_rebinds_reports_to_models_of_the_batch(client, simulator, workspace_id, repository):
+    target = client.create_workspace("target")["id"]
+    ids = [repository[name] for name in ("Sales Report", "Stock Report", "Sales", "Stock")]
+
+    results = client.clone_items(workspace_id, ids + ["missing"], client, target, max_workers=2)
+
+    assert list(results) == ids + ["missing"]
+    assert [results[item_id]["status"] for item_id in ids] == ["cloned"] * 4
+    assert results["missing"]["status"] == "failed"
+    for name in ("Sales", "Stock"):
+        report = results[repository[f"{name} Report"]]["result"]["id"]
+        assert bound_model(simulator, report) == results[repository[name]]["result"]["id"]
+
+
+def test_reports_of_a_failed_model_are_skipped(client, workspace_id, repository, monkeypatch):
+    target = client.create_workspace("target")["id"]
+    import_clone = clone._import_clone
+
+    def failing_import(target_client, target_workspace_id, item, *args):
+        if item["displayName"] == "Sales":
+            raise RuntimeError("import failed")
+        return import_clone(target_client, target_workspace_id, item, *args)
+
+    monkeypatch.setattr(clone, "_import_clone", failing_import)
+
+    results = client.clone_items(workspace_id, list(repository.values()), client, target)
+
+    statuses = {result["displayName"]: result["status"] for result in results.values()}
+    assert statuses == {"Sales": "failed", "Sales Report": "skipped", "Stock": "cloned", "Stock Report": "cloned"}
+
+
+def test_clone_between_tenants(client, simulator, workspace_id, repository):
+    with FabricSimulator(poll_after=0) as other_tenant:
+        target = other_tenant.attach(FabricClient(item_cache_ttl=0, workspace_cache_ttl=0, rate_limits=UNLIMITED))
+        try:
+            target_workspace = target.create_workspace("target")["id"]
+            results = client.clone_items(workspace_id, [repository["Sales"], repository["Sales Report"]], target, target_workspace)
+        finally:
+            target.close()
+
+    model = results[repository["Sales"]]["result"]["id"]
+    report = results[repository["Sales Report"]]["result"]["id"]
+    assert parts(other_tenant, model) == parts(simulator, repository["Sales"])
+    assert bound_model(other_tenant, report) == model
+    assert model not in simulator.state.definitions
+
+
+def test_clone_imports_resolve_the_target_token_per_request(client, simulator, workspace_id, repository):
+    target = client.create_workspace("target")["id"]
+    client.token_manager = CountingTokens()
+    logged = len(simulator.state.log)
+
+    client.clone_items(workspace_id, [repository["Sales"], repository["Stock"]], client, target)
+
+    tokens = [authorization for _, path, authorization in simulator.state.log[logged:] if target in path]
+    assert len(tokens) >= 4
+    assert len(set(tokens)) == len(tokens)
@@ -0,0 +1,82 @@
+import base64
+
+from msfabric_devops.definitions import DefinitionPart, ItemDefinition, normalize_part
+from msfabric_devops.items import _save_definition_parts
+
+
+def response(*parts: tuple[str, bytes]) -> dict:
+    return {"definition": {"format": "TMDL", "parts": [
+        {"path": path, "payload": base64.b64encode(data).decode(), "payloadType": "InlineBase64"}
+        for path, data in parts
+    ]}}
+
+
+def test_payload_is_decoded_once_and_shared():
+    part = DefinitionPart("a.tmdl", payload=base64.b64encode(b"model").decode())
+
+    first = part.data
+
+    assert first == b"model"
+    assert part.data is first
+    assert part.copy().data is first
+
+
+def test_mutable_input_is_copied_once():
+    buffer = bytearray(b"model")
+    part = DefinitionPart("a.tmdl", data=buffer)
+    buffer[:] = b"xxxxx"
+
+    assert part.data == b"model"
+    assert isinstance(part.data, bytes)
+    assert part.data is part.data
+
+
+def test_setting_data_invalidates_payload_and_hash():
+    part = DefinitionPart("a.tmdl", payload=base64.b64encode(b"old").decode())
+    old_hash = part.sha256
+
+    part.text = "new"
+
+    assert base64.b64decode(part.payload) == b"new"
+    assert part.sha256 != old_hash
+
+
+def test_files_are_read_on_demand(tmp_path):
+    path = tmp_path / "a.tmdl"
+    path.write_bytes(b"one")
+    part = DefinitionPart("a.tmdl", data=path)
+
+    assert part.data == b"one"
+    path.write_bytes(b"two")
+    assert part.data == b"two"
+    assert part.to_request(encode=False)["Payload"] == path
+
+
+def test_definition_indexes_parts_by_path():
+    definition = ItemDefinition.from_response(response(("a.tmdl", b"a"), ("b/c.tmdl", b"c")))
+
+    definition.set("a.tmdl", "changed")
+    definition.set("b/d.tmdl", b"d")
+    definition.remove("b/c.tmdl")
+
+    assert definition.paths() == ["a.tmdl", "b/d.tmdl"]
+    assert definition["a.tmdl"].text == "changed"
+    assert [part.path for part in definition.under("b/", ".tmdl")] == ["b/d.tmdl"]
+    assert "definition" not in definition
+    assert definition.to_dict()["definition"]["format"] == "TMDL"
+
+
+def test_save_writes_parts_and_prints_one_line(tmp_path, capsys):
+    _save_definition_parts(response(("a.tmdl", b"a"), ("b/c.tmdl", b"c")), str(tmp_path))
+
+    assert (tmp_path / "a.tmdl").read_bytes() == b"a"
+    assert (tmp_path / "b" / "c.tmdl").read_bytes() == b"c"
+    assert len(capsys.readouterr().out.splitlines()) == 1
+
+
+def test_platform_part_is_normalized_as_json():
+    published = b'\xef\xbb\xbf{\r\n  "metadata": {"type": "Report", "displayName": "Sales"}\r\n}'
+
+    assert normalize_part(".platform", published) == b'{"metadata":{"displayName":"Sales","type":"Report"}}'
+    assert normalize_part("Sales.Report/.platform", published) == normalize_part(".platform", published)
+    assert normalize_part(".gitignore", b"a \r\n") == b"a \r\n"
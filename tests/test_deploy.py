@@ -0,0 +1,96 @@
+import base64
+import json
+
+import pytest
+
+from msfabric_devops import config, deploy, items, plan_deployment
+from msfabric_devops.definitions import pbir_semantic_model_id
+from msfabric_devops.exceptions import FabricError
+
+from .samples import make_report, make_repository
+from .test_lro import CountingTokens
+
+
+def test_plan_deploys_models_before_their_reports(tmp_path):
+    make_repository(tmp_path, models=2, reports_per_model=2)
+
+    plan = plan_deployment(str(tmp_path))
+
+    assert [[plan.items[path]["displayName"] for path in wave] for wave in plan.waves()] == [
+        ["Model0", "Model1"],
+        ["Model0_Report0", "Model0_Report1", "Model1_Report0", "Model1_Report1"],
+    ]
+
+
+def test_plan_refuses_reports_bound_outside_the_repository(tmp_path):
+    make_report(tmp_path / "repository", "Orphan", tmp_path / "Elsewhere.SemanticModel")
+
+    with pytest.raises(FabricError, match="not a semantic model folder"):
+        plan_deployment(str(tmp_path / "repository"))
+
+
+def test_plan_refuses_dependency_cycles(tmp_path):
+    make_repository(tmp_path, models=1, reports_per_model=1)
+    plan = plan_deployment(str(tmp_path))
+    model, report = sorted(plan.items)
+    plan.items[str(model)]["dependsOn"].append(report)
+
+    with pytest.raises(FabricError, match="cycle"):
+        plan.waves()
+
+
+def test_deploy_folder_rebinds_reports(client, simulator, workspace_id, tmp_path):
+    make_repository(tmp_path, models=2, reports_per_model=2)
+
+    results = client.deploy_folder(workspace_id, str(tmp_path), max_workers=3)
+
+    assert {result["status"] for result in results.values()} == {"deployed"}
+    ids = {result["displayName"]: result["result"]["id"] for result in results.values()}
+    for name, item_id in ids.items():
+        if "_Report" in name:
+            pbir = next(part for part in simulator.state.definitions[item_id] if part["path"] == "definition.pbir")
+            assert pbir_semantic_model_id(json.loads(base64.b64decode(pbir["payload"]))) == ids[name.split("_")[0]]
+
+
+def test_caller_item_properties_are_merged_under_the_plan(client, simulator, workspace_id, tmp_path):
+    make_repository(tmp_path, models=1, reports_per_model=1)
+    import_options = {"item_properties": {"displayName": "Ignored", "semanticModelId": "other-model"}}
+
+    results = client.deploy_folder(workspace_id, str(tmp_path), import_options=import_options)
+
+    ids = {result["displayName"]: result["result"]["id"] for result in results.values()}
+    assert sorted(ids) == ["Model0", "Model0_Report0"]
+    pbir = next(part for part in simulator.state.definitions[ids["Model0_Report0"]] if part["path"] == "definition.pbir")
+    assert pbir_semantic_model_id(json.loads(base64.b64decode(pbir["payload"]))) == ids["Model0"]
+    assert import_options == {"item_properties": {"displayName": "Ignored", "semanticModelId": "other-model"}}
+
+
+def test_failed_model_skips_its_reports_only(client, workspace_id, tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "print_color", lambda *args, **kwargs: None)
+    make_repository(tmp_path, models=2, reports_per_model=1)
+
+    def import_item(token, workspace_id, path, **kwargs):
+        if path.endswith("Model0.SemanticModel"):
+            raise FabricError("import failed")
+        return items.import_item(token, workspace_id, path, **kwargs)
+
+    monkeypatch.setattr(deploy, "import_item", import_item)
+
+    results = client.deploy_folder(workspace_id, str(tmp_path))
+
+    statuses = {result["displayName"]: result["status"] for result in results.values()}
+    assert statuses == {"Model0": "failed", "Model0_Report0": "skipped", "Model1": "deployed", "Model1_Report0": "deployed"}
+    assert results[str(tmp_path.resolve() / "Model0.SemanticModel")]["error"] == "import failed"
+
+
+def test_deploy_folder_resolves_the_token_per_request(client, simulator, workspace_id, tmp_path):
+    make_repository(tmp_path, models=2, reports_per_model=2)
+    client.token_manager = CountingTokens()
+    first = len(simulator.state.log)
+
+    client.deploy_folder(workspace_id, str(tmp_path), max_workers=3)
+
+    tokens = [authorization for _, _, authorization in simulator.state.log[first:]]
+    assert len(tokens) > 6
+    assert len(set(tokens)) > 6
+
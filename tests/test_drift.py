@@ -0,0 +1,101 @@
+import pytest
+
+from msfabric_devops import config, format_drift_report
+
+from .samples import make_model, make_repository
+from .test_items import published_part, rewrite_published
+from .test_lro import CountingTokens
+
+
+@pytest.fixture
+def deployed(client, workspace_id, tmp_path, monkeypatch):
+    """A repository of 2 models with a report each, deployed to ``workspace_id``; returns ``{displayName: id}``."""
+    monkeypatch.setattr(config, "print_color", lambda *args, **kwargs: None)
+    make_repository(tmp_path, models=2, reports_per_model=1)
+    results = client.deploy_folder(workspace_id, str(tmp_path))
+    return {result["displayName"]: result["result"]["id"] for result in results.values()}
+
+
+def test_freshly_deployed_workspace_is_in_sync(client, workspace_id, deployed, tmp_path):
+    report = client.scan_drift([workspace_id], str(tmp_path))
+
+    workspace = report["workspaces"][workspace_id]
+    assert workspace["status"] == "in_sync"
+    assert {item["status"] for item in workspace["items"].values()} == {"in_sync"}
+    assert report["summary"]["items"] == {"in_sync": 4, "drifted": 0, "missing": 0, "failed": 0}
+
+
+def test_service_formatting_is_not_drift(client, simulator, workspace_id, deployed, tmp_path):
+    item_id = deployed["Model0"]
+    local = (tmp_path / "Model0.SemanticModel" / "definition" / "model.tmdl").read_bytes()
+    rewrite_published(simulator, item_id, "definition/model.tmdl", b"\xef\xbb\xbf" + local.replace(b"\n", b"\r\n"))
+
+    report = client.scan_drift([workspace_id], str(tmp_path))
+
+    assert report["workspaces"][workspace_id]["status"] == "in_sync"
+
+
+def test_changed_added_and_removed_parts_are_reported(client, simulator, workspace_id, deployed, tmp_path):
+    item_id = deployed["Model0"]
+    rewrite_published(simulator, item_id, "definition/tables/Table0.tmdl", b"table Table0\n\tcolumn Edited\n")
+    simulator.state.definitions[item_id].remove(published_part(simulator, item_id, "definition/tables/Table1.tmdl"))
+    simulator.state.definitions[item_id].append({**published_part(simulator, item_id, "definition/model.tmdl"), "path": "definition/extra.tmdl"})
+
+    report = client.scan_drift([workspace_id], str(tmp_path))
+
+    item = report["workspaces"][workspace_id]["items"]["Model0.SemanticModel"]
+    assert item["status"] == "drifted"
+    assert item["itemId"] == item_id
+    assert item["parts"] == {
+        "definition/extra.tmdl": "extra",
+        "definition/tables/Table0.tmdl": "modified",
+        "definition/tables/Table1.tmdl": "missing",
+    }
+    assert report["workspaces"][workspace_id]["status"] == "drifted"
+
+
+def test_ignored_parts_are_left_out(client, simulator, workspace_id, deployed, tmp_path):
+    rewrite_published(simulator, deployed["Model0"], "definition/tables/Table0.tmdl", b"edited")
+
+    report = client.scan_drift([workspace_id], str(tmp_path), ignore_parts=(*config.DRIFT_IGNORED_PARTS, "definition/tables/*"))
+
+    assert report["workspaces"][workspace_id]["status"] == "in_sync"
+
+
+def test_many_workspaces_missing_items_and_failures(client, workspace_id, deployed, tmp_path):
+    empty = client.create_workspace("empty")["id"]
+    unknown = "00000000-0000-0000-0000-000000000000"
+
+    report = client.scan_drift([workspace_id, empty, unknown], str(tmp_path), max_workers=3)
+
+    workspaces = report["workspaces"]
+    assert [workspaces[ws]["status"] for ws in (workspace_id, empty, unknown)] == ["in_sync", "drifted", "failed"]
+    assert {item["status"] for item in workspaces[empty]["items"].values()} == {"missing"}
+    assert workspaces[unknown]["error"]
+    assert (report["summary"]["drifted"], report["summary"]["failed"]) == (1, 1)
+
+    text = format_drift_report(report)
+    assert f"{empty}: drifted (4 of 4 items)" in text
+    assert f"{unknown}: failed" in text
+    assert text.splitlines()[-1].startswith("1 of 3 workspaces drifted, 1 failed")
+
+
+def test_local_model_without_workspace_copy(client, workspace_id, deployed, tmp_path):
+    make_model(tmp_path, "Local")
+
+    report = client.scan_drift([workspace_id], str(tmp_path))
+
+    item = report["workspaces"][workspace_id]["items"]["Local.SemanticModel"]
+    assert (item["status"], item["itemId"]) == ("missing", None)
+
+
+def test_scan_drift_resolves_the_token_per_request(client, simulator, workspace_id, deployed, tmp_path):
+    client.token_manager = CountingTokens()
+    logged = len(simulator.state.log)
+
+    client.scan_drift([workspace_id], str(tmp_path))
+
+    # An operation result is fetched with the headers of its last poll
+    tokens = [authorization for _, path, authorization in simulator.state.log[logged:] if not path.endswith("/result")]
+    assert len(tokens) >= 2
+    assert len(set(tokens)) == len(tokens)
@@ -0,0 +1,126 @@
+import json
+
+from msfabric_devops import FabricClient
+from msfabric_devops.instrumentation import (
+    HISTOGRAM_BOUNDS,
+    Instrumentation,
+    JsonLinesSink,
+    LatencyHistogram,
+    MemorySink,
+    RequestRecord,
+    endpoint_template,
+)
+
+from .fabric_simulator import FabricSimulator
+from .samples import make_model
+
+
+def test_endpoint_template_replaces_ids():
+    url = "https://api.fabric.microsoft.com/v1/workspaces/3F2504E0-4F89-11D3-9A0C-0305E82C3301/items/?continuationToken=x"
+
+    assert endpoint_template(url) == "/v1/workspaces/{id}/items"
+
+
+def test_histogram_percentiles_are_bucket_bounds():
+    histogram = LatencyHistogram()
+    for seconds in [0.003] * 90 + [0.4] * 9 + [400.0]:
+        histogram.record(seconds)
+
+    snapshot = histogram.snapshot()
+    assert (snapshot["count"], snapshot["max"]) == (100, 400.0)
+    assert snapshot["p50"] == 0.005
+    assert snapshot["p90"] == 0.005
+    assert snapshot["p99"] == 0.5
+    assert histogram.percentile(1.0) == 400.0
+    assert HISTOGRAM_BOUNDS[-1] < 400.0
+
+
+def test_disabled_by_default(client, workspace_id):
+    client.get_workspaces()
+
+    assert client.instrumentation.metrics()["requests"] == 0
+
+
+def test_records_every_request(client, simulator, workspace_id):
+    sink = MemorySink()
+    client.instrumentation.add_sink(sink)
+    first = len(simulator.state.log)
+
+    client.get_items(workspace_id)
+
+    records = list(sink.records)
+    assert len(records) == len(simulator.state.log) - first
+    assert [(record.kind, record.method, record.endpoint, record.status) for record in records] == [
+        ("request", "GET", "/v1/workspaces/{id}/items", 200),
+    ]
+    assert records[0].bytes_received > 0
+    assert records[0].family == "items"
+    assert client.instrumentation.histogram("GET", "/v1/workspaces/{id}/items").count == 1
+
+
+def test_hooks_see_every_send(client, workspace_id):
+    sent, received = [], []
+    client.instrumentation.add_hook(
+        before=lambda method, url, headers: sent.append((method, headers.setdefault("x-ms-correlation-id", "run-1"))),
+        after=received.append,
+    )
+
+    client.get_workspaces()
+    client.get_items(workspace_id)
+
+    assert sent == [("GET", "run-1"), ("GET", "run-1")]
+    assert [record.status for record in received] == [200, 200]
+
+
+def test_operation_waits_are_recorded(client, simulator, workspace_id, tmp_path):
+    simulator.lro_seconds = 0.1
+    simulator.poll_after = 0.02
+    client.instrumentation.enable()
+
+    client.import_item(workspace_id, str(make_model(tmp_path, "Sales")))
+
+    metrics = client.instrumentation.metrics()
+    assert metrics["lro_wait_seconds"] >= 0.1
+    assert "lro_wait" in metrics["endpoints"]["POST /v1/workspaces/{id}/items"]
+    assert client.instrumentation.report()[0]["endpoint"] == "POST /v1/workspaces/{id}/items"
+
+
+def test_throttle_pauses_are_counted():
+    with FabricSimulator(poll_after=0, rate_limit=(50.0, 2)) as simulator:
+        client = simulator.attach(FabricClient(workspace_cache_ttl=0, rate_limits={"workspaces": (1000.0, 1000)}))
+        client.instrumentation.enable()
+        try:
+            for _ in range(10):
+                client.get_workspaces()
+        finally:
+            client.close()
+
+    metrics = client.instrumentation.metrics()
+    assert metrics["throttled"] == simulator.state.throttled > 0
+    assert metrics["requests"] == 10 + metrics["throttled"]
+    assert metrics["throttle_wait_seconds"] > 0
+
+
+def test_json_lines_sink(tmp_path):
+    path = tmp_path / "requests.jsonl"
+    sink = JsonLinesSink(str(path))
+    instrumentation = Instrumentation(sinks=[sink])
+
+    instrumentation.emit(RequestRecord("request", "get", "https://host/v1/workspaces", 0.0, 0.25, status=200))
+    instrumentation.event("retry", "GET", "https://host/v1/workspaces", 0.5, attempt=1)
+    sink.close()
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [(line["kind"], line["method"], line["duration"]) for line in lines] == [("request", "GET", 0.25), ("retry", "GET", 0.5)]
+    assert lines[1]["attributes"] == {"attempt": 1}
+    assert instrumentation.metrics()["retry_wait_seconds"] == 0.5
+
+
+def test_reset_clears_counters():
+    instrumentation = Instrumentation(enabled=True)
+    instrumentation.emit(RequestRecord("request", "GET", "https://host/v1/workspaces", 0.0, 0.1, status=500, error="HTTPError"))
+
+    assert instrumentation.metrics()["errors"] == 1
+    instrumentation.reset()
+    metrics = instrumentation.metrics()
+    assert (metrics["requests"], metrics["errors"], metrics["endpoints"]) == (0, 0, {})
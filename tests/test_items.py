@@ -0,0 +1,153 @@
+import base64
+import json
+from pathlib import Path
+
+import pytest
+
+from msfabric_devops import config
+from msfabric_devops.exceptions import FabricError
+from msfabric_devops.items import _write_definition_part, build_item_parts, list_item_files, part_payload_bytes
+
+from .samples import make_model, make_report
+
+
+def published_part(simulator, item_id, path) -> dict:
+    return next(part for part in simulator.state.definitions[item_id] if part["path"] == path)
+
+
+def rewrite_published(simulator, item_id, path, data: bytes) -> None:
+    published_part(simulator, item_id, path)["payload"] = base64.b64encode(data).decode()
+
+
+def update_requests(simulator, item_id) -> int:
+    return sum(1 for _, path, _ in simulator.state.log if path.endswith(f"/items/{item_id}/updateDefinition"))
+
+
+def test_list_item_files_is_sorted_and_skips_local_files(tmp_path):
+    model = make_model(tmp_path, "Sales")
+    (model / "item.metadata.json").write_text("{}", encoding="utf-8")
+    (model / "cache.abf").write_bytes(b"\0")
+    (model / ".pbi").mkdir()
+    (model / ".pbi" / "localSettings.json").write_text("{}", encoding="utf-8")
+
+    paths = [file.relative_to(model).as_posix() for file in list_item_files(model)]
+
+    assert paths == sorted(paths)
+    assert paths == [".platform", "definition.pbism", "definition/model.tmdl", "definition/tables/Table0.tmdl", "definition/tables/Table1.tmdl"]
+
+
+def test_parallel_parts_match_sequential_parts(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "PART_BATCH_SIZE", 3)
+    model = make_model(tmp_path, "Sales", tables=20)
+    files = list_item_files(model)
+
+    sequential = build_item_parts(model, files, max_workers=1)
+    parallel = build_item_parts(model, files, max_workers=4)
+
+    assert parallel == sequential
+    assert [part["Path"] for part in parallel] == [file.relative_to(model).as_posix() for file in files]
+    assert base64.b64decode(parallel[2]["Payload"]) == (model / "definition" / "model.tmdl").read_bytes()
+
+
+def test_report_parts_are_rebound_to_the_semantic_model(tmp_path):
+    report = make_report(tmp_path, "Sales", make_model(tmp_path, "Sales"))
+
+    parts = build_item_parts(report, list_item_files(report), semantic_model_id="model-id", max_workers=2)
+
+    pbir = json.loads(part_payload_bytes(next(part for part in parts if part["Path"] == "definition.pbir")))
+    assert pbir["datasetReference"]["byPath"] is None
+    assert pbir["datasetReference"]["byConnection"] == {"connectionString": "semanticmodelid=model-id"}
+
+
+def test_lazy_parts_keep_files_on_disk(tmp_path):
+    model = make_model(tmp_path, "Sales")
+    files = list_item_files(model)
+
+    parts = build_item_parts(model, files, lazy=True)
+
+    assert all(isinstance(part["Payload"], Path) for part in parts)
+    assert [part_payload_bytes(part) for part in parts] == [file.read_bytes() for file in files]
+
+
+def test_export_writes_changed_parts_only(client, workspace_id, tmp_path):
+    model = make_model(tmp_path / "repository", "Sales")
+    item_id = client.import_item(workspace_id, str(model))["id"]
+    output_dir = tmp_path / "export"
+
+    first = client.export_item_definition(workspace_id, item_id, str(output_dir))
+    (output_dir / "definition" / "model.tmdl").write_text("model Edited\n", encoding="utf-8")
+    second = client.export_item_definition(workspace_id, item_id, str(output_dir))
+
+    assert first["written"] == 5
+    assert (second["written"], second["unchanged"]) == (1, 4)
+    assert {part["path"]: part["status"] for part in second["parts"]}["definition/model.tmdl"] == "written"
+    for file in list_item_files(model):
+        assert (output_dir / file.relative_to(model)).read_bytes() == file.read_bytes()
+
+
+def test_definition_by_id_returns_the_raw_response(client, workspace_id, tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "print_color", lambda *args, **kwargs: None)
+    model = make_model(tmp_path, "Sales")
+    item_id = client.import_item(workspace_id, str(model))["id"]
+    output_dir = tmp_path / "export"
+
+    response = client.get_item_definition_by_id(workspace_id, item_id, str(output_dir))
+    definition = client.get_item_definition(workspace_id, item_id)
+
+    assert json.loads(json.dumps(response)) == response
+    assert sorted(part["path"] for part in response["definition"]["parts"]) == sorted(definition.paths())
+    response["definition"]["parts"].append({"path": "extra.tmdl", "payload": "", "payloadType": "InlineBase64"})
+    assert response["definition"]["parts"][-1]["path"] == "extra.tmdl"
+    assert (output_dir / "definition" / "model.tmdl").read_bytes() == definition["definition/model.tmdl"].data
+
+
+def test_export_refuses_paths_outside_the_output_directory(tmp_path):
+    part = {"path": "../escaped.tmdl", "payload": base64.b64encode(b"x").decode(), "payloadType": "InlineBase64"}
+
+    with pytest.raises(FabricError, match="outside"):
+        _write_definition_part(tmp_path.resolve(), part)
+    assert not (tmp_path.parent / "escaped.tmdl").exists()
+
+
+def test_incremental_import_ignores_service_noise_in_the_published_definition(client, simulator, workspace_id, tmp_path):
+    model = make_model(tmp_path, "Sales")
+    item_id = client.import_item(workspace_id, str(model))["id"]
+    # What the service hands back: a rewritten .platform, a BOM and CRLF line endings
+    rewrite_published(simulator, item_id, ".platform", json.dumps({
+        "$schema": "https://developer.microsoft.com/json-schemas/fabric/gitIntegration/platformProperties/2.0.0/schema.json",
+        "metadata": {"type": "SemanticModel", "displayName": "Sales"},
+        "config": {"version": "2.0", "logicalId": "00000000-0000-0000-0000-000000000000"},
+    }).encode())
+    local_tmdl = (model / "definition" / "model.tmdl").read_bytes()
+    rewrite_published(simulator, item_id, "definition/model.tmdl", b"\xef\xbb\xbf" + local_tmdl.replace(b"\n", b"\r\n"))
+
+    result = client.import_item(workspace_id, str(model), incremental=True)
+
+    assert result["changedParts"] == []
+    assert update_requests(simulator, item_id) == 0
+
+
+def test_incremental_import_updates_changed_parts(client, simulator, workspace_id, tmp_path):
+    model = make_model(tmp_path, "Sales")
+    item_id = client.import_item(workspace_id, str(model))["id"]
+    (model / "definition" / "tables" / "Table1.tmdl").write_text("table Table1\n\tcolumn Added\n", encoding="utf-8")
+
+    result = client.import_item(workspace_id, str(model), incremental=True)
+
+    assert result["changedParts"] == ["definition/tables/Table1.tmdl"]
+    assert update_requests(simulator, item_id) == 1
+
+
+def test_incremental_import_detects_report_rebinding(client, simulator, workspace_id, tmp_path):
+    report = make_report(tmp_path, "Sales", make_model(tmp_path, "Sales"))
+    item_id = client.import_item(workspace_id, str(report), item_properties={"semanticModelId": "model-a"})["id"]
+    # Same binding, formatted differently by the service
+    pbir = json.loads(base64.b64decode(published_part(simulator, item_id, "definition.pbir")["payload"]))
+    rewrite_published(simulator, item_id, "definition.pbir", json.dumps(pbir, separators=(",", ":")).encode())
+
+    unchanged = client.import_item(workspace_id, str(report), item_properties={"semanticModelId": "model-a"}, incremental=True)
+    rebound = client.import_item(workspace_id, str(report), item_properties={"semanticModelId": "model-b"}, incremental=True)
+
+    assert unchanged["changedParts"] == []
+    assert rebound["changedParts"] == ["definition.pbir"]
+    assert update_requests(simulator, item_id) == 1
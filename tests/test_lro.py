@@ -0,0 +1,116 @@
+import itertools
+import threading
+
+import pytest
+import requests
+
+from msfabric_devops.api import invoke_fabric_api_request
+from msfabric_devops.exceptions import FabricError
+from msfabric_devops.lro import LongRunningOperation, OperationPoller
+
+
+class CountingTokens:
+    """Token manager stand-in returning a new token on every call."""
+
+    def __init__(self) -> None:
+        self._counter = itertools.count(1)
+
+    def get_token(self) -> str:
+        return f"token-{next(self._counter)}"
+
+
+def start_operation(client, workspace_id, name, token="simulator", poller=None):
+    return invoke_fabric_api_request(
+        f"workspaces/{workspace_id}/items",
+        token,
+        method="POST",
+        body={"displayName": name, "type": "Notebook", "definition": {"parts": []}},
+        session=client.session,
+        poller=poller,
+    )
+
+
+def poll_tokens(simulator) -> list[str]:
+    return [
+        authorization for _, path, authorization in simulator.state.log
+        if path.startswith("operations/") and not path.endswith("/result")
+    ]
+
+
+def test_poller_resolves_operation(client, workspace_id):
+    operation = start_operation(client, workspace_id, "Polled", poller=client.poller)
+
+    assert isinstance(operation, LongRunningOperation)
+    assert operation.result(timeout=5)["displayName"] == "Polled"
+    assert operation.status == "succeeded"
+
+
+def test_then_runs_off_the_poller_thread(client, workspace_id):
+    operation = start_operation(client, workspace_id, "Chained", poller=client.poller)
+
+    thread_name = operation.then(lambda _: threading.current_thread().name).result(timeout=5)
+
+    assert thread_name.startswith("msfabric-lro-callback")
+
+
+def test_slow_callback_does_not_delay_other_operations(client, workspace_id):
+    release = threading.Event()
+    first = start_operation(client, workspace_id, "Slow", poller=client.poller)
+    blocked = first.then(lambda _: release.wait(10))
+    try:
+        second = start_operation(client, workspace_id, "Fast", poller=client.poller)
+        assert second.result(timeout=5)["displayName"] == "Fast"
+        assert not blocked.done()
+    finally:
+        release.set()
+    assert blocked.result(timeout=5) is True
+
+
+def test_poller_reads_the_token_on_every_poll(client, simulator, workspace_id):
+    simulator.lro_seconds = 0.2
+    simulator.poll_after = 0.02
+    client.token_manager = CountingTokens()
+
+    start_operation(client, workspace_id, "Refreshed", poller=client.poller).result(timeout=5)
+
+    tokens = poll_tokens(simulator)
+    assert len(tokens) > 2
+    assert len(set(tokens)) == len(tokens)
+
+
+def test_blocking_wait_reads_the_token_on_every_poll(client, simulator, workspace_id, capsys):
+    simulator.lro_seconds = 0.2
+    simulator.poll_after = 0.02
+
+    result = start_operation(client, workspace_id, "Blocking", token=CountingTokens().get_token)
+
+    assert result["displayName"] == "Blocking"
+    tokens = poll_tokens(simulator)
+    assert len(tokens) > 2
+    assert len(set(tokens)) == len(tokens)
+    assert capsys.readouterr().out == ""
+
+
+def test_request_errors_are_raised_as_fabric_errors():
+    response = requests.Response()
+    response.headers["Location"] = "http://127.0.0.1:9/v1/operations/unreachable"
+    response.headers["Retry-After"] = "0"
+    poller = OperationPoller()
+    try:
+        operation = poller.submit(response, {"Authorization": "Bearer token"})
+        with pytest.raises(FabricError) as error:
+            operation.result(timeout=10)
+    finally:
+        poller.close()
+
+    assert isinstance(error.value.__cause__, requests.ConnectionError)
+
+
+def test_close_fails_pending_operations(client, simulator, workspace_id):
+    simulator.lro_seconds = 60
+
+    operation = start_operation(client, workspace_id, "Pending", poller=client.poller)
+    client.poller.close()
+
+    with pytest.raises(FabricError, match="closed"):
+        operation.result(timeout=5)
@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import msfabric_devops
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def loaded_modules(code: str) -> set[str]:
+    """Run *code* in a fresh interpreter and return the modules it imported."""
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    output = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    return set(output.split())
+
+
+@pytest.mark.parametrize("code", [
+    "import msfabric_devops",
+    "from msfabric_devops import set_semantic_model_parameters",
+    "from msfabric_devops import DefinitionPart, ItemDefinition",
+])
+def test_offline_entry_points_load_no_network_dependencies(code):
+    modules = loaded_modules(code)
+
+    assert "requests" not in modules
+    assert "azure.identity" not in modules
+
+
+def test_client_defers_azure_identity_to_the_first_credential():
+    modules = loaded_modules("from msfabric_devops import FabricClient, TokenManager")
+
+    assert "msfabric_devops.client" in modules
+    assert "azure.identity" not in modules
+
+
+def test_every_public_name_resolves():
+    for name in msfabric_devops.__all__:
+        assert getattr(msfabric_devops, name) is not None, name
+
+
+def test_lazy_attributes_are_all_exported():
+    assert set(msfabric_devops._LAZY_ATTRIBUTES) <= set(msfabric_devops.__all__)
+    assert set(msfabric_devops.__all__) <= set(dir(msfabric_devops))
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        msfabric_devops.missing
@@ -0,0 +1,222 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from msfabric_devops import api
+from msfabric_devops.exceptions import FabricError
+from msfabric_devops.retry import RetryPolicy
+
+# Seconds the stub stalls a "slow" answer, well above READ_TIMEOUT
+STALL = 1.0
+READ_TIMEOUT = 0.2
+
+
+class FaultServer:
+    """
+    Local HTTP stub that fails the first requests of a path in a given way.
+
+    ``inject(uri, fault, count)`` makes the next *count* requests to *uri*
+    fail with *fault*: an HTTP status (``503``), ``"reset"`` (connection
+    dropped without an answer) or ``"slow"`` (answered after ``STALL``
+    seconds). Later requests succeed. ``hits[uri]`` counts every request
+    received.
+    """
+
+    def __init__(self) -> None:
+        self.faults: dict[str, list] = {}
+        self.hits: dict[str, int] = {}
+        self.lock = threading.Lock()
+        handler = type("Handler", (_FaultHandler,), {"server_state": self})
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.server.daemon_threads = True
+        self.api_url = f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+
+    def inject(self, uri: str, fault: int | str, count: int, retry_after: str | None = None) -> None:
+        self.faults[f"/v1/{uri}"] = [fault, count, retry_after]
+
+    def next_fault(self, path: str) -> tuple[int | str | None, str | None]:
+        with self.lock:
+            uri = path[len("/v1/"):]
+            self.hits[uri] = self.hits.get(uri, 0) + 1
+            entry = self.faults.get(path)
+            if not entry or not entry[1]:
+                return None, None
+            entry[1] -= 1
+            return entry[0], entry[2]
+
+
+class _FaultHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_state: FaultServer
+
+    def handle_any(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        fault, retry_after = self.server_state.next_fault(self.path.split("?")[0])
+
+        if fault == "reset":
+            self.close_connection = True
+            self.connection.close()
+            return
+        if fault == "slow":
+            time.sleep(STALL)
+        if isinstance(fault, int):
+            self.reply(fault, {"errorCode": "Injected", "message": "injected"},
+                       {"Retry-After": retry_after} if retry_after else {})
+            return
+        self.reply(200, {"id": "1", "displayName": "stub"})
+
+    do_GET = do_POST = do_DELETE = handle_any
+
+    def reply(self, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client timed out and went away
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def faults():
+    server = FaultServer()
+    thread = threading.Thread(target=server.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.server.shutdown()
+    server.server.server_close()
+
+
+@pytest.fixture
+def policy():
+    return RetryPolicy(max_attempts=4, base_delay=0.01, max_delay=0.05, deadline=10)
+
+
+def send(faults, policy, method, uri, timeout_sec=5):
+    session = api.FabricSession(retry_policy=policy)
+    try:
+        return api.invoke_fabric_api_request(
+            uri, token="stub", method=method, body={}, api_url=faults.api_url,
+            session=session, timeout_sec=timeout_sec,
+        )
+    finally:
+        session.close()
+
+
+@pytest.mark.parametrize("status", [408, 500, 502, 503, 504])
+def test_transient_statuses_are_retried(faults, policy, status):
+    faults.inject("workspaces/w", status, 2)
+
+    assert send(faults, policy, "GET", "workspaces/w")["id"] == "1"
+    assert faults.hits["workspaces/w"] == 3
+
+
+@pytest.mark.parametrize("status", [400, 401, 403, 404, 409])
+def test_final_statuses_are_not_retried(faults, policy, status):
+    faults.inject("workspaces/w", status, 1)
+
+    with pytest.raises(FabricError):
+        send(faults, policy, "GET", "workspaces/w")
+    assert faults.hits["workspaces/w"] == 1
+
+
+def test_retries_stop_after_max_attempts(faults, policy):
+    faults.inject("workspaces/w", 503, 10)
+
+    with pytest.raises(FabricError):
+        send(faults, policy, "GET", "workspaces/w")
+    assert faults.hits["workspaces/w"] == policy.max_attempts
+
+
+def test_no_policy_sends_once(faults):
+    faults.inject("workspaces/w", 503, 1)
+
+    with pytest.raises(FabricError):
+        send(faults, None, "GET", "workspaces/w")
+    assert faults.hits["workspaces/w"] == 1
+
+
+def test_retry_after_is_honoured(faults, policy):
+    faults.inject("workspaces/w", 503, 2, retry_after="0.3")
+
+    started = time.monotonic()
+    send(faults, policy, "GET", "workspaces/w")
+
+    assert time.monotonic() - started >= 0.6
+    assert faults.hits["workspaces/w"] == 3
+
+
+def test_dropped_connections_are_retried(faults, policy):
+    faults.inject("workspaces/w", "reset", 2)
+
+    assert send(faults, policy, "GET", "workspaces/w")["id"] == "1"
+    assert faults.hits["workspaces/w"] == 3
+
+
+@pytest.mark.parametrize("uri", [
+    "workspaces/w/items/1/getDefinition",
+    "workspaces/w/items/1/updateDefinition",
+])
+def test_definition_actions_are_retried_after_a_read_timeout(faults, policy, uri):
+    faults.inject(uri, "slow", 1)
+
+    assert send(faults, policy, "POST", uri, timeout_sec=READ_TIMEOUT)["id"] == "1"
+    assert faults.hits[uri] == 2
+
+
+@pytest.mark.parametrize("uri", ["workspaces/w/items", "workspaces/w/semanticModels", "workspaces"])
+def test_creations_are_never_retried_after_a_read_timeout(faults, policy, uri):
+    faults.inject(uri, "slow", 1)
+
+    with pytest.raises(FabricError):
+        send(faults, policy, "POST", uri, timeout_sec=READ_TIMEOUT)
+    assert faults.hits[uri] == 1
+
+
+def test_creations_are_not_retried_after_a_transient_status(faults, policy):
+    faults.inject("workspaces/w/items", 503, 1)
+
+    with pytest.raises(FabricError):
+        send(faults, policy, "POST", "workspaces/w/items")
+    assert faults.hits["workspaces/w/items"] == 1
+
+
+def test_connect_timeouts_are_retried_for_any_method(policy):
+    url = "https://api.fabric.microsoft.com/v1/workspaces/w/items"
+
+    assert policy.is_retryable("POST", url, exception=requests.exceptions.ConnectTimeout())
+    assert not policy.is_retryable("POST", url, exception=requests.exceptions.ReadTimeout())
+
+
+def test_backoff_is_jittered_within_bounds():
+    policy = RetryPolicy(max_attempts=100, base_delay=0.1, max_delay=1.0, deadline=1000)
+    url = "https://api.fabric.microsoft.com/v1/workspaces"
+    error = requests.exceptions.ConnectionError()
+
+    previous = None
+    for attempt in range(1, 50):
+        delay = policy.retry_delay("GET", url, attempt, 0.0, previous, exception=error)
+        assert 0.1 <= delay <= min(1.0, max(0.1, (previous or 0.1) * 3))
+        previous = delay
+
+
+def test_deadline_stops_retries():
+    policy = RetryPolicy(max_attempts=100, base_delay=1.0, max_delay=1.0, deadline=10)
+    url = "https://api.fabric.microsoft.com/v1/workspaces"
+    error = requests.exceptions.ConnectionError()
+
+    assert policy.retry_delay("GET", url, 1, 8.5, exception=error) == 1.0
+    assert policy.retry_delay("GET", url, 1, 9.5, exception=error) is None
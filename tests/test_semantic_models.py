@@ -0,0 +1,109 @@
+import json
+
+import pytest
+
+from msfabric_devops import set_semantic_model_parameters, set_semantic_model_parameters_many
+
+from .samples import make_model
+from .test_tmdl import EXPRESSIONS
+
+
+@pytest.fixture
+def tmdl_model(tmp_path):
+    (tmp_path / "definition").mkdir()
+    (tmp_path / "definition" / "expressions.tmdl").write_bytes(EXPRESSIONS.encode("utf-8"))
+    return tmp_path
+
+
+@pytest.fixture
+def tmsl_model(tmp_path):
+    model = {"model": {"expressions": [
+        {"name": "Server", "kind": "m", "expression": '"dev" meta [IsParameterQuery=true, Type="Text", IsParameterQueryRequired=true]'},
+        {"name": "Database", "kind": "m", "expression": ['"sales_dev"', '    meta [IsParameterQuery=true, Type="Text", IsParameterQueryRequired=true]']},
+        {"name": "StartDate", "kind": "m", "expression": '#date(2024, 1, 1) meta [IsParameterQuery=true, Type="Date", IsParameterQueryRequired=true]'},
+    ]}}
+    (tmp_path / "model.bim").write_text(json.dumps(model), encoding="utf-8")
+    return tmp_path
+
+
+def read_expressions(model) -> str:
+    return (model / "definition" / "expressions.tmdl").read_bytes().decode("utf-8")
+
+
+def test_tmdl_parameters_are_set_in_place(tmdl_model):
+    set_semantic_model_parameters(str(tmdl_model), {"Server": "prod.example.com", "Database": "sales_prod"})
+
+    assert read_expressions(tmdl_model) == (
+        EXPRESSIONS.replace('"dev.example.com"', '"prod.example.com"').replace('"sales_dev"', '"sales_prod"')
+    )
+
+
+def test_tmdl_non_text_parameter_is_refused_and_nothing_is_written(tmdl_model):
+    with pytest.raises(ValueError, match="StartDate"):
+        set_semantic_model_parameters(str(tmdl_model), {"Server": "prod.example.com", "StartDate": "2025-01-01"})
+
+    assert read_expressions(tmdl_model) == EXPRESSIONS
+
+
+def test_tmdl_missing_parameter(tmdl_model):
+    with pytest.raises(ValueError, match="Missing"):
+        set_semantic_model_parameters(str(tmdl_model), {"Missing": "x"}, fail_if_not_found=True)
+
+    set_semantic_model_parameters(str(tmdl_model), {"Missing": "x"})
+    assert read_expressions(tmdl_model) == EXPRESSIONS
+
+
+def test_tmsl_parameters_are_set(tmsl_model):
+    set_semantic_model_parameters(str(tmsl_model), {"Server": "prod", "Database": "sales_prod"})
+
+    expressions = json.loads((tmsl_model / "model.bim").read_text(encoding="utf-8"))["model"]["expressions"]
+    assert expressions[0]["expression"].startswith('"prod" meta [')
+    assert expressions[1]["expression"] == ['"sales_prod"', '    meta [IsParameterQuery=true, Type="Text", IsParameterQueryRequired=true]']
+
+
+def test_tmsl_non_text_parameter_is_refused(tmsl_model):
+    original = (tmsl_model / "model.bim").read_text(encoding="utf-8")
+
+    with pytest.raises(ValueError, match="StartDate"):
+        set_semantic_model_parameters(str(tmsl_model), {"StartDate": "2025-01-01"})
+
+    assert (tmsl_model / "model.bim").read_text(encoding="utf-8") == original
+
+
+def test_many_parameters_in_one_pass(tmp_path):
+    parameters = {f"Param{i}": f"dev{i}" for i in range(200)}
+    model = make_model(tmp_path, "Sales", parameters=parameters)
+
+    set_semantic_model_parameters(str(model), {name: value.replace("dev", "prod") for name, value in parameters.items()})
+
+    text = (model / "definition" / "expressions.tmdl").read_text(encoding="utf-8")
+    assert '"dev' not in text
+    assert all(f'expression Param{i} = "prod{i}" meta' in text for i in range(200))
+
+
+def test_many_models_report_failures_per_model(tmp_path):
+    models = [make_model(tmp_path, f"Model{i}", parameters={"Server": "dev"}) for i in range(4)]
+    broken = tmp_path / "Broken.SemanticModel"
+    broken.mkdir()
+    paths = [str(model) for model in models] + [str(broken)]
+
+    results = set_semantic_model_parameters_many(paths, {"Server": "prod"}, max_workers=3)
+
+    assert [results[str(model)] for model in models] == [None] * 4
+    assert isinstance(results[str(broken)], FileNotFoundError)
+    for model in models:
+        assert '"prod"' in (model / "definition" / "expressions.tmdl").read_text(encoding="utf-8")
+
+
+def test_many_models_print_one_line_per_model_in_order(tmp_path, capsys):
+    models = [make_model(tmp_path, f"Model{i}", parameters={"Server": "dev"}) for i in range(6)]
+    paths = [str(model) for model in models] + [str(tmp_path / "Missing.SemanticModel")]
+
+    set_semantic_model_parameters_many(paths, {"Server": "prod", "Other": "x"}, max_workers=4)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == len(paths)
+    for path, line in zip(paths, lines):
+        assert path in line
+    assert "not found: Other" in lines[0]
+    assert "failed" in lines[-1]
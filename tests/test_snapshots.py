@@ -0,0 +1,139 @@
+import os
+import threading
+import time
+
+from msfabric_devops import SnapshotStore
+from msfabric_devops.definitions import ItemDefinition
+
+from .samples import make_model
+from .test_lro import CountingTokens
+
+
+def definition(**parts: bytes) -> ItemDefinition:
+    item = ItemDefinition(format="TMDL")
+    for path, data in parts.items():
+        item.set(f"definition/{path}.tmdl", data)
+    return item
+
+
+def blobs(store: SnapshotStore) -> list:
+    return [path for path in store.objects.glob("*/*") if not path.name.startswith(".tmp-")]
+
+
+def test_parts_are_stored_once_across_items_and_snapshots(tmp_path):
+    store = SnapshotStore(str(tmp_path / "store"))
+
+    first = store.save(definition(model=b"model", table=b"table"), "ws", "a")
+    second = store.save(definition(model=b"model", table=b"table"), "ws", "b")
+    third = store.save(definition(model=b"model", table=b"changed"), "ws", "a")
+
+    assert (first["newBytes"], second["newBytes"], third["newBytes"]) == (10, 0, 7)
+    assert first["changedParts"] == ["definition/model.tmdl", "definition/table.tmdl"]
+    assert second["changedParts"] == ["definition/model.tmdl", "definition/table.tmdl"]
+    assert third["changedParts"] == ["definition/table.tmdl"]
+    assert len(blobs(store)) == 3
+    assert store.list_snapshots("ws", "a") == [first["id"], third["id"]]
+    assert store.latest("ws", "a") == third
+
+
+def test_restore_writes_changed_files_only(tmp_path):
+    store = SnapshotStore(str(tmp_path / "store"))
+    snapshot = store.save(definition(model=b"model", table=b"table"), "ws", "a")
+    output = tmp_path / "restore"
+
+    first = store.restore(snapshot["id"], str(output))
+    (output / "definition" / "table.tmdl").write_bytes(b"edited")
+    second = store.restore(snapshot["id"], str(output), link=True)
+
+    assert (first["written"], first["unchanged"]) == (2, 0)
+    assert (second["written"], second["unchanged"]) == (1, 1)
+    assert (output / "definition" / "table.tmdl").read_bytes() == b"table"
+    assert store.definition(snapshot["id"])["definition/model.tmdl"].data == b"model"
+
+
+def test_gc_removes_unreferenced_blobs_only(tmp_path):
+    store = SnapshotStore(str(tmp_path / "store"))
+    kept = store.save(definition(model=b"model", table=b"table"), "ws", "a")
+    dropped = store.save(definition(model=b"model", table=b"other"), "ws", "a")
+    store.delete(dropped["id"])
+    tmp_file = store.objects / "00" / ".tmp-writer"
+    tmp_file.parent.mkdir()
+    tmp_file.write_bytes(b"in progress")
+
+    assert store.gc()["removed"] == 0
+    assert store.gc(grace=0) == {"removed": 1, "bytes": 5}
+    assert tmp_file.exists()
+    assert store.restore(kept["id"], str(tmp_path / "restore"))["written"] == 2
+
+
+def test_gc_keeps_blobs_reused_by_a_recent_save(tmp_path):
+    store = SnapshotStore(str(tmp_path / "store"))
+    old = store.save(definition(model=b"model"), "ws", "a")
+    store.delete(old["id"])
+    digest = old["parts"]["definition/model.tmdl"]
+    os.utime(store.blob_path(digest), (time.time() - 7200, time.time() - 7200))
+
+    # Another process reused the blob but has not written its manifest yet
+    assert store.put_blob(b"model") == (digest, False)
+
+    assert store.gc(grace=3600)["removed"] == 0
+
+
+def test_gc_never_removes_blobs_of_concurrent_saves(tmp_path):
+    store = SnapshotStore(str(tmp_path / "store"))
+    stop = threading.Event()
+    collected = []
+
+    def collect():
+        while not stop.is_set():
+            collected.append(store.gc(grace=0)["removed"])
+
+    collector = threading.Thread(target=collect)
+    collector.start()
+    try:
+        for i in range(30):
+            snapshot = store.save(definition(model=f"model {i}".encode(), table=b"table"), "ws", f"item{i % 3}")
+            if i % 2:
+                store.delete(snapshot["id"])
+    finally:
+        stop.set()
+        collector.join()
+
+    assert collected
+    for snapshot in store.list_snapshots():
+        for digest in store.load(snapshot)["parts"].values():
+            assert store.has_blob(digest)
+    assert sum(collected) + store.gc(grace=0)["removed"] == 15
+
+
+def test_snapshot_workspace_and_import(client, simulator, workspace_id, tmp_path):
+    store = SnapshotStore(str(tmp_path / "store"))
+    model = make_model(tmp_path, "Sales")
+    item_id = client.import_item(workspace_id, str(model))["id"]
+
+    results = client.snapshot_workspace(workspace_id, store)
+    again = client.snapshot_workspace(workspace_id, store)
+    snapshot_id = results[item_id]["snapshot"]["id"]
+    target = client.create_workspace("restore")["id"]
+    imported = client.import_snapshot(target, store, snapshot_id)
+
+    assert results[item_id]["status"] == "saved"
+    assert again[item_id]["snapshot"]["newBytes"] == 0
+    assert again[item_id]["snapshot"]["changedParts"] == []
+    assert sorted(part["path"] for part in simulator.state.definitions[imported["id"]]) == sorted(
+        store.load(snapshot_id)["parts"]
+    )
+
+
+def test_snapshot_workspace_resolves_the_token_per_request(client, simulator, workspace_id, tmp_path):
+    for name in ("Sales", "Finance"):
+        client.import_item(workspace_id, str(make_model(tmp_path, name)))
+    client.token_manager = CountingTokens()
+    logged = len(simulator.state.log)
+
+    client.snapshot_workspace(workspace_id, SnapshotStore(str(tmp_path / "store")))
+
+    # An operation result is fetched with the headers of its last poll
+    tokens = [authorization for _, path, authorization in simulator.state.log[logged:] if not path.endswith("/result")]
+    assert len(tokens) >= 3
+    assert len(set(tokens)) == len(tokens)
@@ -0,0 +1,131 @@
+import base64
+import json
+
+import pytest
+
+from msfabric_devops import ModelTemplate, config, set_semantic_model_parameters
+
+from .samples import make_model
+from .test_semantic_models import tmdl_model, tmsl_model  # noqa: F401
+from .test_lro import CountingTokens
+from .test_tmdl import EXPRESSIONS
+
+PROD = EXPRESSIONS.replace('"dev.example.com"', '"prod.example.com"').replace('"sales_dev"', '"sales_prod"')
+
+
+@pytest.fixture(autouse=True)
+def quiet(monkeypatch):
+    monkeypatch.setattr(config, "print_color", lambda *args, **kwargs: None)
+
+
+def rendered(definition) -> bytes:
+    return definition["definition/expressions.tmdl"].data
+
+
+def test_single_and_multi_line_parameters_are_rendered(tmdl_model):
+    template = ModelTemplate(str(tmdl_model))
+
+    definition = template.render({"Server": "prod.example.com", "Database": "sales_prod"})
+
+    assert rendered(definition) == PROD.encode("utf-8")
+
+
+def test_untouched_parameters_round_trip_byte_for_byte(tmdl_model):
+    template = ModelTemplate(str(tmdl_model))
+
+    database = template.render({"Database": "sales_prod"})
+    same = template.render({"Server": "dev.example.com"})
+    nothing = template.render({})
+
+    assert rendered(database) == EXPRESSIONS.replace('"sales_dev"', '"sales_prod"').encode("utf-8")
+    assert rendered(same) == rendered(nothing) == EXPRESSIONS.encode("utf-8")
+    assert same["definition/expressions.tmdl"].payload == template.definition["definition/expressions.tmdl"].payload
+
+
+def test_non_text_parameter_is_refused_and_template_is_unchanged(tmdl_model):
+    template = ModelTemplate(str(tmdl_model))
+
+    with pytest.raises(ValueError, match="StartDate"):
+        template.render({"Database": "sales_prod", "StartDate": "2025-01-01"})
+
+    assert rendered(template.render({})) == EXPRESSIONS.encode("utf-8")
+    assert rendered(template.render({"Server": "prod.example.com", "Database": "sales_prod"})) == PROD.encode("utf-8")
+
+
+def test_render_many_restores_the_template_between_environments(tmdl_model):
+    template = ModelTemplate(str(tmdl_model))
+
+    variants = template.render_many({
+        "prod": {"Server": "prod.example.com", "Database": "sales_prod"},
+        "test": {"Database": "sales_test"},
+    })
+
+    assert rendered(variants["prod"]) == PROD.encode("utf-8")
+    assert rendered(variants["test"]) == EXPRESSIONS.replace('"sales_dev"', '"sales_test"').encode("utf-8")
+
+
+def test_tmsl_parameters_are_rendered(tmsl_model):
+    template = ModelTemplate(str(tmsl_model))
+
+    definition = template.render({"Server": "prod", "Database": "sales_prod"})
+
+    expressions = json.loads(definition["model.bim"].text)["model"]["expressions"]
+    assert expressions[0]["expression"].startswith('"prod" meta [')
+    assert expressions[1]["expression"] == ['"sales_prod"', '    meta [IsParameterQuery=true, Type="Text", IsParameterQueryRequired=true]']
+    assert expressions[2] == json.loads(template.definition["model.bim"].text)["model"]["expressions"][2]
+
+
+def test_tmsl_non_text_and_unchanged_parameters(tmsl_model):
+    template = ModelTemplate(str(tmsl_model))
+    original = template.definition["model.bim"].data
+
+    with pytest.raises(ValueError, match="StartDate"):
+        template.render({"StartDate": "2025-01-01"})
+
+    assert template.render({"Server": "dev"})["model.bim"].data == original
+
+
+def test_deploy_template_to_many_environments(client, simulator, workspace_id, tmp_path):
+    template = ModelTemplate(str(make_model(tmp_path, "Sales", parameters={"Server": "dev", "Database": "sales_dev"})))
+    other = client.create_workspace("prod")["id"]
+
+    results = client.deploy_template(template, {
+        "test": {"workspaceId": workspace_id, "parameters": {"Server": "test"}},
+        "prod": {"workspaceId": other, "parameters": {"Server": "prod", "Database": "sales_prod"}},
+        "broken": {"workspaceId": other, "parameters": {"Missing": "x"}, "displayName": "Broken"},
+    }, fail_if_not_found=True)
+
+    assert [results[name]["status"] for name in ("test", "prod", "broken")] == ["deployed", "deployed", "failed"]
+    parts = {
+        part["path"]: base64.b64decode(part["payload"]).decode("utf-8")
+        for part in simulator.state.definitions[results["prod"]["result"]["id"]]
+    }
+    assert '"prod"' in parts["definition/expressions.tmdl"]
+    assert '"sales_prod"' in parts["definition/expressions.tmdl"]
+
+
+def test_deploy_template_resolves_the_token_per_request(client, simulator, workspace_id, tmp_path):
+    template = ModelTemplate(str(make_model(tmp_path, "Sales", parameters={"Server": "dev"})))
+    client.token_manager = CountingTokens()
+    logged = len(simulator.state.log)
+
+    client.deploy_template(template, {
+        "test": {"workspaceId": workspace_id, "parameters": {"Server": "test"}},
+        "prod": {"workspaceId": workspace_id, "parameters": {"Server": "prod"}, "displayName": "Sales prod"},
+    })
+
+    # An operation result is fetched with the headers of its last poll
+    tokens = [authorization for _, path, authorization in simulator.state.log[logged:] if not path.endswith("/result")]
+    assert len(tokens) >= 4
+    assert len(set(tokens)) == len(tokens)
+
+
+def test_template_and_local_models_render_the_same_parameter_file(tmdl_model, tmsl_model):
+    for model, path in ((tmdl_model, "definition/expressions.tmdl"), (tmsl_model, "model.bim")):
+        template = ModelTemplate(str(model))
+        parameters = {"Server": "prod", "Database": "sales_prod"}
+
+        definition = template.render(parameters)
+        set_semantic_model_parameters(str(model), parameters)
+
+        assert definition[path].data == (model / path).read_bytes()
@@ -0,0 +1,121 @@
+import time
+from email.utils import formatdate
+
+import pytest
+
+from msfabric_devops import FabricClient
+from msfabric_devops.throttling import RateLimiter, endpoint_family, parse_retry_after
+
+from .fabric_simulator import FabricSimulator
+
+API = "https://api.fabric.microsoft.com/v1"
+
+
+@pytest.mark.parametrize("method, path, family", [
+    ("GET", "/workspaces", "workspaces"),
+    ("GET", "/workspaces/w1/items", "items"),
+    ("DELETE", "/workspaces/w1/items/i1", "items"),
+    ("POST", "/workspaces/w1/items", "definitions"),
+    ("POST", "/workspaces/w1/items/i1/getDefinition", "definitions"),
+    ("POST", "/workspaces/w1/semanticModels/i1/updateDefinition", "definitions"),
+    ("GET", "/operations/o1", "operations"),
+    ("GET", "/operations/o1/result", "operations"),
+    ("GET", "/capacities", "default"),
+])
+def test_endpoint_family(method, path, family):
+    assert endpoint_family(method, API + path) == family
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, None),
+    ("", None),
+    ("5", 5.0),
+    ("0.25", 0.25),
+    ("-3", 0.0),
+    ("soon", None),
+])
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    assert 8 < parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+    assert parse_retry_after(formatdate(time.time() - 10, usegmt=True)) == 0.0
+
+
+def test_bucket_allows_a_burst_then_paces_requests():
+    limiter = RateLimiter({"items": (20.0, 2)})
+
+    waits = [limiter.acquire("items") for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert 0.03 < sum(waits) < 0.5
+    assert limiter.metrics()["families"]["items"]["requests"] == 4
+
+
+def test_unknown_families_use_the_default_budget():
+    limiter = RateLimiter({"default": (1.0, 1)})
+
+    limiter.acquire("capacities")
+
+    assert limiter.metrics()["families"]["capacities"]["rate"] == 1.0
+
+
+def test_throttle_pauses_every_family_and_halves_the_rate():
+    limiter = RateLimiter({"items": (100.0, 10), "workspaces": (100.0, 10)})
+
+    assert limiter.throttled("items", "0.2") == 0.2
+    waited = limiter.acquire("workspaces")
+
+    assert waited >= 0.15
+    families = limiter.metrics()["families"]
+    assert families["items"]["rate"] == 50.0
+    assert families["items"]["throttled"] == 1
+    assert families["workspaces"]["rate"] == 100.0
+
+
+def test_rate_recovers_after_successful_requests():
+    limiter = RateLimiter({"items": (32.0, 10)})
+    limiter.throttled("items", "0")
+
+    for _ in range(8):
+        limiter.succeeded("items")
+
+    assert limiter.metrics()["families"]["items"]["rate"] == 24.0
+    for _ in range(100):
+        limiter.succeeded("items")
+    assert limiter.metrics()["families"]["items"]["rate"] == 32.0
+
+
+def test_fallback_delay_doubles_per_attempt():
+    limiter = RateLimiter(fallback_delay=0.01)
+
+    assert [limiter.throttled("items", None, attempt) for attempt in range(3)] == [0.01, 0.02, 0.04]
+
+
+def test_client_rides_out_service_throttling():
+    with FabricSimulator(poll_after=0, rate_limit=(50.0, 5)) as simulator:
+        client = simulator.attach(FabricClient(workspace_cache_ttl=0, rate_limits={"default": (1000.0, 1000), "workspaces": (1000.0, 1000)}))
+        try:
+            client.create_workspace("throttled")
+            results = [client.get_workspaces() for _ in range(20)]
+        finally:
+            client.close()
+
+    assert [len(workspaces) for workspaces in results] == [1] * 20
+    assert simulator.state.throttled > 0
+    assert client.rate_limiter.metrics()["throttled"] == simulator.state.throttled
+
+
+@pytest.mark.parametrize("budget", [(0.0, 5), (-1.0, 5), (1.0, 0)])
+def test_invalid_budgets_are_refused(budget):
+    with pytest.raises(ValueError, match="items"):
+        RateLimiter({"items": budget})
+
+
+def test_budgets_changed_after_construction_are_checked():
+    limiter = RateLimiter()
+    limiter.budgets["items"] = (0.0, 5)
+
+    with pytest.raises(ValueError, match="items"):
+        limiter.acquire("items")
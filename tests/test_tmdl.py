@@ -0,0 +1,121 @@
+import pytest
+
+from msfabric_devops import tmdl
+
+TABLE = (
+    "/// Sales facts\n"
+    "table 'Sales Data'\n"
+    "\tlineageTag: 1\n"
+    "\n"
+    "\tmeasure Total = ```\n"
+    "\t\t\tVAR x = 1\n"
+    "\t\t\tcolumn y = 2\n"
+    "\t\t\t```\n"
+    "\n"
+    "\tcolumn Amount\n"
+    "\t\tdataType: double\n"
+    "\n"
+    "\tpartition 'Sales Data-1' = m\n"
+    "\t\tmode: import\n"
+    "\t\tsource =\n"
+    "\t\t\t\tlet\n"
+    "\t\t\t\t    partition x = 1\n"
+    "\t\t\t\tin\n"
+    "\t\t\t\t    x\n"
+    "\n"
+    "\tannotation PBI_ResultType = Table\n"
+)
+
+EXPRESSIONS = (
+    'expression Server = "dev.example.com" meta [IsParameterQuery=true, Type="Text", IsParameterQueryRequired=true]\r\n'
+    "\tlineageTag: 1\r\n"
+    "\r\n"
+    "expression Database =\r\n"
+    "\t\t\"sales_dev\" meta [IsParameterQuery=true, Type=\"Text\", IsParameterQueryRequired=true]\r\n"
+    "\tlineageTag: 2\r\n"
+    "\r\n"
+    "expression StartDate = #date(2024, 1, 1) meta [IsParameterQuery=true, Type=\"Date\", IsParameterQueryRequired=true]\r\n"
+    "\tlineageTag: 3\r\n"
+    "\r\n"
+    "expression Query =\r\n"
+    "\t\tlet\r\n"
+    "\t\t    Source = Sql.Database(Server, Database)\r\n"
+    "\t\tin\r\n"
+    "\t\t    Source\r\n"
+    "\tlineageTag: 4"
+)
+
+
+def expression(document, name):
+    return document.find("expression", name)
+
+
+def test_parse_round_trips_and_keeps_expressions_as_lines():
+    document = tmdl.parse_tmdl("\ufeff" + TABLE)
+    table = document.children("table")[0]
+
+    assert document.text() == "\ufeff" + TABLE
+    assert table.name == "Sales Data"
+    assert [child.kind for child in table.children()] == ["measure", "column", "partition", "annotation"]
+    assert table.find("partition", "Sales Data-1").expression == "m"
+
+
+def test_replace_children_swaps_partitions():
+    document = tmdl.parse_tmdl(TABLE)
+    table = document.children("table")[0]
+    published = tmdl.parse_tmdl(
+        "table 'Sales Data'\n\tpartition 'Sales Data-1' = m\n\t\tmode: directQuery\n\t\tsource = Published\n"
+    ).children("table")[0]
+
+    removed = table.replace_children("partition", published.children("partition"))
+
+    assert [node.name for node in removed] == ["Sales Data-1"]
+    assert "mode: directQuery" in document.text()
+    assert "mode: import" not in document.text()
+    assert document.text().endswith("\tannotation PBI_ResultType = Table\n")
+
+
+def test_make_ref_nodes_replace_role_references():
+    document = tmdl.parse_tmdl("model Model\n\tculture: en-US\n\nref role Reader\nref role Writer\n")
+
+    document.replace_children("ref", [tmdl.make_ref("role", tmdl.quote_name("Power Users"))], ref_type="role", separate=False)
+
+    assert document.text() == "model Model\n\tculture: en-US\nref role 'Power Users'\n"
+
+
+def test_set_single_line_parameter():
+    document = tmdl.parse_tmdl(EXPRESSIONS)
+
+    tmdl.set_parameter_value(expression(document, "Server"), 'prod "eu"')
+
+    assert document.text() == EXPRESSIONS.replace('"dev.example.com"', '"prod ""eu"""')
+
+
+def test_set_multi_line_parameter():
+    document = tmdl.parse_tmdl(EXPRESSIONS)
+
+    tmdl.set_parameter_value(expression(document, "Database"), "sales_prod")
+
+    assert document.text() == EXPRESSIONS.replace('"sales_dev"', '"sales_prod"')
+
+
+def test_non_text_parameters_are_refused():
+    document = tmdl.parse_tmdl(EXPRESSIONS)
+
+    with pytest.raises(ValueError):
+        tmdl.set_parameter_value(expression(document, "StartDate"), "2025-01-01")
+    with pytest.raises(ValueError):
+        tmdl.set_parameter_value(expression(document, "Query"), "x")
+
+    assert document.text() == EXPRESSIONS
+
+
+@pytest.mark.parametrize("source", [
+    '"dev"',
+    '"dev" meta [IsParameterQuery=true]',
+    '\n\t\t"a ""quoted"" value"\n\t\t\tmeta [IsParameterQuery=true]',
+])
+def test_set_m_string_value_keeps_everything_but_the_literal(source):
+    updated = tmdl.set_m_string_value(source, "new")
+
+    assert updated.replace('"new"', "") == source.replace(source[source.index('"'):source.rindex('"') + 1], "")
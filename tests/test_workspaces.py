@@ -0,0 +1,106 @@
+import pytest
+
+from msfabric_devops import FabricClient, config
+from msfabric_devops.cache import WorkspaceDirectory
+
+from .conftest import UNLIMITED
+from .test_lro import CountingTokens
+
+
+@pytest.fixture
+def cached_client(simulator):
+    client = simulator.attach(FabricClient(rate_limits=UNLIMITED))
+    yield client
+    client.close()
+
+
+def requests_to(simulator, method, path) -> int:
+    return sum(1 for logged_method, logged_path, _ in simulator.state.log if (logged_method, logged_path) == (method, path))
+
+
+def test_directory_indexes_by_name_and_copies():
+    directory = WorkspaceDirectory(ttl=60)
+    directory.set_workspaces([{"id": "1", "displayName": "Dev"}, {"id": "2", "displayName": "Prod"}])
+
+    directory.find_workspaces_by_name("Dev")[0]["displayName"] = "Changed"
+
+    assert directory.find_workspaces_by_name("Dev") == [{"id": "1", "displayName": "Dev"}]
+    assert directory.find_workspaces_by_name("dev") == []
+    assert directory.get_workspace("2") == {"id": "2", "displayName": "Prod"}
+
+
+def test_name_lookups_list_the_tenant_once(cached_client, simulator):
+    for name in ("Dev", "Test", "Prod"):
+        cached_client.create_workspace(name)
+
+    for _ in range(5):
+        assert [ws["displayName"] for ws in cached_client.get_workspaces_by_name("Test")] == ["Test"]
+
+    assert requests_to(simulator, "GET", "workspaces") == 1
+
+
+def test_create_and_delete_patch_the_directory(cached_client, simulator):
+    workspace = cached_client.create_workspace("Dev")
+
+    assert cached_client.create_workspace("Dev") is None
+    cached_client.delete_workspace(workspace["id"])
+    assert cached_client.get_workspaces_by_name("Dev") == []
+    assert cached_client.create_workspace("Dev")["displayName"] == "Dev"
+
+    assert requests_to(simulator, "GET", "workspaces") == 1
+
+
+def test_lookup_by_id_uses_the_directory_or_the_direct_endpoint(cached_client, simulator):
+    workspace = cached_client.create_workspace("Dev")
+
+    assert cached_client.get_workspace_by_id(workspace["id"]) == workspace
+    assert requests_to(simulator, "GET", f"workspaces/{workspace['id']}") == 0
+
+    cached_client.workspace_directory.invalidate()
+    assert cached_client.get_workspace_by_id(workspace["id"]) == workspace
+    assert cached_client.get_workspace_by_id("missing") == {}
+
+    assert requests_to(simulator, "GET", f"workspaces/{workspace['id']}") == 1
+    assert requests_to(simulator, "GET", "workspaces") == 1
+
+
+def test_create_workspaces_lists_once_and_creates_concurrently(cached_client, simulator, monkeypatch):
+    monkeypatch.setattr(config, "print_color", lambda *args, **kwargs: None)
+    existing = cached_client.create_workspace("Existing")
+    cached_client.workspace_directory.invalidate()
+    simulator.latency = 0.05
+    names = [f"New{i}" for i in range(6)]
+
+    results = cached_client.create_workspaces(names + ["Existing", "New0"], max_workers=3)
+
+    assert list(results) == names + ["Existing"]
+    assert results["Existing"] == {"status": "exists", "workspace": existing, "error": None}
+    assert {results[name]["status"] for name in names} == {"created"}
+    assert requests_to(simulator, "GET", "workspaces") == 2
+    assert requests_to(simulator, "POST", "workspaces") == 7
+    assert simulator.state.peak_in_flight == 3
+    # The new workspaces were added to the directory, no listing needed
+    assert cached_client.get_workspaces_by_name("New5") == [results["New5"]["workspace"]]
+    assert requests_to(simulator, "GET", "workspaces") == 2
+
+
+def test_delete_workspaces_reports_missing_ones(cached_client, simulator):
+    ids = [cached_client.create_workspace(f"Dev{i}")["id"] for i in range(4)]
+    cached_client.delete_workspace(ids[0])
+
+    results = cached_client.delete_workspaces(ids + ["00000000-0000-0000-0000-000000000000"], max_workers=2)
+
+    assert [result["status"] for result in results.values()] == ["not_found", "deleted", "deleted", "deleted", "not_found"]
+    assert cached_client.get_workspaces() == []
+    assert cached_client.delete_workspaces([]) == {}
+
+
+def test_bulk_workspace_calls_resolve_the_token_per_request(cached_client, simulator):
+    cached_client.token_manager = CountingTokens()
+
+    created = cached_client.create_workspaces([f"Dev{i}" for i in range(4)])
+    cached_client.delete_workspaces([result["workspace"]["id"] for result in created.values()])
+
+    tokens = [authorization for _, _, authorization in simulator.state.log]
+    assert len(tokens) == 9
+    assert len(set(tokens)) == len(tokens)